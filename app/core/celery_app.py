@@ -1,5 +1,8 @@
 # app/core/celery_app.py
+from datetime import timedelta
+
 from celery import Celery
+from kombu import Exchange, Queue
 from app.core.config import settings
 
 
@@ -9,6 +12,36 @@ celery = Celery(
     backend=settings.redis_url,
 )
 
+celery.conf.update(
+    task_queues=(
+        Queue("discover", Exchange("discover"), routing_key="discover"),
+        Queue("scrape", Exchange("scrape"), routing_key="scrape"),
+        Queue("analyze", Exchange("analyze"), routing_key="analyze"),
+    ),
+    task_default_queue="analyze",
+    task_routes={
+        "app.services.tasks.discover_job_stubs": {"queue": "discover"},
+        "app.services.tasks.scrape_job_pages": {"queue": "scrape"},
+        "app.services.tasks.scrape_job_details": {"queue": "scrape"},
+        "app.services.tasks.scrape_job_form_fields": {"queue": "scrape"},
+        "app.services.tasks.analyze_job_form_fields": {"queue": "analyze"},
+        "app.services.tasks.release_stale_claims": {"queue": "discover"},
+    },
+    # a task is only acked once its stage finished, so a crashed worker's task is redelivered; the redelivery
+    # claims fresh jobs, the crashed worker's jobs go back to their queue once release_stale_claims finds them
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # browser-bound workers must not hoard tasks; analyze workers raise this on the command line
+    worker_prefetch_multiplier=1,
+    beat_schedule={
+        "release-stale-claims": {
+            "task": "app.services.tasks.release_stale_claims",
+            "schedule": timedelta(minutes=settings.claim_reaper_interval_minutes),
+        },
+    },
+)
+
 celery.autodiscover_tasks([
     "app.core",
+    "app.services",
 ])
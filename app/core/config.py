@@ -2,6 +2,8 @@
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict, PostgresDsn, AnyUrl
 
+from app.core.enums import ParseBackend, LLMCacheBackend
+
 
 class Settings(BaseSettings):
     postgres_user: str
@@ -9,6 +11,12 @@ class Settings(BaseSettings):
     postgres_host: str
     postgres_port: int
     postgres_db: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pgbouncer: bool = False
 
     djinni_base_url: str
 
@@ -16,13 +24,51 @@ class Settings(BaseSettings):
     gemini_model: str
     gemini_max_tokens: int
     gemini_max_retries: int
+    gemini_max_concurrency: int = 8
+    gemini_requests_per_minute: int = 60
+    gemini_tokens_per_minute: int = 1_000_000
+    gemini_shared_rate_limit: bool = True
+    gemini_context_cache: bool = True
+    gemini_context_cache_ttl_minutes: int = 60
+    gemini_context_cache_min_tokens: int = 1024
+    gemini_stream_responses: bool = False
+
+    llm_cache_backend: LLMCacheBackend = LLMCacheBackend.SQLITE
+    llm_cache_path: str = ".cache/llm_cache.sqlite3"
+    llm_cache_ttl_hours: int = 168
+    llm_cache_max_entries: int = 10000
+    llm_cache_busy_timeout_seconds: float = 5.0
+
+    answer_index_min_support: int = 2
+    answer_index_min_confidence: float = 0.8
+    answer_index_max_answer_length: int = 120
+
+    analysis_batch_size: int = 5
+    analysis_batch_max_input_tokens: int = 32_000
+    analysis_batch_max_output_tokens: int = 32_768
+    relevance_min_score: float = 0.05
+    relevance_idf_refresh_minutes: int = 60
+
+    cv_path: str = "cv.txt"
     
     redis_url: str
+    seen_cache_warm_ttl_hours: int = 24
+    task_batch_size: int = 10
+    claim_timeout_minutes: int = 30
+    claim_reaper_interval_minutes: int = 5
+    task_db_max_retries: int = 5
+    scrape_worker_concurrency: int = 2
+    analyze_worker_concurrency: int = 8
 
     chrome_binary: str
     profile_dir: str
     profile_name: str
     driver_path: str
+    driver_pool_size: int = 2
+    driver_max_page_loads: int = 200
+    scrape_parse_backend: ParseBackend = ParseBackend.WEBDRIVER
+    page_archive_max_age_hours: int = 24
+    crawl_stop_after_known_pages: int = 2
 
     pgadmin_default_email: str
     pgadmin_default_password: str
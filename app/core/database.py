@@ -1,9 +1,43 @@
 # app/core/database.py
 from app.core.config import settings
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def create_db_engine(url: str = settings.database_url, pgbouncer: bool = settings.db_pgbouncer) -> Engine:
+    if pgbouncer:
+        # pgbouncer already pools server connections; a second pool here would pin them per process
+        return create_engine(url, poolclass=NullPool)
+
+    # every process holds at most pool_size + max_overflow connections
+    return create_engine(
+        url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+
+engine = create_db_engine()
+# DAOs hand out detached objects; keeping their state after commit spares a reload per object
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
+
+
+def reset_engine_pool() -> None:
+    # a forked child must not touch sockets opened by its parent: drop them without closing,
+    # the engine then lazily builds a fresh pool owned by this process
+    engine.dispose(close=False)
+
+
+def dialect_insert(db, model):
+    # INSERT construct with ON CONFLICT support for the dialect the session is bound to
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return postgresql_insert(model)
@@ -7,31 +7,51 @@ from app.core.enums import APIError, APIStatus
 from app.schemas.job import JobResponse
 
 
-def db_safe(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        db_instance = None 
-
-        try:
-            with self.session() as db:
-                db_instance = db
-                return func(self, db_instance, *args, **kwargs)
-
-        except IntegrityError as e:
-            if db_instance:
-                db_instance.rollback()
-            self.logger.error(f"[IntegrityError] {func.__name__}: {e}")
-            return JobResponse(status=APIStatus.ERROR, error=APIError.INTEGRITY)
-
-        except SQLAlchemyError as e:
-            if db_instance:
-                db_instance.rollback()
-            self.logger.error(f"[DatabaseError] {func.__name__}: {e}")
-            return JobResponse(status=APIStatus.ERROR, error=APIError.DB)
-
-        except Exception as e:
-            if db_instance:
-                db_instance.rollback()
-            self.logger.exception(f"[UnexpectedError] {func.__name__}: {e}")
-            return JobResponse(status=APIStatus.ERROR, error=APIError.UNEXPECTED)
-    return wrapper
+class DAOError(Exception):
+    def __init__(self, error: APIError, message: str):
+        super().__init__(message)
+        self.error = error
+
+
+def db_safe(func=None, *, many: bool = False):
+    # single-row methods report errors as an ERROR response; collection methods (many=True) raise
+    # DAOError instead, an empty result would look exactly like "nothing to do"
+    def error_result(name: str, error: APIError, e: Exception):
+        if many:
+            raise DAOError(error, f"{name}: {e}") from e
+        return JobResponse(status=APIStatus.ERROR, error=error)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if getattr(self, "active_session", None) is not None:
+                # inside a unit of work the owner handles errors and rolls back the whole transaction
+                return func(self, self.active_session, *args, **kwargs)
+
+            db_instance = None 
+
+            try:
+                with self.session() as db:
+                    db_instance = db
+                    return func(self, db_instance, *args, **kwargs)
+
+            except IntegrityError as e:
+                if db_instance:
+                    db_instance.rollback()
+                self.logger.error(f"[IntegrityError] {func.__name__}: {e}")
+                return error_result(func.__name__, APIError.INTEGRITY, e)
+
+            except SQLAlchemyError as e:
+                if db_instance:
+                    db_instance.rollback()
+                self.logger.error(f"[DatabaseError] {func.__name__}: {e}")
+                return error_result(func.__name__, APIError.DB, e)
+
+            except Exception as e:
+                if db_instance:
+                    db_instance.rollback()
+                self.logger.exception(f"[UnexpectedError] {func.__name__}: {e}")
+                return error_result(func.__name__, APIError.UNEXPECTED, e)
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
@@ -44,6 +44,10 @@ class APIStatus(StrEnum):
     JOB_DETAILS_UPDATED = "job_details_updated"
     JOB_STATUS_UPDATED = "job_status_updated"
     JOB_FORM_FIELDS_CREATED = "job_form_field_created"
+    JOB_FORM_FIELDS_UNCHANGED = "job_form_fields_unchanged"
+    JOB_PAGE_SAVED = "job_page_saved"
+    PAGE_ARCHIVED = "page_archived"
+    JOB_FORM_ANSWERS_SAVED = "job_form_answers_saved"
     CLAIMED = "claimed"
 
 
@@ -55,6 +59,12 @@ class APIError(StrEnum):
 
 class ScrapeError(StrEnum):
     TIMEOUT = "timeout_waiting_for_selectors"
+    MISSING_ELEMENT = "missing_element_in_page_source"
+
+
+class ParseBackend(StrEnum):
+    WEBDRIVER = "webdriver"
+    HTML = "html"
 
 
 class FormFieldType(StrEnum):
@@ -64,6 +74,17 @@ class FormFieldType(StrEnum):
     NUMBER = "number"
 
 
+class AnswerSource(StrEnum):
+    MODEL = "model"
+    INDEX = "index"
+
+
 class JobSource(StrEnum):
     DJINNI = "djinni"
     LINKED_IN = "linked_in"
+
+
+class LLMCacheBackend(StrEnum):
+    NONE = "none"
+    SQLITE = "sqlite"
+    REDIS = "redis"
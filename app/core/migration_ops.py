@@ -0,0 +1,29 @@
+# app/core/migration_ops.py
+from typing import List
+
+from alembic import op
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def create_index_concurrently(index_name: str, table_name: str, columns: List[str], **kwargs) -> None:
+    # CONCURRENTLY cannot run inside a transaction, and it keeps the table writable while the index builds
+    if not _is_postgresql():
+        op.create_index(index_name, table_name, columns, **kwargs)
+        return
+
+    with op.get_context().autocommit_block():
+        # an interrupted concurrent build leaves an INVALID index behind under the same name
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+        op.create_index(index_name, table_name, columns, postgresql_concurrently=True, **kwargs)
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    if not _is_postgresql():
+        op.drop_index(index_name, table_name=table_name)
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,121 @@
+# app/core/rate_limit.py
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# refill and reserve in one round trip, on the redis clock so workers on different hosts agree
+RESERVE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_second = tonumber(ARGV[2])
+local amount = math.min(tonumber(ARGV[3]), capacity)
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_per_second) - amount
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_per_second) + 60)
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / refill_per_second)
+"""
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        # the fallback of a shared bucket is reserved from worker threads
+        self._lock = threading.Lock()
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+
+    def reserve(self, amount: float) -> float:
+        # takes the tokens right away, possibly going into debt, and returns how long the caller must wait
+        with self._lock:
+            self._refill()
+            self.tokens -= min(amount, self.capacity)
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_per_second
+
+
+# one bucket for every worker process; falls back to the process-local share while redis is unreachable
+class RedisTokenBucket:
+    def __init__(self, client: redis.Redis, key: str, capacity: float, refill_per_second: float,
+                 fallback: TokenBucket):
+        self.key = key
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.fallback = fallback
+        self._reserve = client.register_script(RESERVE_SCRIPT)
+
+
+    def reserve(self, amount: float) -> float:
+        try:
+            return float(self._reserve(keys=[self.key], args=[self.capacity, self.refill_per_second, amount]))
+        except RedisError as e:
+            logger.warning(f"[RedisError] rate limit {self.key}: {e}; using the local bucket.")
+            return self.fallback.reserve(amount)
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int,
+                 client: Optional[redis.Redis] = None,
+                 prefix: str = "jobai:ratelimit",
+                 local_share: int = 1):
+        # without a shared bucket every process may only use its share of the quota
+        self.requests = TokenBucket(requests_per_minute / local_share, requests_per_minute / local_share / 60)
+        self.tokens = TokenBucket(tokens_per_minute / local_share, tokens_per_minute / local_share / 60)
+        self.shared = client is not None
+        if client is not None:
+            self.requests = RedisTokenBucket(
+                client, f"{prefix}:requests", requests_per_minute, requests_per_minute / 60, self.requests
+            )
+            self.tokens = RedisTokenBucket(
+                client, f"{prefix}:tokens", tokens_per_minute, tokens_per_minute / 60, self.tokens
+            )
+
+
+    def _reserve(self, tokens: int) -> float:
+        return max(self.requests.reserve(1), self.tokens.reserve(tokens))
+
+
+    async def acquire(self, tokens: int) -> None:
+        if self.shared:
+            # the redis round trips run in a thread, other requests keep streaming meanwhile
+            delay = await asyncio.to_thread(self._reserve, tokens)
+        else:
+            # no awaits between the two reservations, so this is atomic within the event loop
+            delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def build_rate_limiter(shared: bool = settings.gemini_shared_rate_limit) -> RateLimiter:
+    # every prefork child of the analyze worker runs its own client, the quota covers all of them
+    return RateLimiter(
+        settings.gemini_requests_per_minute,
+        settings.gemini_tokens_per_minute,
+        client=redis.Redis.from_url(settings.redis_url) if shared else None,
+        local_share=settings.analyze_worker_concurrency,
+    )
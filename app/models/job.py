@@ -1,18 +1,20 @@
 # app/models/job.py
 from sqlalchemy import (
-    Column, Integer, String, Text, ForeignKey, Date, DateTime,
-    UniqueConstraint, JSON
+    Column, Integer, String, Text, ForeignKey, Date, DateTime, Float,
+    UniqueConstraint, JSON, Index
 )
 from sqlalchemy.orm import relationship
 import sqlalchemy as sa
 from app.core.database import Base
-from app.core.enums import JobStatus, JobSource, FormFieldType
+from app.core.enums import JobStatus, JobSource, FormFieldType, AnswerSource
 from app.core.types import StringEnum
 
 class JobStub(Base):
     __tablename__ = "job_stubs"
     __table_args__ = (
         UniqueConstraint("source", "external_id", name="uq_job_source_external"),
+        # claims filter on status and take the oldest jobs first
+        Index("ix_job_stubs_status_found_at", "status", "found_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -20,6 +22,8 @@ class JobStub(Base):
     external_id = Column(Integer, nullable=False, index=True)
     status = Column(StringEnum(JobStatus, default=JobStatus.SAVED_ID, nullable=False))
     found_at = Column(DateTime, nullable=False)
+    # set when a worker moves the job into an in-progress status, so abandoned claims can be released
+    claimed_at = Column(DateTime, nullable=True)
 
     details = relationship("JobDetails", back_populates="stub", uselist=False, cascade="all, delete")
     fields = relationship("JobFormField", back_populates="job", cascade="all, delete")
@@ -34,6 +38,7 @@ class JobDetails(Base):
     description = Column(Text)
     link = Column(String, unique=True)
     scraped_at = Column(DateTime, nullable=True)
+    relevance_score = Column(Float, nullable=True)
 
     stub = relationship("JobStub", back_populates="details")
 
@@ -49,6 +54,8 @@ class JobFormField(Base):
     answer_type = Column(StringEnum(FormFieldType, default=FormFieldType.TEXT, nullable=False))
     answer_options = Column(sa.JSON, nullable=True)
     answer = Column(Text, nullable=True) 
+    # answers copied from the answer index must not count as support for themselves
+    answer_source = Column(StringEnum(AnswerSource), nullable=True)
 
     scraped_at = Column(DateTime, nullable=True)
     sent_at = Column(DateTime, nullable=True)
@@ -0,0 +1,35 @@
+# app/models/page.py
+from sqlalchemy import (
+    Column, Integer, String, ForeignKey, DateTime, LargeBinary, Index
+)
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+from app.core.enums import JobSource
+from app.core.types import StringEnum
+
+
+class PageBlob(Base):
+    __tablename__ = "page_blobs"
+
+    content_hash = Column(String(64), primary_key=True)
+    encoding = Column(String, nullable=False, default="gzip")
+    data = Column(LargeBinary, nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    fetches = relationship("PageFetch", back_populates="blob")
+
+
+class PageFetch(Base):
+    __tablename__ = "page_fetches"
+    __table_args__ = (
+        Index("ix_page_fetches_lookup", "source", "external_id", "fetched_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(StringEnum(JobSource, default=JobSource.DJINNI, nullable=False))
+    external_id = Column(Integer, nullable=False)
+    fetched_at = Column(DateTime, nullable=False)
+    content_hash = Column(String(64), ForeignKey("page_blobs.content_hash"), nullable=False)
+
+    blob = relationship("PageBlob", back_populates="fetches")
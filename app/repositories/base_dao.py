@@ -0,0 +1,43 @@
+# app/repositories/base_dao.py
+import copy
+from contextlib import contextmanager
+from typing import Iterator, TypeVar
+
+from sqlalchemy.orm import Session
+
+
+DAOType = TypeVar("DAOType", bound="BaseDAO")
+
+
+class BaseDAO:
+    # set on copies handed out by unit_of_work/with_session, every call then runs on that session
+    active_session: Session | None = None
+
+
+    def with_session(self: DAOType, db: Session) -> DAOType:
+        dao = copy.copy(self)
+        dao.active_session = db
+        return dao
+
+
+    def _commit(self, db: Session) -> None:
+        # inside a unit of work the owner commits once at the end; a flush still assigns ids
+        if self.active_session is None:
+            db.commit()
+        else:
+            db.flush()
+
+
+    @contextmanager
+    def unit_of_work(self: DAOType) -> Iterator[DAOType]:
+        if self.active_session is not None:
+            yield self
+            return
+
+        with self.session() as db:
+            try:
+                yield self.with_session(db)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
@@ -1,15 +1,26 @@
 # app/repositories/job_dao.py
+import json
 from datetime import datetime, timezone
-from typing import List
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from sqlalchemy import select, update, delete, insert, tuple_, or_
 
 from app.models.job import JobStub, JobDetails, JobFormField
+from app.core.database import dialect_insert
 from app.core.decorators import db_safe
 from app.core.logger import setup_logger
-from app.core.enums import JobStatus, APIStatus
+from app.repositories.base_dao import BaseDAO
+from app.core.enums import JobStatus, APIStatus, JobSource, AnswerSource
 from app.schemas.job import JobResponse, JobStubCreate, JobDetailsCreate, JobFormFieldCreate 
 
 
-class JobDAO:
+def _field_fingerprint(external_field_id: str, question: str, answer_type: Any, answer_options: Any) -> Tuple:
+    options = json.dumps(answer_options, sort_keys=True) if answer_options is not None else None
+    return external_field_id, question, str(answer_type), options
+
+
+class JobDAO(BaseDAO):
     def __init__(self, session):
         self.session = session
         self.logger = setup_logger(__name__)
@@ -19,6 +30,38 @@ class JobDAO:
         return db.query(JobStub).filter_by(external_id=external_id).first()
 
 
+    def _apply_job_details(self, db, job: JobStub, job_details: JobDetailsCreate) -> JobDetails:
+        if job.details:
+            details = job.details
+        else:
+            details = JobDetails(id=job.id)
+            db.add(details)
+
+        details.title = job_details.title
+        details.company = job_details.company
+        details.description = job_details.description
+        details.link = job_details.link
+        details.scraped_at = datetime.now(timezone.utc)
+        # a rescraped description has to be scored again
+        details.relevance_score = None
+        return details
+
+
+    def _replace_job_form_fields(self, db, job: JobStub, fields_data: List[JobFormFieldCreate]) -> None:
+        db.query(JobFormField).filter(JobFormField.job_id == job.id).delete()
+
+        scraped_time = datetime.now(timezone.utc)
+
+        new_fields = [
+            JobFormField(
+                job_id=job.id,
+                **field_data.model_dump(),
+                scraped_at=scraped_time
+            ) for field_data in fields_data
+        ]
+        db.add_all(new_fields)
+
+
     @db_safe
     def save_job_stub(self, db, job_data: JobStubCreate) -> JobResponse:
         existing = self._get_stub_by_external_id(db, job_data.external_id)
@@ -37,14 +80,72 @@ class JobDAO:
             source=job_data.source
         )
         db.add(stub)
-        db.commit()
-        db.refresh(stub)
-        self.logger.info(f"[Saved] Job {stub.external_id} inserted successfully.")
-        return JobResponse(
+        db.flush()
+        # built before the commit, which would otherwise expire the stub and reload it
+        response = JobResponse(
             status=APIStatus.JOB_STUB_CREATED,
             external_id=stub.external_id,
             id=stub.id
         )
+        self._commit(db)
+        self.logger.info(f"[Saved] Job {response.external_id} inserted successfully.")
+        return response
+
+
+    @db_safe(many=True)
+    def save_job_stubs_bulk(self, db, jobs_data: Iterable[JobStubCreate], chunk_size: int = 500) -> List[JobResponse]:
+        jobs_iter = iter(jobs_data)
+        results = []
+
+        while chunk := list(islice(jobs_iter, chunk_size)):
+            keys = list(dict.fromkeys((job.source, job.external_id) for job in chunk))
+            found_at = datetime.now(timezone.utc)
+
+            stmt = (
+                dialect_insert(db, JobStub)
+                .values([
+                    {
+                        "source": source,
+                        "external_id": external_id,
+                        "status": JobStatus.SAVED_ID,
+                        "found_at": found_at,
+                    } for source, external_id in keys
+                ])
+                .on_conflict_do_nothing(index_elements=["source", "external_id"])
+                .returning(JobStub.id, JobStub.source, JobStub.external_id)
+            )
+            created = {(row.source, row.external_id): row.id for row in db.execute(stmt)}
+
+            duplicates = [key for key in keys if key not in created]
+            existing = {}
+            if duplicates:
+                rows = db.execute(
+                    select(JobStub.id, JobStub.source, JobStub.external_id)
+                    .where(tuple_(JobStub.source, JobStub.external_id).in_(duplicates))
+                )
+                existing = {(row.source, row.external_id): row.id for row in rows}
+
+            for key in keys:
+                _, external_id = key
+                if key in created:
+                    results.append(JobResponse(
+                        status=APIStatus.JOB_STUB_CREATED,
+                        external_id=external_id,
+                        id=created[key]
+                    ))
+                else:
+                    results.append(JobResponse(
+                        status=APIStatus.DUPLICATE,
+                        external_id=external_id,
+                        id=existing.get(key)
+                    ))
+
+            self._commit(db)
+            self.logger.info(
+                f"[Saved] {len(created)} job stubs inserted, {len(duplicates)} duplicates skipped."
+            )
+
+        return results
 
 
     @db_safe
@@ -58,30 +159,44 @@ class JobDAO:
                 id=None
             )
 
-        if job.details:
-            details = job.details
-        else:
-            details = JobDetails(id=job.id)
-            db.add(details)
+        self._apply_job_details(db, job, job_details)
+        job.status = JobStatus.SCRAPED_DETAILS
+        response = JobResponse(
+            status=APIStatus.JOB_DETAILS_UPDATED,
+            external_id=job.external_id,
+            id=job.id
+        )
 
-        details.title = job_details.title
-        details.company = job_details.company
-        details.description = job_details.description
-        details.link = job_details.link
-        details.scraped_at = datetime.now(timezone.utc)
+        self._commit(db)
 
-        job.status = JobStatus.SCRAPED_DETAILS
+        self.logger.info(f"[Saved] Job {response.external_id} details updated successfully.")
+        return response
 
-        db.commit()
-        db.refresh(details)
 
-        self.logger.info(f"[Saved] Job {job.external_id} details updated successfully.")
-        return JobResponse(
+    @db_safe
+    def update_job_details(self, db, job_details: JobDetailsCreate) -> JobResponse:
+        # refreshes the listing text only; status, form fields and their answers stay as they are
+        job = self._get_stub_by_external_id(db, job_details.external_id)
+        if not job:
+            self.logger.warning(f"[Do not exist] Job {job_details.external_id} does not exist")
+            return JobResponse(
+                status=APIStatus.NOT_FOUND,
+                external_id=job_details.external_id,
+                id=None
+            )
+
+        self._apply_job_details(db, job, job_details)
+        response = JobResponse(
             status=APIStatus.JOB_DETAILS_UPDATED,
             external_id=job.external_id,
             id=job.id
         )
 
+        self._commit(db)
+
+        self.logger.info(f"[Saved] Job {response.external_id} details refreshed, status kept at '{job.status.value}'.")
+        return response
+
 
     @db_safe
     def save_job_form_fields(self, db, external_id: int, fields_data: List[JobFormFieldCreate]) -> JobResponse:
@@ -94,34 +209,154 @@ class JobDAO:
                 id=None
             )
 
-        db.query(JobFormField).filter(JobFormField.job_id == job.id).delete()
+        self._replace_job_form_fields(db, job, fields_data)
+        job.status = JobStatus.FORM_FIELDS_SCRAPED
+        response = JobResponse(
+            status=APIStatus.JOB_FORM_FIELDS_CREATED,
+            external_id=job.external_id,
+            id=job.id
+        )
+
+        self._commit(db)
+
+        self.logger.info(f"[Created] {len(fields_data)} form fields for job {response.external_id} created.")
+        return response
+
+
+    @db_safe(many=True)
+    def save_job_form_fields_bulk(self, db, fields_by_external_id: Mapping[int, List[JobFormFieldCreate]],
+                                  chunk_size: int = 1000) -> List[JobResponse]:
+        if not fields_by_external_id:
+            return []
+
+        jobs = {
+            row.external_id: row.id for row in db.execute(
+                select(JobStub.id, JobStub.external_id)
+                .where(JobStub.external_id.in_(list(fields_by_external_id)))
+            )
+        }
+
+        existing: Dict[int, set] = {job_id: set() for job_id in jobs.values()}
+        for row in db.execute(
+            select(JobFormField.job_id, JobFormField.external_field_id, JobFormField.question,
+                   JobFormField.answer_type, JobFormField.answer_options)
+            .where(JobFormField.job_id.in_(list(jobs.values())))
+        ):
+            existing[row.job_id].add(_field_fingerprint(
+                row.external_field_id, row.question, row.answer_type, row.answer_options
+            ))
 
+        # jobs whose scraped field set is identical keep their rows, and with them any answers already given
         scraped_time = datetime.now(timezone.utc)
+        changed_job_ids, new_rows, results = [], [], []
+        for external_id, fields_data in fields_by_external_id.items():
+            job_id = jobs.get(external_id)
+            if job_id is None:
+                self.logger.warning(f"[Do not exist] Job {external_id} does not exist")
+                results.append(JobResponse(status=APIStatus.NOT_FOUND, external_id=external_id, id=None))
+                continue
 
-        new_fields = [
-            JobFormField(
-                job_id=job.id,
-                **field_data.model_dump(),
-                scraped_at=scraped_time
-            ) for field_data in fields_data
-        ]
-        db.add_all(new_fields)
-            
+            rows = [{"job_id": job_id, **field_data.model_dump(), "scraped_at": scraped_time}
+                    for field_data in fields_data]
+            fingerprints = {
+                _field_fingerprint(row["external_field_id"], row["question"], row["answer_type"], row["answer_options"])
+                for row in rows
+            }
+            if fingerprints == existing[job_id] and len(rows) == len(fingerprints):
+                results.append(JobResponse(status=APIStatus.JOB_FORM_FIELDS_UNCHANGED, external_id=external_id, id=job_id))
+                continue
+
+            changed_job_ids.append(job_id)
+            new_rows.extend(rows)
+            results.append(JobResponse(status=APIStatus.JOB_FORM_FIELDS_CREATED, external_id=external_id, id=job_id))
+
+        if changed_job_ids:
+            db.execute(delete(JobFormField).where(JobFormField.job_id.in_(changed_job_ids)))
+        for start in range(0, len(new_rows), chunk_size):
+            # one multi-row INSERT per chunk instead of an ORM flush per field
+            db.execute(insert(JobFormField).values(new_rows[start:start + chunk_size]))
+        if jobs:
+            db.execute(
+                update(JobStub)
+                .where(JobStub.id.in_(list(jobs.values())))
+                .values(status=JobStatus.FORM_FIELDS_SCRAPED)
+            )
+        self._commit(db)
+
+        self.logger.info(
+            f"[Created] {len(new_rows)} form fields for {len(changed_job_ids)} jobs written, "
+            f"{len(jobs) - len(changed_job_ids)} jobs unchanged."
+        )
+        return results
+
+
+    @db_safe
+    def save_job_page(self, db, job_details: JobDetailsCreate, fields_data: List[JobFormFieldCreate]) -> JobResponse:
+        job = self._get_stub_by_external_id(db, job_details.external_id)
+        if not job:
+            self.logger.warning(f"[Do not exist] Job {job_details.external_id} does not exist")
+            return JobResponse(
+                status=APIStatus.NOT_FOUND,
+                external_id=job_details.external_id,
+                id=None
+            )
+
+        self._apply_job_details(db, job, job_details)
+        self._replace_job_form_fields(db, job, fields_data)
         job.status = JobStatus.FORM_FIELDS_SCRAPED
-        
-        db.commit()
+        response = JobResponse(
+            status=APIStatus.JOB_PAGE_SAVED,
+            external_id=job.external_id,
+            id=job.id
+        )
 
-        self.logger.info(f"[Created] {len(fields_data)} form fields for job {job.external_id} created.")
-        return JobResponse(
-            status=APIStatus.JOB_FORM_FIELDS_CREATED,
+        self._commit(db)
+
+        self.logger.info(f"[Saved] Job {response.external_id} details and {len(fields_data)} form fields saved.")
+        return response
+
+
+    @db_safe
+    def save_form_answers(self, db, job_id: int, answers_by_field_id: Dict[str, str],
+                          reused_field_ids: Iterable[str] = ()) -> JobResponse:
+        job = db.query(JobStub).filter_by(id=job_id).one_or_none()
+        if not job:
+            self.logger.warning(f"[Do not exist] Job with id {job_id} does not exist")
+            return JobResponse(
+                status=APIStatus.NOT_FOUND,
+                external_id=None,
+                id=job_id
+            )
+
+        reused_field_ids = set(reused_field_ids)
+        for field in job.fields:
+            if field.external_field_id in answers_by_field_id:
+                field.answer = answers_by_field_id[field.external_field_id]
+                field.answer_source = (
+                    AnswerSource.INDEX if field.external_field_id in reused_field_ids else AnswerSource.MODEL
+                )
+
+        job.status = JobStatus.ANALYZED_FORM_FIELDS
+        response = JobResponse(
+            status=APIStatus.JOB_FORM_ANSWERS_SAVED,
             external_id=job.external_id,
             id=job.id
         )
+        self._commit(db)
+
+        self.logger.info(f"[Saved] {len(answers_by_field_id)} answers for job {response.external_id} saved.")
+        return response
 
 
     @db_safe
     def claim_job_for_processing(self, db, current_status: JobStatus, new_status: JobStatus) -> JobResponse:
-        job = db.query(JobStub).filter_by(status=current_status).with_for_update(skip_locked=True).first()
+        job = (
+            db.query(JobStub)
+            .filter_by(status=current_status)
+            .order_by(JobStub.found_at, JobStub.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
         if not job:
             self.logger.warning(f"[Not Found] No available jobs with status '{current_status.value}'")
             return JobResponse(
@@ -131,15 +366,77 @@ class JobDAO:
             )
 
         job.status = new_status
-        db.commit()
-        db.refresh(job)
-
-        self.logger.info(f"[Claimed] Job {job.external_id} status set to '{new_status.value}'")
-        return JobResponse(
+        job.claimed_at = datetime.now(timezone.utc)
+        response = JobResponse(
             status=APIStatus.CLAIMED,
             external_id=job.external_id,
             id=job.id
         )
+        self._commit(db)
+
+        self.logger.info(f"[Claimed] Job {response.external_id} status set to '{new_status.value}'")
+        return response
+
+
+    @db_safe(many=True)
+    def claim_jobs_for_processing(self, db, current_status: JobStatus, new_status: JobStatus, limit: int = 10) -> List[JobResponse]:
+        claimable_ids = (
+            select(JobStub.id)
+            .where(JobStub.status == current_status)
+            .order_by(JobStub.found_at, JobStub.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(JobStub)
+            .where(JobStub.id.in_(claimable_ids))
+            .values(status=new_status, claimed_at=datetime.now(timezone.utc))
+            .returning(JobStub.id, JobStub.external_id)
+        )
+        claimed = db.execute(stmt).all()
+        self._commit(db)
+
+        if not claimed:
+            self.logger.warning(f"[Not Found] No available jobs with status '{current_status.value}'")
+            return []
+
+        self.logger.info(f"[Claimed] {len(claimed)} jobs status set to '{new_status.value}'")
+        return [
+            JobResponse(
+                status=APIStatus.CLAIMED,
+                external_id=row.external_id,
+                id=row.id
+            ) for row in claimed
+        ]
+
+
+    @db_safe(many=True)
+    def release_stale_claims(self, db, claimed_status: JobStatus, previous_status: JobStatus,
+                             claimed_before: datetime) -> List[JobResponse]:
+        # claims made before claimed_at existed have no timestamp and are treated as stale
+        released = db.execute(
+            update(JobStub)
+            .where(
+                JobStub.status == claimed_status,
+                or_(JobStub.claimed_at < claimed_before, JobStub.claimed_at.is_(None)),
+            )
+            .values(status=previous_status, claimed_at=None)
+            .returning(JobStub.id, JobStub.external_id)
+        ).all()
+        self._commit(db)
+
+        if released:
+            self.logger.warning(
+                f"[Released] {len(released)} stale '{claimed_status.value}' claims reset to '{previous_status.value}'"
+            )
+        return [
+            JobResponse(
+                status=APIStatus.JOB_STATUS_UPDATED,
+                external_id=row.external_id,
+                id=row.id
+            ) for row in released
+        ]
 
 
     @db_safe
@@ -154,13 +451,14 @@ class JobDAO:
             )
         
         job.status = new_status
-        db.commit()
-        self.logger.info(f"[Status Updated] Job {external_id} status set to '{new_status.value}'")
-        return JobResponse(
+        response = JobResponse(
             status=APIStatus.JOB_STATUS_UPDATED,
             external_id=external_id,
             id=job.id
         )
+        self._commit(db)
+        self.logger.info(f"[Status Updated] Job {external_id} status set to '{new_status.value}'")
+        return response
 
 
     @db_safe
@@ -168,6 +466,83 @@ class JobDAO:
         return db.query(JobDetails).filter_by(id=job_id).one_or_none()
 
     
-    @db_safe
+    @db_safe(many=True)
     def get_job_form_fields(self, db, job_id: int) -> List[JobFormField]:
         return db.query(JobFormField).filter_by(job_id=job_id).all()
+
+
+    @db_safe(many=True)
+    def get_unscored_job_details(self, db, statuses: Sequence[JobStatus]) -> List[JobDetails]:
+        return list(db.scalars(
+            select(JobDetails)
+            .join(JobStub, JobStub.id == JobDetails.id)
+            .where(JobStub.status.in_(statuses), JobDetails.relevance_score.is_(None))
+        ))
+
+
+    @db_safe(many=True)
+    def get_job_texts(self, db) -> List[Tuple[str, str]]:
+        return [(row.title, row.description) for row in db.execute(select(JobDetails.title, JobDetails.description))]
+
+
+    @db_safe(many=True)
+    def save_relevance_scores(self, db, scores_by_job_id: Dict[int, float], reject_below: float,
+                              statuses: Sequence[JobStatus]) -> List[JobResponse]:
+        if not scores_by_job_id:
+            return []
+
+        db.execute(
+            update(JobDetails),
+            [{"id": job_id, "relevance_score": score} for job_id, score in scores_by_job_id.items()],
+        )
+
+        rejected = []
+        low_scorers = [job_id for job_id, score in scores_by_job_id.items() if score < reject_below]
+        if low_scorers:
+            # jobs a worker claimed in the meantime keep their new status
+            rejected = db.execute(
+                update(JobStub)
+                .where(JobStub.id.in_(low_scorers), JobStub.status.in_(statuses))
+                .values(status=JobStatus.REJECTED)
+                .returning(JobStub.id, JobStub.external_id)
+            ).all()
+        self._commit(db)
+
+        self.logger.info(f"[Scored] {len(scores_by_job_id)} jobs scored, {len(rejected)} rejected.")
+        return [
+            JobResponse(
+                status=APIStatus.JOB_STATUS_UPDATED,
+                external_id=row.external_id,
+                id=row.id
+            ) for row in rejected
+        ]
+
+
+    @db_safe(many=True)
+    def get_answered_form_fields(self, db) -> List[JobFormField]:
+        # rows answered before answer_source existed have no source and count as model answers
+        return db.query(JobFormField).filter(
+            JobFormField.answer.isnot(None),
+            or_(JobFormField.answer_source.is_(None), JobFormField.answer_source != AnswerSource.INDEX),
+        ).all()
+
+
+    @db_safe(many=True)
+    def get_job_statuses(self, db, source: JobSource = JobSource.DJINNI) -> Dict[int, JobStatus]:
+        return dict(db.execute(select(JobStub.external_id, JobStub.status).where(JobStub.source == source)).all())
+
+
+    @db_safe(many=True)
+    def get_external_ids(self, db, source: JobSource = JobSource.DJINNI) -> List[int]:
+        return list(db.scalars(select(JobStub.external_id).where(JobStub.source == source)))
+
+
+    @db_safe(many=True)
+    def filter_unseen_external_ids(self, db, external_ids: List[int], source: JobSource = JobSource.DJINNI) -> List[int]:
+        if not external_ids:
+            return []
+        known = set(db.scalars(
+            select(JobStub.external_id)
+            .where(JobStub.source == source, JobStub.external_id.in_(external_ids))
+        ))
+        return [external_id for external_id in external_ids if external_id not in known]
@@ -0,0 +1,113 @@
+# app/repositories/page_archive_dao.py
+import gzip
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select, func, and_
+
+from app.models.page import PageBlob, PageFetch
+from app.core.database import dialect_insert
+from app.core.decorators import db_safe
+from app.core.logger import setup_logger
+from app.repositories.base_dao import BaseDAO
+from app.core.enums import APIStatus, JobSource
+from app.schemas.job import JobResponse
+
+
+ARCHIVE_ENCODING = "gzip"
+
+DECOMPRESSORS = {
+    "gzip": gzip.decompress,
+}
+
+
+class PageArchiveDAO(BaseDAO):
+    def __init__(self, session):
+        self.session = session
+        self.logger = setup_logger(__name__)
+
+
+    def _decompress(self, encoding: str, data: bytes) -> str:
+        return DECOMPRESSORS[encoding](data).decode("utf-8")
+
+
+    @db_safe
+    def save_page(self, db, external_id: int, page_source: str, source: JobSource = JobSource.DJINNI) -> JobResponse:
+        raw = page_source.encode("utf-8")
+        content_hash = hashlib.sha256(raw).hexdigest()
+        fetched_at = datetime.now(timezone.utc)
+
+        # identical page bodies share one compressed blob
+        db.execute(
+            dialect_insert(db, PageBlob)
+            .values(
+                content_hash=content_hash,
+                encoding=ARCHIVE_ENCODING,
+                data=gzip.compress(raw),
+                size=len(raw),
+                created_at=fetched_at,
+            )
+            .on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+
+        fetch = PageFetch(
+            source=source,
+            external_id=external_id,
+            fetched_at=fetched_at,
+            content_hash=content_hash,
+        )
+        db.add(fetch)
+        db.flush()
+        fetch_id = fetch.id
+        self._commit(db)
+
+        self.logger.info(f"[Archived] Page of job {external_id} stored as {content_hash[:12]}.")
+        return JobResponse(
+            status=APIStatus.PAGE_ARCHIVED,
+            external_id=external_id,
+            id=fetch_id
+        )
+
+
+    @db_safe
+    def get_latest_page(self, db, external_id: int, source: JobSource = JobSource.DJINNI,
+                        max_age: Optional[timedelta] = None) -> Optional[str]:
+        query = (
+            select(PageBlob.encoding, PageBlob.data)
+            .join(PageFetch, PageFetch.content_hash == PageBlob.content_hash)
+            .where(PageFetch.source == source, PageFetch.external_id == external_id)
+            .order_by(PageFetch.fetched_at.desc())
+            .limit(1)
+        )
+        if max_age is not None:
+            query = query.where(PageFetch.fetched_at >= datetime.now(timezone.utc) - max_age)
+
+        row = db.execute(query).first()
+        if row is None:
+            return None
+        return self._decompress(row.encoding, row.data)
+
+
+    @db_safe(many=True)
+    def get_latest_pages(self, db, source: JobSource = JobSource.DJINNI,
+                         external_ids: Optional[Iterable[int]] = None) -> Dict[int, str]:
+        latest = (
+            select(PageFetch.external_id, func.max(PageFetch.fetched_at).label("fetched_at"))
+            .where(PageFetch.source == source)
+            .group_by(PageFetch.external_id)
+        )
+        if external_ids is not None:
+            latest = latest.where(PageFetch.external_id.in_(list(external_ids)))
+        latest = latest.subquery()
+
+        rows = db.execute(
+            select(PageFetch.external_id, PageBlob.encoding, PageBlob.data)
+            .join(latest, and_(
+                PageFetch.external_id == latest.c.external_id,
+                PageFetch.fetched_at == latest.c.fetched_at,
+            ))
+            .join(PageBlob, PageBlob.content_hash == PageFetch.content_hash)
+            .where(PageFetch.source == source)
+        )
+        return {row.external_id: self._decompress(row.encoding, row.data) for row in rows}
@@ -0,0 +1,104 @@
+# app/repositories/seen_job_cache.py
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.decorators import DAOError
+from app.core.enums import JobSource
+from app.core.logger import setup_logger
+
+
+class SeenJobCache:
+    def __init__(self,
+                client: Optional[redis.Redis] = None,
+                prefix: str = "jobai:seen",
+                warm_ttl_seconds: int = settings.seen_cache_warm_ttl_hours * 3600):
+        self.client = client or redis.Redis.from_url(settings.redis_url)
+        self.prefix = prefix
+        self.warm_ttl_seconds = warm_ttl_seconds
+        self.logger = setup_logger(__name__)
+
+
+    def _key(self, source: JobSource) -> str:
+        return f"{self.prefix}:{source.value}"
+
+
+    def _warm_marker(self, source: JobSource) -> str:
+        return f"{self._key(source)}:warm"
+
+
+    def is_warm(self, source: JobSource = JobSource.DJINNI) -> bool:
+        try:
+            return bool(self.client.exists(self._warm_marker(source)))
+        except RedisError as e:
+            self.logger.warning(f"[RedisError] is_warm: {e}")
+            return False
+
+
+    def warm(self, dao, source: JobSource = JobSource.DJINNI, chunk_size: int = 5000) -> int:
+        try:
+            external_ids = dao.get_external_ids(source=source)
+        except DAOError as e:
+            self.logger.error(f"[WarmFailed] Could not load external ids for '{source.value}': {e}")
+            return 0
+
+        try:
+            for start in range(0, len(external_ids), chunk_size):
+                self.client.sadd(self._key(source), *external_ids[start:start + chunk_size])
+            self.client.set(self._warm_marker(source), 1, ex=self.warm_ttl_seconds)
+        except RedisError as e:
+            self.logger.warning(f"[RedisError] warm: {e}")
+            return 0
+
+        self.logger.info(f"[Warmed] {len(external_ids)} seen '{source.value}' job ids loaded.")
+        return len(external_ids)
+
+
+    def ensure_warm(self, dao, source: JobSource = JobSource.DJINNI) -> None:
+        if not self.is_warm(source):
+            self.warm(dao, source)
+
+
+    def _filter_unseen_in_db(self, dao, external_ids: List[int], source: JobSource) -> List[int]:
+        try:
+            return dao.filter_unseen_external_ids(external_ids, source=source)
+        except DAOError as e:
+            self.logger.error(f"[FilterFailed] Could not check {len(external_ids)} '{source.value}' job ids: {e}")
+            return list(external_ids)
+
+
+    def filter_unseen(self, external_ids: List[int], source: JobSource = JobSource.DJINNI, dao=None) -> List[int]:
+        if not external_ids:
+            return []
+        try:
+            # a cold set reports every id as new, so an incremental crawl would never stop early
+            if dao is not None and not self.client.exists(self._warm_marker(source)):
+                return self._filter_unseen_in_db(dao, external_ids, source)
+            seen_flags = self.client.smismember(self._key(source), external_ids)
+        except RedisError as e:
+            self.logger.warning(f"[RedisError] filter_unseen: {e}")
+            if dao is not None:
+                return self._filter_unseen_in_db(dao, external_ids, source)
+            # the database still rejects duplicates, the cache only saves round trips
+            return list(external_ids)
+        return [external_id for external_id, seen in zip(external_ids, seen_flags) if not seen]
+
+
+    def iter_unseen(self, external_ids: Iterable[int], source: JobSource = JobSource.DJINNI,
+                    chunk_size: int = 100) -> Iterator[int]:
+        ids_iter = iter(external_ids)
+        while chunk := list(islice(ids_iter, chunk_size)):
+            yield from self.filter_unseen(chunk, source)
+
+
+    def mark_seen(self, external_ids: Iterable[int], source: JobSource = JobSource.DJINNI) -> None:
+        external_ids = list(external_ids)
+        if not external_ids:
+            return
+        try:
+            self.client.sadd(self._key(source), *external_ids)
+        except RedisError as e:
+            self.logger.warning(f"[RedisError] mark_seen: {e}")
@@ -0,0 +1,142 @@
+# app/scripts/benchmark_analysis.py
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.enums import FormFieldType
+from app.core.rate_limit import RateLimiter
+from app.services.analyze import AnalysisEngine, AsyncGenAIClient, PromptFactory
+from app.services.mock_llm import MockGenAIBackend
+
+
+SYNTHETIC_CV = (
+    "Python developer with five years of experience building backend services with Django, FastAPI, "
+    "PostgreSQL, Redis and Celery. Comfortable with Docker, CI pipelines and cloud deployments. "
+) * 30
+
+
+def build_synthetic_jobs(count: int, fields_per_job: int = 4) -> List[Tuple[Any, List[Any]]]:
+    jobs = []
+    for number in range(count):
+        job_details = SimpleNamespace(
+            title=f"Backend Developer #{number}",
+            company=f"Company {number}",
+            description="We build APIs with Python and PostgreSQL. " * 30,
+        )
+        form_fields = [
+            SimpleNamespace(
+                external_field_id=f"answer_text_{number}_{field}",
+                question=f"Question {field} for job {number}?",
+                answer_type=FormFieldType.TEXT,
+                answer_options=None,
+            ) for field in range(fields_per_job)
+        ]
+        jobs.append((job_details, form_fields))
+    return jobs
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def summarize(backend: MockGenAIBackend, results: List[Any], elapsed: float) -> Dict[str, float]:
+    # latency runs from the moment a call is sent, time spent queued behind the semaphore or the
+    # rate limiter shows up in throughput instead; batch members share the latency of their call
+    latencies = [
+        call.finished_at - call.started_at
+        for call in backend.calls if not call.failed
+        for _ in range(call.jobs)
+    ]
+    succeeded = sum(1 for result in results if not isinstance(result, BaseException))
+    jobs = max(len(results), 1)
+    return {
+        "jobs": len(results),
+        "failed_jobs": len(results) - succeeded,
+        "requests": len(backend.calls),
+        "failed_requests": sum(1 for call in backend.calls if call.failed),
+        "elapsed_seconds": elapsed,
+        "jobs_per_second": succeeded / elapsed if elapsed else 0.0,
+        "p50_latency_seconds": percentile(latencies, 0.50),
+        "p99_latency_seconds": percentile(latencies, 0.99),
+        "input_tokens_per_job": sum(call.input_tokens for call in backend.calls) / jobs,
+        "cached_tokens_per_job": sum(call.cached_tokens for call in backend.calls) / jobs,
+        "output_tokens_per_job": sum(call.output_tokens for call in backend.calls) / jobs,
+    }
+
+
+def run_benchmark(job_count: int = 100,
+                  batch_size: int = 1,
+                  max_concurrency: int = 8,
+                  latency_seconds: float = 0.5,
+                  latency_jitter_seconds: float = 0.1,
+                  error_rate: float = 0.0,
+                  requests_per_minute: int = 100_000,
+                  tokens_per_minute: int = 100_000_000,
+                  context_cache: bool = False,
+                  stream: bool = False,
+                  seed: Optional[int] = 0) -> Dict[str, float]:
+    backend = MockGenAIBackend(
+        latency_seconds=latency_seconds,
+        latency_jitter_seconds=latency_jitter_seconds,
+        error_rate=error_rate,
+        seed=seed,
+    )
+    model_client = AsyncGenAIClient(
+        max_concurrency=max_concurrency,
+        rate_limiter=RateLimiter(requests_per_minute, tokens_per_minute),
+        backoff_base_seconds=0.01,
+        backoff_max_seconds=0.1,
+        context_cache=context_cache,
+        stream=stream,
+        client=backend,
+    )
+    engine = AnalysisEngine(PromptFactory(), model_client)
+    jobs = build_synthetic_jobs(job_count)
+
+    if batch_size > 1:
+        run = engine.answer_batch_async(jobs, SYNTHETIC_CV, max_batch_jobs=batch_size)
+    else:
+        run = engine.answer_many_async(jobs, SYNTHETIC_CV)
+
+    started_at = time.perf_counter()
+    results = asyncio.run(run)
+    return summarize(backend, results, time.perf_counter() - started_at)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Drive synthetic jobs through AnalysisEngine against a mock LLM.")
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=int, default=100_000)
+    parser.add_argument("--tpm", type=int, default=100_000_000)
+    parser.add_argument("--context-cache", action="store_true")
+    parser.add_argument("--stream", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        job_count=args.jobs,
+        batch_size=args.batch_size,
+        max_concurrency=args.concurrency,
+        latency_seconds=args.latency,
+        latency_jitter_seconds=args.jitter,
+        error_rate=args.error_rate,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        context_cache=args.context_cache,
+        stream=args.stream,
+    )
+    for name, value in report.items():
+        print(f"{name:>24}: {value:.3f}" if isinstance(value, float) else f"{name:>24}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,66 @@
 # app/scripts/init_db.py
-from app.core.database import engine, Base
+from pathlib import Path
+from typing import Callable, Optional, Tuple
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Inspector
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.logger import setup_logger
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# what each revision adds, in order; a database created by create_all matches a prefix of this list,
+# depending on which version of the models created it
+SCHEMA_MARKERS: Tuple[Tuple[str, Callable[[Inspector], bool]], ...] = (
+    ("0001", lambda schema: schema.has_table("job_stubs")),
+    ("0002", lambda schema: schema.has_table("page_blobs") and schema.has_table("page_fetches")),
+    ("0003", lambda schema: "relevance_score" in {column["name"] for column in schema.get_columns("job_details")}),
+    ("0004", lambda schema: "ix_job_stubs_status_found_at" in {index["name"] for index in schema.get_indexes("job_stubs")}),
+    ("0005", lambda schema: "claimed_at" in {column["name"] for column in schema.get_columns("job_stubs")}),
+    ("0006", lambda schema: "answer_source" in {column["name"] for column in schema.get_columns("job_form_field")}),
+)
+
+logger = setup_logger(__name__)
+
+
+def alembic_config(url: str = settings.database_url) -> Config:
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    # the ini parser treats % as interpolation, url-encoded passwords contain it
+    config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    return config
+
+
+def detect_schema_revision(schema: Inspector) -> Optional[str]:
+    revision = None
+    for marker_revision, is_applied in SCHEMA_MARKERS:
+        if not is_applied(schema):
+            break
+        revision = marker_revision
+    return revision
+
+
+def init_db(url: str = settings.database_url) -> None:
+    config = alembic_config(url)
+
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        schema = inspect(engine)
+        revision = None if schema.has_table("alembic_version") else detect_schema_revision(schema)
+    finally:
+        engine.dispose()
+
+    if revision is not None:
+        logger.info(f"Existing schema without migration history, stamping it as {revision}.")
+        command.stamp(config, revision)
+
+    command.upgrade(config, "head")
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
 
 if __name__ == "__main__":
     init_db()
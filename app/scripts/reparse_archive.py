@@ -0,0 +1,70 @@
+# app/scripts/reparse_archive.py
+import argparse
+from typing import List, Optional
+
+from app.core.database import SessionLocal
+from app.core.config import settings
+from app.core.enums import JobSource, JobStatus
+from app.core.logger import setup_logger
+from app.repositories.job_dao import JobDAO
+from app.repositories.page_archive_dao import PageArchiveDAO
+from app.schemas.job import JobDetailsCreate, JobFormFieldCreate
+from app.services.parse import parse_job_details, parse_job_form_fields
+
+
+logger = setup_logger(__name__)
+
+# jobs still in the scrape stages have no answers or applications a re-parse could wipe
+REPARSE_STATUSES = frozenset({
+    JobStatus.SAVED_ID,
+    JobStatus.SCRAPED_DETAILS,
+    JobStatus.SCRAPING_DETAILS_FAILED,
+    JobStatus.FORM_FIELDS_SCRAPED,
+    JobStatus.SCRAPING_FORM_FIELDS_FAILED,
+})
+
+
+def reparse_archive(dao: JobDAO, archive: PageArchiveDAO, source: JobSource = JobSource.DJINNI,
+                    reset: bool = False) -> int:
+    statuses = dao.get_job_statuses(source=source)
+    pages = archive.get_latest_pages(source=source)
+    logger.info(f"Re-parsing {len(pages)} archived pages.")
+
+    reparsed = 0
+    for external_id, page_source in pages.items():
+        link = f"{settings.djinni_base_url}/jobs/{external_id}"
+        job_data = parse_job_details(page_source, external_id, link)
+        if "error" in job_data:
+            logger.warning(f"Skipping job {external_id} due to parse error: {job_data['error']}")
+            continue
+
+        if not reset and statuses.get(external_id, JobStatus.SAVED_ID) not in REPARSE_STATUSES:
+            # later stages keep their form fields, answers and status, only the listing text is refreshed
+            dao.update_job_details(JobDetailsCreate(**job_data))
+            reparsed += 1
+            continue
+
+        field_data = parse_job_form_fields(page_source, external_id, link)
+        if field_data and "error" in field_data[0]:
+            dao.save_job_details(JobDetailsCreate(**job_data))
+        else:
+            dao.save_job_page(
+                job_details=JobDetailsCreate(**job_data),
+                fields_data=[JobFormFieldCreate(**f) for f in field_data]
+            )
+        reparsed += 1
+    return reparsed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-run the parsers over archived job pages.")
+    parser.add_argument(
+        "--reset", action="store_true",
+        help="also rebuild form fields of analyzed or applied jobs, dropping their answers and status",
+    )
+    args = parser.parse_args(argv)
+    reparse_archive(JobDAO(session=SessionLocal), PageArchiveDAO(session=SessionLocal), reset=args.reset)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,63 +1,817 @@
 # app/services/analyze.py
 from google import genai
-from google.genai import types
+from google.genai import types, errors
+from sqlalchemy.exc import SQLAlchemyError
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Sequence, Set, Tuple, Union
+import asyncio
+import hashlib
+import httpx
 import json
+import os
+import random
+import threading
+import time
 
 from app.core.logger import setup_logger
 from app.core.config import settings
+from app.core.rate_limit import RateLimiter, build_rate_limiter
+from app.services.llm_cache import ResponseCache
+from app.services.answer_index import AnswerIndex
+from app.services.json_stream import StreamingAnswerParser, repair_json
+from app.core.enums import APIStatus, JobStatus
+from app.schemas.job import JobResponse
 
 logger = setup_logger(__name__)
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_STATUSES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "INTERNAL"}
+RETRY_INFO_TYPE = "type.googleapis.com/google.rpc.RetryInfo"
+
+
+def is_retryable(error: BaseException) -> bool:
+    # quota errors arrive as code 429 or status RESOURCE_EXHAUSTED; dropped connections and timeouts as httpx errors
+    if isinstance(error, errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES or error.status in RETRYABLE_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    # 429 responses carry a RetryInfo detail with the delay the quota window needs, e.g. "27s"
+    details = getattr(error, "details", None)
+    if not isinstance(details, dict):
+        return None
+    for detail in details.get("error", {}).get("details") or []:
+        if isinstance(detail, dict) and detail.get("@type") == RETRY_INFO_TYPE:
+            try:
+                return float(str(detail.get("retryDelay", "")).rstrip("s"))
+            except ValueError:
+                return None
+    return None
+
+
+def estimate_tokens(text: str) -> int:
+    # rough heuristic for gemini tokenizers, good enough for rate-limit budgeting
+    return len(text) // 4 + 1
+
+
+def finish_reason(response: Any) -> Optional[Any]:
+    candidates = getattr(response, "candidates", None)
+    return getattr(candidates[0], "finish_reason", None) if candidates else None
+
+
+def join_prompt(prefix: Optional[str], prompt: str) -> str:
+    return f"{prefix}\n\n{prompt}" if prefix else prompt
+
+
+class IncompleteOutputError(Exception):
+    pass
+
+
 @dataclass
 class FormAnswers:
     answers_by_field_id: Dict[str, str]
     raw: Dict[str, Any]
 
 
+    @property
+    def reused_field_ids(self) -> Set[str]:
+        reused = self.raw.get("reused") if isinstance(self.raw, dict) else None
+        return set(reused) if isinstance(reused, dict) else set()
+
+
+    @property
+    def model_answers(self) -> Dict[str, str]:
+        reused_field_ids = self.reused_field_ids
+        return {
+            field_id: answer for field_id, answer in self.answers_by_field_id.items()
+            if field_id not in reused_field_ids
+        }
+
+
 class CVProvider:
     def get_cv_text(self, path: str) -> str:
         raise NotImplementedError
 
 
+def _read_pdf_text(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise RuntimeError("Reading PDF CVs requires the 'pypdf' package.") from e
+    return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+
+
+def _read_docx_text(path: str) -> str:
+    try:
+        import docx
+    except ImportError as e:
+        raise RuntimeError("Reading DOCX CVs requires the 'python-docx' package.") from e
+    return "\n".join(paragraph.text for paragraph in docx.Document(path).paragraphs)
+
+
+def _read_plain_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+CV_READERS = {
+    ".pdf": _read_pdf_text,
+    ".docx": _read_docx_text,
+}
+
+
+def normalize_cv_text(text: str) -> str:
+    # extracted documents are full of layout whitespace; one blank line between blocks is enough
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    blocks, previous_blank = [], True
+    for line in lines:
+        if line or not previous_blank:
+            blocks.append(line)
+        previous_blank = not line
+    return "\n".join(blocks).strip()
+
+
+@dataclass
+class CVDocument:
+    text: str
+    token_count: int
+    mtime_ns: int
+    size: int
+
+
+class CachedCVProvider(CVProvider):
+    def __init__(self, token_counter: Callable[[str], int] = estimate_tokens):
+        self.token_counter = token_counter
+        self._documents: Dict[str, CVDocument] = {}
+        self._lock = threading.Lock()
+
+
+    def get_document(self, path: str) -> CVDocument:
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        with self._lock:
+            document = self._documents.get(path)
+            if document is not None and (document.mtime_ns, document.size) == (stat.st_mtime_ns, stat.st_size):
+                return document
+
+            reader = CV_READERS.get(os.path.splitext(path)[1].lower(), _read_plain_text)
+            text = normalize_cv_text(reader(path))
+            document = CVDocument(
+                text=text,
+                token_count=self.token_counter(text),
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+            self._documents[path] = document
+            logger.info(f"[CVLoaded] {path}: {document.token_count} tokens.")
+            return document
+
+
+    def get_cv_text(self, path: str) -> str:
+        return self.get_document(path).text
+
+
 class PromptFactory:
+    FORM_ANSWER_INSTRUCTIONS = (
+        "You are filling in a job application form on behalf of the candidate whose CV is given below.\n"
+        "Answer every form field truthfully, using only facts from the CV and the job description.\n"
+        "For radio fields answer with the chosen option value, for number fields answer with a number only.\n"
+        'Return only a JSON object of the form {"answers": {"<field id>": "<answer>"}}.'
+    )
+
+
+    def _serialize_job(self, job_details: Any) -> str:
+        return (
+            f"Title: {getattr(job_details, 'title', '')}\n"
+            f"Company: {getattr(job_details, 'company', '')}\n"
+            f"Description:\n{getattr(job_details, 'description', '')}"
+        )
+
+
+    def _serialize_fields(self, form_fields: List[Any]) -> str:
+        return json.dumps([
+            {
+                "id": field.external_field_id,
+                "question": field.question,
+                "type": str(field.answer_type),
+                "options": field.answer_options,
+            } for field in form_fields
+        ], ensure_ascii=False)
+
+
+    # instructions and CV are identical across jobs, so they form a prefix the provider can cache
+    def build_form_answer_prefix(self, cv_text: str) -> str:
+        return f"{self.FORM_ANSWER_INSTRUCTIONS}\n\nCV:\n{cv_text}"
+
+
+    def form_answer_prefix_tokens(self, cv_tokens: int) -> int:
+        return estimate_tokens(self.build_form_answer_prefix("")) + cv_tokens
+
+
+    def build_form_answer_suffix(self, job_details: Any, form_fields: List[Any]) -> str:
+        return (
+            f"Job:\n{self._serialize_job(job_details)}\n\n"
+            f"Form fields:\n{self._serialize_fields(form_fields)}"
+        )
+
+
     def build_form_answer_prompt(self, cv_text: str, job_details: Any, form_fields: List[Any]) -> str:
-        raise NotImplementedError
+        return join_prompt(
+            self.build_form_answer_prefix(cv_text),
+            self.build_form_answer_suffix(job_details, form_fields),
+        )
+
+
+    BATCH_FORM_ANSWER_INSTRUCTIONS = (
+        "You are filling in several job application forms on behalf of the candidate whose CV is given below.\n"
+        "Answer every form field of every job truthfully, using only facts from the CV and that job's description.\n"
+        "For radio fields answer with the chosen option value, for number fields answer with a number only.\n"
+        'Return only a JSON object of the form {"jobs": {"<job key>": {"answers": {"<field id>": "<answer>"}}}}.'
+    )
+
+
+    def batch_job_key(self, position: int) -> str:
+        return f"job_{position + 1}"
+
+
+    def serialize_batch_job(self, job_key: str, job_details: Any, form_fields: List[Any]) -> str:
+        return (
+            f"Job key: {job_key}\n"
+            f"{self._serialize_job(job_details)}\n"
+            f"Form fields:\n{self._serialize_fields(form_fields)}"
+        )
+
+
+    def build_batch_form_answer_prefix(self, cv_text: str) -> str:
+        return f"{self.BATCH_FORM_ANSWER_INSTRUCTIONS}\n\nCV:\n{cv_text}"
+
+
+    def batch_form_answer_prefix_tokens(self, cv_tokens: int) -> int:
+        return estimate_tokens(self.build_batch_form_answer_prefix("")) + cv_tokens
+
+
+    def build_batch_form_answer_suffix(self, jobs: Sequence[Tuple[Any, List[Any]]]) -> str:
+        sections = "\n\n".join(
+            self.serialize_batch_job(self.batch_job_key(position), job_details, form_fields)
+            for position, (job_details, form_fields) in enumerate(jobs)
+        )
+        return f"Jobs:\n{sections}"
+
+
+    def build_batch_form_answer_prompt(self, cv_text: str, jobs: Sequence[Tuple[Any, List[Any]]]) -> str:
+        return join_prompt(
+            self.build_batch_form_answer_prefix(cv_text),
+            self.build_batch_form_answer_suffix(jobs),
+        )
 
 
 class GenAIClient:
-    def __init__(self):
-        self.client = genai.Client(api_key=settings.gemini_api_key)
+    def __init__(self,
+                cache: Optional[ResponseCache] = None,
+                context_cache: bool = settings.gemini_context_cache,
+                context_cache_ttl_seconds: int = settings.gemini_context_cache_ttl_minutes * 60,
+                stream: bool = settings.gemini_stream_responses,
+                client: Optional[Any] = None):
+        # any object with the genai.Client surface works, e.g. the local mock backend
+        self._owns_client = client is None
+        self.client = client or self._new_client()
+        self.cache = cache
+        self.stream = stream
+        self.context_cache = context_cache
+        self.context_cache_ttl_seconds = context_cache_ttl_seconds
+        self._context_caches: Dict[str, Tuple[Optional[str], float]] = {}
         self.logger = logger
 
 
-    def generate_json(self, prompt: str, model: str = settings.gemini_model) -> Dict[str, Any]:
-        chosen_model = model
-        resp = self.client.models.generate_content(
-            model=chosen_model,
-            contents=prompt,
-            config=types.GenerateContentConfig(response_modalities=["TEXT"]),
+    def _new_client(self) -> Any:
+        return genai.Client(api_key=settings.gemini_api_key)
+
+
+    def _get_cached(self, prompt: str, model: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(model, prompt)
+        if cached is not None:
+            self.logger.info("[CacheHit] Returning cached model response.")
+        return cached
+
+
+    def _store_cached(self, prompt: str, model: str, result: Dict[str, Any]) -> None:
+        # raw_text fallbacks and truncated answers are not cached so a retry gets another chance
+        if (self.cache is not None and isinstance(result, dict)
+                and "raw_text" not in result and not result.get("partial")):
+            self.cache.set(model, prompt, result)
+
+
+    def _generate_config(self, cached_content: Optional[str] = None,
+                         max_output_tokens: int = settings.gemini_max_tokens) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            response_modalities=["TEXT"],
+            max_output_tokens=max_output_tokens,
+            cached_content=cached_content,
         )
+
+
+    def _context_cache_key(self, prefix: str, model: str) -> str:
+        return hashlib.sha256(f"{model}\0{prefix}".encode("utf-8")).hexdigest()
+
+
+    def _uses_context_cache(self, prefix: Optional[str]) -> bool:
+        # the provider rejects cached contents below its minimum size
+        return (
+            self.context_cache
+            and prefix is not None
+            and estimate_tokens(prefix) >= settings.gemini_context_cache_min_tokens
+        )
+
+
+    def _lookup_context_cache(self, prefix: str, model: str) -> Tuple[bool, Optional[str]]:
+        entry = self._context_caches.get(self._context_cache_key(prefix, model))
+        if entry is None or entry[1] <= time.monotonic():
+            return False, None
+        return True, entry[0]
+
+
+    def _remember_context_cache(self, prefix: str, model: str, name: Optional[str]) -> None:
+        # handles are dropped a minute early so they never expire mid-request; a failed
+        # registration (name None) is remembered too, so it is not retried on every call
+        expires_at = time.monotonic() + max(self.context_cache_ttl_seconds - 60, 0)
+        self._context_caches[self._context_cache_key(prefix, model)] = (name, expires_at)
+
+
+    def _context_cache_config(self, prefix: str) -> types.CreateCachedContentConfig:
+        return types.CreateCachedContentConfig(
+            contents=[prefix],
+            display_name="jobai-prompt-prefix",
+            ttl=f"{self.context_cache_ttl_seconds}s",
+        )
+
+
+    def _register_context_cache(self, prefix: Optional[str], model: str) -> Optional[str]:
+        if not self._uses_context_cache(prefix):
+            return None
+        found, name = self._lookup_context_cache(prefix, model)
+        if found:
+            return name
+
+        try:
+            name = self.client.caches.create(model=model, config=self._context_cache_config(prefix)).name
+            self.logger.info(f"[ContextCached] Prompt prefix registered as {name}.")
+        except errors.APIError as e:
+            self.logger.warning(f"[ContextCacheFailed] {e}; sending the prompt prefix inline.")
+            name = None
+        self._remember_context_cache(prefix, model, name)
+        return name
+
+
+    def _build_request(self, prompt: str, prefix: Optional[str], cached_content: Optional[str],
+                       max_output_tokens: int = settings.gemini_max_tokens) -> Tuple[str, types.GenerateContentConfig]:
+        if cached_content is not None:
+            return prompt, self._generate_config(cached_content=cached_content, max_output_tokens=max_output_tokens)
+        return join_prompt(prefix, prompt), self._generate_config(max_output_tokens=max_output_tokens)
+
+
+    def _parse_json(self, text: str, parser: Optional[StreamingAnswerParser] = None) -> Dict[str, Any]:
+        # valid json that is not an object ([...], "x", 123) is as unusable as invalid json
         try:
-            return json.loads(resp.text)
+            parsed = json.loads(text)
+            if isinstance(parsed, dict):
+                return parsed
         except Exception:
-            self.logger.warning("Model output not valid JSON; returning raw text.")
-            return {"raw_text": resp.text}
+            pass
+
+        repaired = repair_json(text)
+        if isinstance(repaired, dict):
+            self.logger.info("[Repaired] Model output needed JSON repair.")
+            return repaired
+
+        # a truncated batch stream still carries every job section completed before the cut
+        salvaged = parser.salvage() if parser is not None else None
+        if salvaged is not None:
+            self.logger.warning("[Partial] Model output cut off; keeping the entries completed before the cut.")
+            return salvaged
+
+        self.logger.warning("Model output not valid JSON; returning raw text.")
+        return {"raw_text": text}
+
+
+    def _mark_truncated(self, result: Dict[str, Any], reason: Optional[Any]) -> Dict[str, Any]:
+        # output that hit the token cap may still parse, its last entries are cut off all the same
+        if reason != types.FinishReason.MAX_TOKENS or not isinstance(result, dict) or result.get("partial"):
+            return result
+        self.logger.warning("[Truncated] Model output hit the output token cap.")
+        return {**result, "partial": True}
+
+
+    def _generate_text(self, model: str, contents: str, config: types.GenerateContentConfig,
+                       parser: StreamingAnswerParser) -> Tuple[str, Optional[Any]]:
+        if not self.stream:
+            resp = self.client.models.generate_content(model=model, contents=contents, config=config)
+            return resp.text, finish_reason(resp)
+
+        chunks, reason = [], None
+        for chunk in self.client.models.generate_content_stream(model=model, contents=contents, config=config):
+            reason = finish_reason(chunk) or reason
+            if chunk.text:
+                chunks.append(chunk.text)
+                parser.feed(chunk.text)
+        return "".join(chunks), reason
+
+
+    def generate_json(self, prompt: str, model: str = settings.gemini_model,
+                      prefix: Optional[str] = None,
+                      max_output_tokens: int = settings.gemini_max_tokens) -> Dict[str, Any]:
+        chosen_model = model
+        full_prompt = join_prompt(prefix, prompt)
+        cached = self._get_cached(full_prompt, chosen_model)
+        if cached is not None:
+            return cached
+
+        contents, config = self._build_request(
+            prompt, prefix, self._register_context_cache(prefix, chosen_model), max_output_tokens
+        )
+        parser = StreamingAnswerParser()
+        text, reason = self._generate_text(chosen_model, contents, config, parser)
+        result = self._mark_truncated(self._parse_json(text, parser), reason)
+        self._store_cached(full_prompt, chosen_model, result)
+        return result
+
+
+class AsyncGenAIClient(GenAIClient):
+    def __init__(self,
+                max_concurrency: int = settings.gemini_max_concurrency,
+                max_retries: int = settings.gemini_max_retries,
+                rate_limiter: Optional[RateLimiter] = None,
+                backoff_base_seconds: float = 1.0,
+                backoff_max_seconds: float = 30.0,
+                cache: Optional[ResponseCache] = None,
+                context_cache: bool = settings.gemini_context_cache,
+                stream: bool = settings.gemini_stream_responses,
+                client: Optional[Any] = None):
+        super().__init__(cache=cache, context_cache=context_cache, stream=stream, client=client)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or build_rate_limiter()
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._context_cache_lock: Optional[asyncio.Lock] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+    def _bind_loop(self) -> None:
+        # semaphores and locks bind to the loop they first wait on, every asyncio.run needs fresh ones
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            if self._owns_client and self._semaphore_loop is not None:
+                # the sdk's async http client is tied to the loop it first ran on and fails
+                # with "Event loop is closed" once that loop is gone
+                self.client = self._new_client()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._context_cache_lock = asyncio.Lock()
+            self._semaphore_loop = loop
+
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        self._bind_loop()
+        return self._semaphore
+
+
+    async def _register_context_cache_async(self, prefix: Optional[str], model: str) -> Optional[str]:
+        if not self._uses_context_cache(prefix):
+            return None
+        self._bind_loop()
+        # concurrent jobs share one prefix, only the first of them registers it
+        async with self._context_cache_lock:
+            found, name = self._lookup_context_cache(prefix, model)
+            if found:
+                return name
+
+            try:
+                cached = await self.client.aio.caches.create(model=model, config=self._context_cache_config(prefix))
+                name = cached.name
+                self.logger.info(f"[ContextCached] Prompt prefix registered as {name}.")
+            except errors.APIError as e:
+                self.logger.warning(f"[ContextCacheFailed] {e}; sending the prompt prefix inline.")
+                name = None
+            self._remember_context_cache(prefix, model, name)
+            return name
+
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # full jitter keeps concurrent retries from hitting the quota window in lockstep
+        return random.uniform(0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** attempt))
+
+
+    async def _generate_text_async(self, model: str, contents: str, config: types.GenerateContentConfig,
+                                   parser: StreamingAnswerParser) -> Tuple[str, Optional[Any]]:
+        if not self.stream:
+            resp = await self.client.aio.models.generate_content(model=model, contents=contents, config=config)
+            return resp.text, finish_reason(resp)
+
+        chunks, reason = [], None
+        async for chunk in await self.client.aio.models.generate_content_stream(
+            model=model, contents=contents, config=config
+        ):
+            reason = finish_reason(chunk) or reason
+            if chunk.text:
+                chunks.append(chunk.text)
+                parser.feed(chunk.text)
+        return "".join(chunks), reason
+
+
+    async def generate_json_async(self, prompt: str, model: str = settings.gemini_model,
+                                  prefix: Optional[str] = None,
+                                  max_output_tokens: int = settings.gemini_max_tokens,
+                                  prefix_tokens: Optional[int] = None) -> Dict[str, Any]:
+        self._bind_loop()
+        full_prompt = join_prompt(prefix, prompt)
+        cached = self._get_cached(full_prompt, model)
+        if cached is not None:
+            return cached
+
+        # callers that already counted the CV pass the prefix size, only the job part is estimated here
+        if prefix_tokens is None:
+            prefix_tokens = estimate_tokens(prefix) if prefix else 0
+        budget = prefix_tokens + estimate_tokens(prompt) + max_output_tokens
+        contents, config = self._build_request(
+            prompt, prefix, await self._register_context_cache_async(prefix, model), max_output_tokens
+        )
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(budget)
+            try:
+                # every attempt starts from an empty stream
+                parser = StreamingAnswerParser()
+                async with self._get_semaphore():
+                    text, reason = await self._generate_text_async(model, contents, config, parser)
+                result = self._mark_truncated(self._parse_json(text, parser), reason)
+                self._store_cached(full_prompt, model, result)
+                return result
+
+            except (errors.APIError, httpx.TransportError) as e:
+                if not is_retryable(e) or attempt == self.max_retries:
+                    raise
+                delay = max(self._backoff_delay(attempt), retry_after_seconds(e) or 0.0)
+                self.logger.warning(
+                    f"[Retry] Gemini call failed ({getattr(e, 'code', None) or type(e).__name__}), "
+                    f"attempt {attempt + 1}/{self.max_retries + 1}, sleeping {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
 
 class AnalysisEngine:
-    def __init__(self, prompt_factory: PromptFactory, model_client: GenAIClient):
+    def __init__(self,
+                prompt_factory: PromptFactory,
+                model_client: GenAIClient,
+                answer_index: Optional[AnswerIndex] = None):
         self.prompt_factory = prompt_factory
         self.model_client = model_client
+        self.answer_index = answer_index
         self.logger = logger
 
 
+    def _split_reusable(self, form_fields: List[Any]) -> Tuple[Dict[str, str], List[Any]]:
+        if self.answer_index is None:
+            return {}, form_fields
+        reused, unmatched = self.answer_index.split(form_fields)
+        if reused:
+            self.logger.info(f"[Reused] {len(reused)} of {len(form_fields)} answers taken from the answer index.")
+        return reused, unmatched
+
+
+    def _merge_reused(self, reused: Dict[str, str], answers: FormAnswers) -> FormAnswers:
+        return FormAnswers(
+            answers_by_field_id={**reused, **answers.answers_by_field_id},
+            raw={**answers.raw, "reused": reused} if reused else answers.raw,
+        )
+
+
     def answer_form_fields(self, job_details: Any, form_fields: List[Any], cv_text: str) -> FormAnswers:
-        prompt = self.prompt_factory.build_form_answer_prompt(cv_text, job_details, form_fields)
-        raw = self.model_client.generate_json(prompt)
-        return self._parse_form_output(raw)
+        reused, unmatched = self._split_reusable(form_fields)
+        if not unmatched:
+            return FormAnswers(answers_by_field_id=reused, raw={"reused": reused})
 
+        raw = self.model_client.generate_json(
+            self.prompt_factory.build_form_answer_suffix(job_details, unmatched),
+            prefix=self.prompt_factory.build_form_answer_prefix(cv_text),
+        )
+        return self._merge_reused(reused, self._parse_form_output(raw, unmatched))
 
-    def _parse_form_output(self, raw: Dict[str, Any]) -> FormAnswers:
-        raise NotImplementedError
+
+    async def answer_form_fields_async(self, job_details: Any, form_fields: List[Any], cv_text: str,
+                                       cv_tokens: Optional[int] = None) -> FormAnswers:
+        reused, unmatched = self._split_reusable(form_fields)
+        if not unmatched:
+            return FormAnswers(answers_by_field_id=reused, raw={"reused": reused})
+
+        raw = await self.model_client.generate_json_async(
+            self.prompt_factory.build_form_answer_suffix(job_details, unmatched),
+            prefix=self.prompt_factory.build_form_answer_prefix(cv_text),
+            prefix_tokens=None if cv_tokens is None else self.prompt_factory.form_answer_prefix_tokens(cv_tokens),
+        )
+        return self._merge_reused(reused, self._parse_form_output(raw, unmatched))
+
+
+    def learn_answers(self, form_fields: List[Any], answers: FormAnswers) -> None:
+        # only model answers are new evidence, reused ones would reinforce themselves
+        if self.answer_index is not None:
+            self.answer_index.add_many(form_fields, answers.model_answers)
+
+
+    async def answer_many_async(self,
+                                jobs: Sequence[Tuple[Any, List[Any]]],
+                                cv_text: str,
+                                cv_tokens: Optional[int] = None) -> List[Union[FormAnswers, BaseException]]:
+        return await asyncio.gather(
+            *(self.answer_form_fields_async(job_details, form_fields, cv_text, cv_tokens)
+              for job_details, form_fields in jobs),
+            return_exceptions=True,
+        )
+
+
+    def _pack_batches(self, cv_tokens: int, pending: List[Tuple[int, Any, List[Any], Dict[str, str]]],
+                      max_batch_jobs: int, max_batch_tokens: int) -> List[List[Tuple[int, Any, List[Any], Dict[str, str]]]]:
+        # the CV is sent once per batch, every job adds its own section on top of it
+        base_tokens = estimate_tokens(self.prompt_factory.build_batch_form_answer_prompt("", [])) + cv_tokens
+        batches, current, current_tokens = [], [], base_tokens
+        for item in pending:
+            _, job_details, form_fields, _ = item
+            job_tokens = estimate_tokens(self.prompt_factory.serialize_batch_job(
+                self.prompt_factory.batch_job_key(len(current)), job_details, form_fields
+            ))
+            if current and (len(current) >= max_batch_jobs or current_tokens + job_tokens > max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(item)
+            current_tokens += job_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+
+    def _split_batch_output(self, raw: Dict[str, Any], fields_per_job: List[List[Any]]) -> List[Optional[FormAnswers]]:
+        jobs = raw.get("jobs") if isinstance(raw, dict) else None
+        if not isinstance(jobs, dict):
+            self.logger.warning("Batch model output has no jobs object.")
+            return [None] * len(fields_per_job)
+
+        sections = []
+        for position, form_fields in enumerate(fields_per_job):
+            section = jobs.get(self.prompt_factory.batch_job_key(position))
+            try:
+                sections.append(self._parse_form_output(section, form_fields) if isinstance(section, dict) else None)
+            except IncompleteOutputError as e:
+                # only this job is answered again on its own, its batch-mates keep their answers
+                self.logger.warning(f"[BatchSectionIncomplete] {e}")
+                sections.append(None)
+        return sections
+
+
+    async def _answer_batch_async(self, cv_text: str, cv_tokens: int,
+                                  batch: List[Tuple[int, Any, List[Any], Dict[str, str]]]) -> List[Tuple[int, Union[FormAnswers, BaseException]]]:
+        if len(batch) == 1:
+            position, job_details, form_fields, reused = batch[0]
+            raw = await self.model_client.generate_json_async(
+                self.prompt_factory.build_form_answer_suffix(job_details, form_fields),
+                prefix=self.prompt_factory.build_form_answer_prefix(cv_text),
+                prefix_tokens=self.prompt_factory.form_answer_prefix_tokens(cv_tokens),
+            )
+            return [(position, self._merge_reused(reused, self._parse_form_output(raw, form_fields)))]
+
+        try:
+            # every job answers its own form, so the output cap grows with the batch
+            raw = await self.model_client.generate_json_async(
+                self.prompt_factory.build_batch_form_answer_suffix(
+                    [(job_details, form_fields) for _, job_details, form_fields, _ in batch]
+                ),
+                prefix=self.prompt_factory.build_batch_form_answer_prefix(cv_text),
+                max_output_tokens=min(settings.gemini_max_tokens * len(batch), settings.analysis_batch_max_output_tokens),
+                prefix_tokens=self.prompt_factory.batch_form_answer_prefix_tokens(cv_tokens),
+            )
+            sections = self._split_batch_output(raw, [form_fields for _, _, form_fields, _ in batch])
+        except Exception as e:
+            self.logger.warning(f"[BatchFailed] Batch of {len(batch)} jobs failed: {e!r}; answering them one by one.")
+            sections = [None] * len(batch)
+
+        fallbacks = [item for item, section in zip(batch, sections) if section is None]
+        if fallbacks:
+            self.logger.warning(f"[BatchFallback] {len(fallbacks)} of {len(batch)} jobs missing from batch output.")
+        fallback_results = iter(await asyncio.gather(
+            *(self._answer_batch_async(cv_text, cv_tokens, [item]) for item in fallbacks),
+            return_exceptions=True,
+        ))
+
+        results = []
+        for (position, _, _, reused), section in zip(batch, sections):
+            if section is not None:
+                results.append((position, self._merge_reused(reused, section)))
+                continue
+            fallback = next(fallback_results)
+            results.append((position, fallback if isinstance(fallback, BaseException) else fallback[0][1]))
+        return results
+
+
+    async def answer_batch_async(self,
+                                 jobs: Sequence[Tuple[Any, List[Any]]],
+                                 cv_text: str,
+                                 max_batch_jobs: int = settings.analysis_batch_size,
+                                 max_batch_tokens: int = settings.analysis_batch_max_input_tokens,
+                                 cv_tokens: Optional[int] = None) -> List[Union[FormAnswers, BaseException]]:
+        if cv_tokens is None:
+            cv_tokens = estimate_tokens(cv_text)
+        results: List[Union[FormAnswers, BaseException, None]] = [None] * len(jobs)
+        pending = []
+        for position, (job_details, form_fields) in enumerate(jobs):
+            reused, unmatched = self._split_reusable(form_fields)
+            if unmatched:
+                pending.append((position, job_details, unmatched, reused))
+            else:
+                results[position] = FormAnswers(answers_by_field_id=reused, raw={"reused": reused})
+
+        batches = self._pack_batches(cv_tokens, pending, max_batch_jobs, max_batch_tokens)
+        outcomes = await asyncio.gather(
+            *(self._answer_batch_async(cv_text, cv_tokens, batch) for batch in batches),
+            return_exceptions=True,
+        )
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                for position, _, _, _ in batch:
+                    results[position] = outcome
+                continue
+            for position, result in outcome:
+                results[position] = result
+        return results
+
+
+    def _parse_form_output(self, raw: Dict[str, Any], form_fields: List[Any]) -> FormAnswers:
+        # saving a cut-off or unusable answer set would mark the job analyzed with fields left unanswered
+        if isinstance(raw, dict) and raw.get("partial"):
+            raise IncompleteOutputError(f"Model output cut off after {len(raw.get('answers', {}))} answers.")
+
+        answers = raw.get("answers", raw) if isinstance(raw, dict) else None
+        if not isinstance(answers, dict) or "raw_text" in answers:
+            raise IncompleteOutputError("Model output has no answers object.")
+
+        answers_by_field_id = {
+            str(field_id): str(answer) for field_id, answer in answers.items() if answer is not None
+        }
+        missing = [field.external_field_id for field in form_fields if field.external_field_id not in answers_by_field_id]
+        if missing:
+            raise IncompleteOutputError(f"Model output has no answer for fields {missing}.")
+        return FormAnswers(answers_by_field_id=answers_by_field_id, raw=raw)
+
+
+def _save_job_result(dao: Any, job_info: JobResponse, result: Union[FormAnswers, BaseException]) -> bool:
+    if isinstance(result, BaseException):
+        logger.error(f"[AnalysisError] Job {job_info.external_id}: {result!r}")
+    else:
+        response = dao.save_form_answers(
+            job_id=job_info.id,
+            answers_by_field_id=result.answers_by_field_id,
+            reused_field_ids=result.reused_field_ids,
+        )
+        if response.status == APIStatus.JOB_FORM_ANSWERS_SAVED:
+            return True
+        logger.error(f"[SaveFailed] Answers of job {job_info.external_id} not saved: {response.status}")
+
+    dao.update_job_status(
+        external_id=job_info.external_id,
+        new_status=JobStatus.ANALYZING_FORM_FIELDS_FAILED
+    )
+    return False
+
+
+def process_jobs_form_answers(dao: Any, engine: AnalysisEngine, cv_text: str, claims: List[JobResponse],
+                              cv_tokens: Optional[int] = None) -> None:
+    try:
+        with dao.unit_of_work() as uow:
+            jobs = [
+                (job_info, uow.get_job_details(job_info.id), uow.get_job_form_fields(job_info.id))
+                for job_info in claims
+            ]
+    except SQLAlchemyError as e:
+        # each claim is marked failed in its own transaction, so they do not stay claimed
+        logger.error(f"[DatabaseError] Could not load {len(claims)} claimed jobs: {e}")
+        for job_info in claims:
+            dao.update_job_status(external_id=job_info.external_id, new_status=JobStatus.ANALYZING_FORM_FIELDS_FAILED)
+        return
+
+    answer_jobs = engine.answer_batch_async if settings.analysis_batch_size > 1 else engine.answer_many_async
+    results = asyncio.run(answer_jobs(
+        [(job_details, form_fields) for _, job_details, form_fields in jobs], cv_text, cv_tokens=cv_tokens
+    ))
+
+    # the whole batch is written in one transaction instead of one per job
+    try:
+        with dao.unit_of_work() as uow:
+            saved = [_save_job_result(uow, job_info, result) for job_info, result in zip(claims, results)]
+    except SQLAlchemyError as e:
+        # one bad row rolled back the whole batch; per-job transactions keep the rest of it
+        logger.error(f"[DatabaseError] Could not save answers of {len(claims)} jobs at once, saving them one by one: {e}")
+        saved = [_save_job_result(dao, job_info, result) for job_info, result in zip(claims, results)]
+
+    for (_, _, form_fields), result, was_saved in zip(jobs, results, saved):
+        if was_saved:
+            engine.learn_answers(form_fields, result)
@@ -0,0 +1,95 @@
+# app/services/answer_index.py
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.decorators import DAOError
+from app.core.logger import setup_logger
+
+
+NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+logger = setup_logger(__name__)
+
+
+def normalize_question(question: Optional[str]) -> str:
+    return " ".join(NON_WORD_RE.sub(" ", (question or "").lower()).split())
+
+
+def _option_parts(option: Any) -> Tuple[str, str]:
+    if isinstance(option, dict):
+        return normalize_question(option.get("text")), str(option.get("value"))
+    return normalize_question(getattr(option, "text", None)), str(getattr(option, "value", None))
+
+
+def field_signature(field: Any) -> str:
+    # radio answers are option values, so the options are part of the identity of a question
+    options = sorted(_option_parts(option) for option in (field.answer_options or []))
+    return f"{field.answer_type}|{normalize_question(field.question)}|{options}"
+
+
+class AnswerIndex:
+    def __init__(self,
+                min_support: int = settings.answer_index_min_support,
+                min_confidence: float = settings.answer_index_min_confidence,
+                max_answer_length: int = settings.answer_index_max_answer_length):
+        self.min_support = min_support
+        self.min_confidence = min_confidence
+        self.max_answer_length = max_answer_length
+        self._answers: Dict[str, Counter] = {}
+
+
+    @classmethod
+    def from_dao(cls, dao, **kwargs) -> "AnswerIndex":
+        index = cls(**kwargs)
+        try:
+            answered_fields = dao.get_answered_form_fields()
+        except DAOError as e:
+            # an empty index only means every field goes to the model
+            logger.error(f"[IndexFailed] {e}")
+            return index
+
+        for field in answered_fields:
+            index.add(field, field.answer)
+        logger.info(f"[Indexed] {len(index)} distinct answered questions.")
+        return index
+
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+
+    def add(self, field: Any, answer: Optional[str]) -> None:
+        # long free-text answers (cover letters and the like) are tailored to a single job
+        if not answer or len(answer) > self.max_answer_length:
+            return
+        self._answers.setdefault(field_signature(field), Counter())[answer.strip()] += 1
+
+
+    def add_many(self, form_fields: Iterable[Any], answers_by_field_id: Dict[str, str]) -> None:
+        for field in form_fields:
+            self.add(field, answers_by_field_id.get(field.external_field_id))
+
+
+    def lookup(self, field: Any) -> Optional[str]:
+        counter = self._answers.get(field_signature(field))
+        if not counter:
+            return None
+
+        answer, support = counter.most_common(1)[0]
+        confidence = support / sum(counter.values())
+        if support < self.min_support or confidence < self.min_confidence:
+            return None
+        return answer
+
+
+    def split(self, form_fields: List[Any]) -> Tuple[Dict[str, str], List[Any]]:
+        reused, unmatched = {}, []
+        for field in form_fields:
+            answer = self.lookup(field)
+            if answer is None:
+                unmatched.append(field)
+            else:
+                reused[field.external_field_id] = answer
+        return reused, unmatched
@@ -0,0 +1,197 @@
+# app/services/driver_pool.py
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager, ExitStack
+from queue import Queue
+from typing import Dict, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+from app.core.logger import setup_logger
+from app.core.config import settings
+
+
+def build_chrome_options(chrome_binary: str, profile_dir: str, profile_name: str, detach: bool = False) -> Options:
+    opts = Options()
+    opts.binary_location = chrome_binary
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+    opts.add_argument(f"--profile-directory={profile_name}")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    if detach:
+        opts.add_experimental_option("detach", True)
+    return opts
+
+
+class PooledChrome(webdriver.Chrome):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_loads = 0
+
+
+    def get(self, url: str) -> None:
+        self.page_loads += 1
+        super().get(url)
+
+
+class DriverPool:
+    def __init__(self,
+                size: int = settings.driver_pool_size,
+                max_page_loads: int = settings.driver_max_page_loads,
+                chrome_binary: str = settings.chrome_binary,
+                profile_dir: str = settings.profile_dir,
+                profile_name: str = settings.profile_name,
+                driver_path: str = settings.driver_path,
+                warm_url: Optional[str] = settings.djinni_base_url):
+        self.size = size
+        self.max_page_loads = max_page_loads
+        self.chrome_binary = chrome_binary
+        self.profile_dir = profile_dir
+        self.profile_name = profile_name
+        self.driver_path = driver_path
+        self.warm_url = warm_url
+        self.logger = setup_logger(__name__)
+
+        self._idle: Queue = Queue()
+        self._profile_copies: Dict[int, str] = {}
+        self._closed = False
+
+        try:
+            for _ in range(size):
+                self._idle.put(self._launch())
+        except BaseException:
+            # the caller never gets the pool, so nobody else would quit the drivers already started
+            self.close()
+            raise
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+    def _copy_profile(self) -> str:
+        # chrome locks its user-data-dir, so every pooled driver gets a private copy
+        profile_copy = tempfile.mkdtemp(prefix="jobai-profile-")
+
+        local_state = os.path.join(self.profile_dir, "Local State")
+        if os.path.exists(local_state):
+            shutil.copy2(local_state, profile_copy)
+
+        source = os.path.join(self.profile_dir, self.profile_name)
+        if os.path.isdir(source):
+            shutil.copytree(
+                source,
+                os.path.join(profile_copy, self.profile_name),
+                ignore=shutil.ignore_patterns("Singleton*", "*.lock", "Cache", "Code Cache", "GPUCache"),
+            )
+        return profile_copy
+
+
+    def _launch(self) -> PooledChrome:
+        profile_copy = self._copy_profile()
+        opts = build_chrome_options(self.chrome_binary, profile_copy, self.profile_name)
+        try:
+            driver = PooledChrome(service=Service(self.driver_path), options=opts)
+        except BaseException:
+            shutil.rmtree(profile_copy, ignore_errors=True)
+            raise
+        self._profile_copies[id(driver)] = profile_copy
+
+        if self.warm_url:
+            try:
+                driver.get(self.warm_url)
+            except WebDriverException as e:
+                self.logger.warning(f"[Warmup Failed] {e}")
+        driver.page_loads = 0
+
+        self.logger.info(f"[Launched] Pooled driver with profile copy {profile_copy}")
+        return driver
+
+
+    def _discard(self, driver: PooledChrome) -> None:
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.warning(f"[Quit Failed] {e}")
+
+        profile_copy = self._profile_copies.pop(id(driver), None)
+        if profile_copy:
+            shutil.rmtree(profile_copy, ignore_errors=True)
+
+
+    def _is_healthy(self, driver: PooledChrome) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+
+    def _replace(self, driver: Optional[PooledChrome]) -> PooledChrome:
+        if driver is not None:
+            self._discard(driver)
+        try:
+            return self._launch()
+        except BaseException:
+            # the slot goes back empty and is launched again by the next acquire, so a failed
+            # launch never shrinks the pool and acquire(timeout=None) cannot wait on a lost slot
+            self._idle.put(None)
+            raise
+
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledChrome:
+        driver = self._idle.get(timeout=timeout)
+        if driver is None:
+            return self._replace(None)
+        if not self._is_healthy(driver):
+            self.logger.warning("[Unhealthy] Replacing pooled driver.")
+            driver = self._replace(driver)
+        return driver
+
+
+    def release(self, driver: PooledChrome) -> None:
+        if self._closed:
+            self._discard(driver)
+            return
+
+        if driver.page_loads >= self.max_page_loads:
+            self.logger.info(f"[Recycled] Pooled driver after {driver.page_loads} page loads.")
+            try:
+                driver = self._replace(driver)
+            except Exception as e:
+                # the lease is over, the empty slot is relaunched on its next acquire instead
+                self.logger.error(f"[Relaunch Failed] {e}")
+                return
+
+        self._idle.put(driver)
+
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[PooledChrome]:
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+
+    @contextmanager
+    def lease_many(self, count: int, timeout: Optional[float] = None) -> Iterator[List[PooledChrome]]:
+        with ExitStack() as stack:
+            yield [stack.enter_context(self.lease(timeout=timeout)) for _ in range(count)]
+
+
+    def close(self) -> None:
+        self._closed = True
+        while not self._idle.empty():
+            driver = self._idle.get_nowait()
+            if driver is not None:
+                self._discard(driver)
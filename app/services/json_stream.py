@@ -0,0 +1,117 @@
+# app/services/json_stream.py
+import json
+import re
+from typing import Any, Dict, Optional
+
+
+CODE_FENCE_RE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+ANSWERS_KEY_RE = re.compile(r'"answers"\s*:\s*\{')
+JOBS_KEY_RE = re.compile(r'"jobs"\s*:\s*\{')
+
+_decoder = json.JSONDecoder()
+
+
+def _strip_trailing_commas(text: str) -> str:
+    # string-aware, so commas inside answer texts are left alone
+    out, in_string, escaped = [], False, False
+    for position, char in enumerate(text):
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char == ",":
+            following = text[position + 1:].lstrip()
+            if following[:1] in ("}", "]"):
+                continue
+        out.append(char)
+    return "".join(out)
+
+
+def repair_json(text: str) -> Optional[Any]:
+    candidate = CODE_FENCE_RE.sub("", text.strip())
+    start, end = candidate.find("{"), candidate.rfind("}")
+    if start != -1 and end > start:
+        candidate = candidate[start:end + 1]
+    try:
+        return json.loads(_strip_trailing_commas(candidate))
+    except ValueError:
+        return None
+
+
+def _skip(text: str, position: int, chars: str) -> int:
+    while position < len(text) and text[position] in chars:
+        position += 1
+    return position
+
+
+# tracks the entries a streamed response has completed so far: field answers of the single-job
+# {"answers": {...}} shape, or whole job sections of the batch {"jobs": {...}} shape. Nothing acts on
+# them mid-stream; they are only read through salvage() once a response turns out to be cut off
+class StreamingAnswerParser:
+    def __init__(self):
+        self.buffer = ""
+        self.answers: Dict[str, str] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._target: Optional[Dict[str, Any]] = None
+        self._position: Optional[int] = None
+
+
+    def _find_start(self) -> bool:
+        # whichever key opens first is the outer one, batch sections contain "answers" keys of their own
+        matches = [
+            (match.start(), match.end(), target)
+            for pattern, target in ((ANSWERS_KEY_RE, self.answers), (JOBS_KEY_RE, self.jobs))
+            if (match := pattern.search(self.buffer)) is not None
+        ]
+        if not matches:
+            return False
+        _, self._position, self._target = min(matches, key=lambda match: match[0])
+        return True
+
+
+    def feed(self, chunk: str) -> None:
+        self.buffer += chunk
+        if self._position is None and not self._find_start():
+            return
+
+        new_entries = {}
+        while True:
+            position = _skip(self.buffer, self._position, " \t\r\n,")
+            if position >= len(self.buffer) or self.buffer[position] == "}":
+                break
+            try:
+                key, position = _decoder.raw_decode(self.buffer, position)
+                position = _skip(self.buffer, position, " \t\r\n")
+                if self.buffer[position:position + 1] != ":":
+                    break
+                value, position = _decoder.raw_decode(self.buffer, _skip(self.buffer, position + 1, " \t\r\n"))
+            except ValueError:
+                break
+            # a number at the very end of the buffer may still be missing digits
+            if _skip(self.buffer, position, " \t\r\n") >= len(self.buffer):
+                break
+
+            self._position = position
+            if self._target is self.jobs:
+                if isinstance(value, dict):
+                    new_entries[str(key)] = value
+            elif value is not None:
+                new_entries[str(key)] = str(value)
+
+        self._target.update(new_entries)
+
+
+    def salvage(self) -> Optional[Dict[str, Any]]:
+        if self.jobs:
+            return {"jobs": dict(self.jobs), "partial": True}
+        if self.answers:
+            return {"answers": dict(self.answers), "partial": True}
+        return None
@@ -0,0 +1,160 @@
+# app/services/llm_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.enums import LLMCacheBackend
+from app.core.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class SQLiteCacheBackend:
+    def __init__(self,
+                path: str = settings.llm_cache_path,
+                max_entries: int = settings.llm_cache_max_entries,
+                busy_timeout_seconds: float = settings.llm_cache_busy_timeout_seconds):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # several worker processes share the file; writers wait for the lock instead of failing right away
+        self._conn = sqlite3.connect(path, timeout=busy_timeout_seconds, check_same_thread=False)
+        try:
+            if path != ":memory:":
+                # readers no longer block the writer, and the other way round
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[SQLiteError] llm cache setup: {e}")
+
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"[SQLiteError] llm cache get: {e}")
+                return None
+            if row is None:
+                return None
+
+            # a hit is still a hit when another process holds the write lock, only its LRU position is stale
+            try:
+                self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.warning(f"[SQLiteError] llm cache touch: {e}")
+        return row[0]
+
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, value, now + ttl_seconds, now),
+                )
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                # least recently used entries go first once the cache is over its size bound
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.warning(f"[SQLiteError] llm cache set: {e}")
+
+
+class RedisCacheBackend:
+    def __init__(self,
+                client: Optional[redis.Redis] = None,
+                prefix: str = "jobai:llm",
+                max_entries: int = settings.llm_cache_max_entries):
+        self.client = client or redis.Redis.from_url(settings.redis_url)
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self.index_key = f"{prefix}:index"
+
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self.client.get(f"{self.prefix}:{key}")
+            if value is None:
+                return None
+            self.client.zadd(self.index_key, {key: time.time()})
+        except RedisError as e:
+            logger.warning(f"[RedisError] llm cache get: {e}")
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            self.client.set(f"{self.prefix}:{key}", value, ex=ttl_seconds)
+            self.client.zadd(self.index_key, {key: time.time()})
+
+            overflow = self.client.zcard(self.index_key) - self.max_entries
+            if overflow > 0:
+                evicted = [member for member, _ in self.client.zpopmin(self.index_key, overflow)]
+                self.client.delete(*(f"{self.prefix}:{self._decode(member)}" for member in evicted))
+        except RedisError as e:
+            logger.warning(f"[RedisError] llm cache set: {e}")
+
+
+    def _decode(self, member: Any) -> str:
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl_seconds: int = settings.llm_cache_ttl_hours * 3600):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+
+    def make_key(self, model: str, prompt: str) -> str:
+        normalized_prompt = " ".join(prompt.split())
+        return hashlib.sha256(f"{model}\0{normalized_prompt}".encode("utf-8")).hexdigest()
+
+
+    def get(self, model: str, prompt: str) -> Optional[Dict[str, Any]]:
+        value = self.backend.get(self.make_key(model, prompt))
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
+
+    def set(self, model: str, prompt: str, response: Dict[str, Any]) -> None:
+        self.backend.set(self.make_key(model, prompt), json.dumps(response), self.ttl_seconds)
+
+
+def build_response_cache(backend: LLMCacheBackend = settings.llm_cache_backend) -> Optional[ResponseCache]:
+    if backend == LLMCacheBackend.SQLITE:
+        return ResponseCache(SQLiteCacheBackend())
+    if backend == LLMCacheBackend.REDIS:
+        return ResponseCache(RedisCacheBackend())
+    return None
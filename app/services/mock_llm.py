@@ -0,0 +1,185 @@
+# app/services/mock_llm.py
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from google.genai import errors
+
+from app.services.analyze import estimate_tokens
+
+
+JOB_KEY_RE = re.compile(r"^Job key: (\S+)$", re.MULTILINE)
+FIELD_ID_RE = re.compile(r'"id": "((?:[^"\\]|\\.)*)"')
+
+
+@dataclass
+class MockCall:
+    started_at: float
+    finished_at: float
+    jobs: int
+    input_tokens: int
+    cached_tokens: int
+    output_tokens: int
+    failed: bool
+
+
+@dataclass
+class MockResponse:
+    text: str
+
+
+# stands in for genai.Client: same call surface, canned answers, simulated latency and failures
+class MockGenAIBackend:
+    def __init__(self,
+                latency_seconds: float = 0.5,
+                latency_jitter_seconds: float = 0.1,
+                seconds_per_output_token: float = 0.0,
+                error_rate: float = 0.0,
+                stream_chunk_size: int = 64,
+                seed: Optional[int] = None):
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self.seconds_per_output_token = seconds_per_output_token
+        self.error_rate = error_rate
+        self.stream_chunk_size = stream_chunk_size
+        self.random = random.Random(seed)
+        self.calls: List[MockCall] = []
+        self._cached_tokens: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.models = _MockModels(self)
+        self.caches = _MockCaches(self)
+        self.aio = _MockAio(self)
+
+
+    def _answer_text(self, contents: str) -> Tuple[str, int]:
+        # batch prompts are split on their job keys, single-job prompts answer every field id they list
+        keys = JOB_KEY_RE.findall(contents)
+        if not keys:
+            answers = {field_id: f"mock answer {field_id}" for field_id in FIELD_ID_RE.findall(contents)}
+            return json.dumps({"answers": answers}), 1
+
+        sections = JOB_KEY_RE.split(contents)[1:]
+        jobs = {
+            key: {"answers": {field_id: f"mock answer {field_id}" for field_id in FIELD_ID_RE.findall(section)}}
+            for key, section in zip(sections[::2], sections[1::2])
+        }
+        return json.dumps({"jobs": jobs}), len(keys)
+
+
+    def _plan(self, contents: str, config: Any) -> Tuple[float, bool, str, int, int]:
+        text, jobs = self._answer_text(contents)
+        with self._lock:
+            jitter = self.random.uniform(-self.latency_jitter_seconds, self.latency_jitter_seconds)
+            failed = self.random.random() < self.error_rate
+            cached_tokens = self._cached_tokens.get(getattr(config, "cached_content", None) or "", 0)
+        delay = max(0.0, self.latency_seconds + jitter + estimate_tokens(text) * self.seconds_per_output_token)
+        return delay, failed, text, jobs, cached_tokens
+
+
+    def _record(self, started_at: float, contents: str, text: str, jobs: int,
+                cached_tokens: int, failed: bool) -> None:
+        with self._lock:
+            self.calls.append(MockCall(
+                started_at=started_at,
+                finished_at=time.perf_counter(),
+                jobs=jobs,
+                input_tokens=estimate_tokens(contents),
+                cached_tokens=cached_tokens,
+                output_tokens=0 if failed else estimate_tokens(text),
+                failed=failed,
+            ))
+
+
+    def _chunks(self, text: str) -> List[str]:
+        return [text[start:start + self.stream_chunk_size] for start in range(0, len(text), self.stream_chunk_size)]
+
+
+    def generate(self, contents: str, config: Any) -> str:
+        started_at = time.perf_counter()
+        delay, failed, text, jobs, cached_tokens = self._plan(contents, config)
+        time.sleep(delay)
+        self._record(started_at, contents, text, jobs, cached_tokens, failed)
+        if failed:
+            raise errors.APIError(503, {"error": {"message": "mock backend unavailable"}})
+        return text
+
+
+    async def generate_async(self, contents: str, config: Any) -> str:
+        started_at = time.perf_counter()
+        delay, failed, text, jobs, cached_tokens = self._plan(contents, config)
+        await asyncio.sleep(delay)
+        self._record(started_at, contents, text, jobs, cached_tokens, failed)
+        if failed:
+            raise errors.APIError(503, {"error": {"message": "mock backend unavailable"}})
+        return text
+
+
+    def create_cache(self, config: Any) -> str:
+        with self._lock:
+            name = f"cachedContents/mock-{len(self._cached_tokens) + 1}"
+            self._cached_tokens[name] = sum(estimate_tokens(str(content)) for content in config.contents)
+        return name
+
+
+class _MockModels:
+    def __init__(self, backend: MockGenAIBackend):
+        self.backend = backend
+
+
+    def generate_content(self, model: str, contents: str, config: Any = None) -> MockResponse:
+        return MockResponse(text=self.backend.generate(contents, config))
+
+
+    def generate_content_stream(self, model: str, contents: str, config: Any = None) -> Iterator[MockResponse]:
+        for chunk in self.backend._chunks(self.backend.generate(contents, config)):
+            yield MockResponse(text=chunk)
+
+
+class _MockAsyncModels:
+    def __init__(self, backend: MockGenAIBackend):
+        self.backend = backend
+
+
+    async def generate_content(self, model: str, contents: str, config: Any = None) -> MockResponse:
+        return MockResponse(text=await self.backend.generate_async(contents, config))
+
+
+    async def generate_content_stream(self, model: str, contents: str,
+                                      config: Any = None) -> AsyncIterator[MockResponse]:
+        text = await self.backend.generate_async(contents, config)
+
+        async def chunks():
+            for chunk in self.backend._chunks(text):
+                yield MockResponse(text=chunk)
+        return chunks()
+
+
+@dataclass
+class _MockCachedContent:
+    name: str
+
+
+class _MockCaches:
+    def __init__(self, backend: MockGenAIBackend):
+        self.backend = backend
+
+
+    def create(self, model: str, config: Any) -> _MockCachedContent:
+        return _MockCachedContent(name=self.backend.create_cache(config))
+
+
+class _MockAsyncCaches(_MockCaches):
+    async def create(self, model: str, config: Any) -> _MockCachedContent:
+        return _MockCachedContent(name=self.backend.create_cache(config))
+
+
+class _MockAio:
+    def __init__(self, backend: MockGenAIBackend):
+        self.models = _MockAsyncModels(backend)
+        self.caches = _MockAsyncCaches(backend)
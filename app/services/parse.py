@@ -0,0 +1,180 @@
+# app/services/parse.py
+import re
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+from typing import Dict, Any, List, Optional
+
+from app.core.enums import ScrapeError, FormFieldType
+
+
+BLOCK_TAGS = {
+    "address", "article", "br", "dd", "div", "dl", "dt", "footer", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "template", "noscript"}
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+TITLE_XPATH = f"//h1[{_has_class('d-flex')} and {_has_class('align-items-center')} and {_has_class('flex-wrap')}]/span"
+DESCRIPTION_XPATH = f"//div[{_has_class('job-post__description')}]"
+COMPANY_XPATH = "//a[contains(@class,'text-reset') and contains(@href,'/jobs/company-')]"
+QUESTION_BLOCK_XPATH = ".//div[contains(@class, 'mb-')][not(.//div[contains(@class, 'mb-')])]"
+FORM_LABEL_XPATH = f".//label[{_has_class('form-label')}]"
+
+
+def inner_text(element: Optional[HtmlElement]) -> Optional[str]:
+    # approximates the browser's innerText: collapses whitespace and breaks lines on block elements
+    if element is None:
+        return None
+
+    parts = []
+
+    def add_text(text: Optional[str]) -> None:
+        if text:
+            parts.append(WHITESPACE_RE.sub(" ", text))
+
+    def walk(node: HtmlElement) -> None:
+        if not isinstance(node.tag, str) or node.tag in SKIP_TAGS:
+            return
+        is_block = node.tag in BLOCK_TAGS
+        if is_block:
+            parts.append("\n")
+        add_text(node.text)
+        for child in node:
+            walk(child)
+            add_text(child.tail)
+        if is_block:
+            parts.append("\n")
+
+    walk(element)
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    text = "\n".join(line for line in lines if line)
+    return text or None
+
+
+def _first(root: HtmlElement, xpath: str, **variables) -> Optional[HtmlElement]:
+    found = root.xpath(xpath, **variables)
+    return found[0] if found else None
+
+
+def _label_for(root: HtmlElement, element_id: Optional[str]) -> Optional[HtmlElement]:
+    if not element_id:
+        return None
+    return _first(root, ".//label[@for=$element_id]", element_id=element_id)
+
+
+def parse_job_details(page_source: str, external_id: int, link: str) -> Dict[str, Any]:
+    root = lxml_html.fromstring(page_source)
+
+    title = inner_text(_first(root, TITLE_XPATH))
+    job_desc = inner_text(_first(root, DESCRIPTION_XPATH))
+    company = inner_text(_first(root, COMPANY_XPATH))
+
+    if not (title and job_desc and company):
+        return {
+            "external_id": external_id,
+            "link": link,
+            "error": ScrapeError.MISSING_ELEMENT
+        }
+
+    return {
+        "external_id": external_id,
+        "title": title,
+        "company": company,
+        "description": job_desc,
+        "link": link,
+    }
+
+
+def build_form_snapshot(page_source: str) -> Optional[List[Dict[str, Any]]]:
+    root = lxml_html.fromstring(page_source)
+    form = _first(root, "//*[@id='apply_form']")
+    if form is None:
+        return None
+
+    blocks = []
+    for block in form.xpath(QUESTION_BLOCK_XPATH):
+        radio_groups = []
+        for label in block.xpath(FORM_LABEL_XPATH):
+            container = label.getparent()
+            radio_groups.append({
+                "id": label.get("for"),
+                "question": inner_text(label) or "",
+                "options": [{
+                    "text": inner_text(_label_for(container, radio.get("id"))),
+                    "value": radio.get("value"),
+                } for radio in container.xpath(".//input[@type='radio']") if radio.get("id")],
+            })
+
+        blocks.append({
+            "textareas": [{
+                "id": ta.get("id"),
+                "label": inner_text(_label_for(block, ta.get("id"))),
+            } for ta in block.xpath(".//textarea")],
+            "has_radio": bool(block.xpath(".//input[@type='radio']")),
+            "radio_groups": radio_groups,
+            "numbers": [{
+                "id": number.get("id"),
+                "label": inner_text(_label_for(block, number.get("id"))),
+            } for number in block.xpath(".//input[@type='number']")],
+        })
+    return blocks
+
+
+def _parse_text_fields(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "external_field_id": ta["id"],
+        "question": ta["label"],
+        "answer_type": FormFieldType.TEXT,
+        "answer_options": None,
+    } for ta in block["textareas"]]
+
+
+def _parse_radio_fields(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "external_field_id": group["id"],
+        "question": group["question"],
+        "answer_type": FormFieldType.RADIO,
+        "answer_options": group["options"],
+    } for group in block["radio_groups"] if group["options"]]
+
+
+def _parse_numeric_fields(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{
+        "external_field_id": number["id"],
+        "question": number["label"],
+        "answer_type": FormFieldType.NUMBER,
+        "answer_options": None,
+    } for number in block["numbers"] if number["id"]]
+
+
+def _parse_question_block(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if block["textareas"]:
+        return _parse_text_fields(block)
+    if block["has_radio"]:
+        return _parse_radio_fields(block)
+    if block["numbers"]:
+        return _parse_numeric_fields(block)
+    return []
+
+
+def parse_form_snapshot(blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    scraped_fields = []
+    for block in blocks:
+        scraped_fields.extend(_parse_question_block(block))
+    return scraped_fields
+
+
+def parse_job_form_fields(page_source: str, external_id: int, link: str) -> List[Dict[str, Any]]:
+    blocks = build_form_snapshot(page_source)
+    if blocks is None:
+        return [{
+            "external_id": external_id,
+            "link": link,
+            "error": ScrapeError.MISSING_ELEMENT,
+        }]
+    return parse_form_snapshot(blocks)
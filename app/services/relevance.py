@@ -0,0 +1,151 @@
+# app/services/relevance.py
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.decorators import DAOError
+from app.core.enums import JobStatus
+from app.core.logger import setup_logger
+
+
+TOKEN_RE = re.compile(r"[^\W_][\w+#]*")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to we will with you your
+""".split())
+
+# jobs with details but no answers yet; rejecting them before form scraping saves the page load as well
+PREFILTER_STATUSES = (JobStatus.SCRAPED_DETAILS, JobStatus.FORM_FIELDS_SCRAPED)
+
+logger = setup_logger(__name__)
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def count_documents(corpus: Sequence[Tuple[str, str]]) -> Tuple[Counter, int]:
+    document_frequency = Counter()
+    for title, description in corpus:
+        document_frequency.update(set(tokenize(title or "")) | set(tokenize(description or "")))
+    return document_frequency, len(corpus)
+
+
+def _weigh(term_counts: Counter, idf: Dict[str, float]) -> Dict[str, float]:
+    # sublinear tf keeps a description that repeats one buzzword from dominating
+    vector = {term: (1 + math.log(count)) * idf[term] for term, count in term_counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+
+class RelevanceScorer:
+    def __init__(self, cv_text: str, title_weight: int = 2):
+        self.cv_terms = Counter(tokenize(cv_text))
+        self.title_weight = title_weight
+        self.idf: Dict[str, float] = {}
+
+
+    def _job_terms(self, title: str, description: str) -> Counter:
+        terms = Counter(tokenize(description))
+        for term in tokenize(title):
+            terms[term] += self.title_weight
+        return terms
+
+
+    def fit(self, corpus: Sequence[Tuple[str, str]]) -> "RelevanceScorer":
+        return self.fit_frequencies(*count_documents(corpus))
+
+
+    def fit_frequencies(self, document_frequency: Counter, documents: int) -> "RelevanceScorer":
+        # scores are compared to an absolute threshold, so the idf has to come from a corpus that
+        # does not depend on which jobs happen to be scored together
+        document_frequency = document_frequency + Counter(self.cv_terms.keys())
+        documents += 1
+        self.idf = {
+            term: math.log((1 + documents) / (1 + frequency)) + 1
+            for term, frequency in document_frequency.items()
+        }
+        return self
+
+
+    def score_many(self, jobs: Sequence[Tuple[str, str]]) -> List[float]:
+        if not self.idf:
+            self.fit(jobs)
+        # terms the corpus has never seen are as rare as terms can get
+        rarest = max(self.idf.values(), default=1.0)
+        job_terms = [self._job_terms(title or "", description or "") for title, description in jobs]
+        idf = {**{term: rarest for terms in job_terms for term in terms}, **self.idf}
+
+        cv_vector = _weigh(self.cv_terms, idf)
+        scores = []
+        for terms in job_terms:
+            job_vector = _weigh(terms, idf)
+            scores.append(sum(weight * cv_vector.get(term, 0.0) for term, weight in job_vector.items()))
+        return scores
+
+
+# rescanning every stored listing per scoring batch grows quadratically with the backlog; document
+# frequencies move slowly, so each process keeps them and reloads them every refresh interval
+class CorpusStatsCache:
+    def __init__(self,
+                refresh_seconds: float = settings.relevance_idf_refresh_minutes * 60,
+                clock: Callable[[], float] = time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self._stats: Optional[Tuple[Counter, int]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+
+    def get(self, dao: Any) -> Optional[Tuple[Counter, int]]:
+        with self._lock:
+            if self._stats is not None and self.clock() - self._loaded_at < self.refresh_seconds:
+                return self._stats
+
+            try:
+                corpus = dao.get_job_texts()
+            except DAOError as e:
+                # a failed reload keeps serving the previous frequencies
+                logger.error(f"[CorpusLoadFailed] {e}")
+                return self._stats
+            if not corpus:
+                return self._stats
+            self._stats = count_documents(corpus)
+            self._loaded_at = self.clock()
+            logger.info(f"[CorpusLoaded] Document frequencies of {self._stats[1]} listings.")
+            return self._stats
+
+
+corpus_stats = CorpusStatsCache()
+
+
+def prefilter_jobs(dao: Any, cv_text: str, min_score: float = settings.relevance_min_score,
+                   stats_cache: CorpusStatsCache = corpus_stats) -> int:
+    # the prefilter only saves work further down, a database error must not stop the stage calling it
+    try:
+        job_details = dao.get_unscored_job_details(PREFILTER_STATUSES)
+        if not job_details:
+            return 0
+
+        # every stored listing counts towards the idf, not just the ones scored in this run
+        stats = stats_cache.get(dao)
+        if stats is None:
+            logger.error("[PrefilterFailed] Could not load the job corpus.")
+            return 0
+
+        scores = RelevanceScorer(cv_text).fit_frequencies(*stats).score_many(
+            [(details.title, details.description) for details in job_details]
+        )
+        rejected = dao.save_relevance_scores(
+            {details.id: score for details, score in zip(job_details, scores)},
+            reject_below=min_score,
+            statuses=PREFILTER_STATUSES,
+        )
+    except DAOError as e:
+        logger.error(f"[PrefilterFailed] {e}")
+        return 0
+    return len(rejected)
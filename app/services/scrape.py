@@ -1,21 +1,29 @@
 # app/services/scrape.py
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.remote.webelement import WebElement
-from typing import Iterator, Dict, Any, List, Optional
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from queue import Queue
+from typing import Callable, Iterable, Iterator, Dict, Any, List, Optional, Sequence
 
 from app.repositories.job_dao import JobDAO
+from app.repositories.page_archive_dao import PageArchiveDAO
+from app.repositories.seen_job_cache import SeenJobCache
+from app.services.driver_pool import DriverPool, build_chrome_options
+from app.services.parse import parse_job_details, parse_job_form_fields, parse_form_snapshot
 from app.core.database import SessionLocal
 from app.core.logger import setup_logger
 from app.core.config import settings
-from app.core.enums import ScrapeError, JobStatus, FormFieldType
+from app.core.enums import ScrapeError, JobStatus, ParseBackend
 from app.core.enums import APIStatus
-from app.schemas.job import JobStubCreate, JobDetailsCreate, JobFormFieldCreate
+from app.schemas.job import JobResponse, JobStubCreate, JobDetailsCreate, JobFormFieldCreate
+
+
+logger = setup_logger(__name__)
 
 
 class Scrape:
@@ -25,21 +33,20 @@ class Scrape:
                 profile_name: str = settings.profile_name,
                 driver_path: str = settings.driver_path,
                 teardown: bool = False,
-                driver: webdriver.Chrome = None):
+                driver: webdriver.Chrome = None,
+                parse_backend: ParseBackend = settings.scrape_parse_backend,
+                archive: Optional[PageArchiveDAO] = None,
+                archive_max_age: Optional[timedelta] = timedelta(hours=settings.page_archive_max_age_hours)):
         self.teardown = teardown
+        self.parse_backend = parse_backend
+        self.archive = archive
+        self.archive_max_age = archive_max_age
         self.logger = setup_logger(__name__)
 
         if driver is not None:
             self.driver = driver
         else:
-            opts = Options()
-            opts.binary_location = chrome_binary
-            opts.add_argument(f"--user-data-dir={profile_dir}")
-            opts.add_argument(f"--profile-directory={profile_name}")
-            opts.add_argument("--no-sandbox")
-            opts.add_argument("--disable-dev-shm-usage")
-            opts.add_experimental_option("detach", True)
-
+            opts = build_chrome_options(chrome_binary, profile_dir, profile_name, detach=True)
             svc = Service(driver_path)
             self.driver = webdriver.Chrome(service=svc, options=opts)
 
@@ -63,6 +70,18 @@ class Scrape:
         return self.driver.find_elements(*args, **kwargs)
 
 
+    def get_archived_page(self, external_id: int) -> Optional[str]:
+        if self.archive is None:
+            return None
+        page_source = self.archive.get_latest_page(external_id=external_id, max_age=self.archive_max_age)
+        return page_source if isinstance(page_source, str) else None
+
+
+    def archive_page(self, external_id: int) -> None:
+        if self.archive is not None:
+            self.archive.save_page(external_id=external_id, page_source=self.driver.page_source)
+
+
 class ScrapeJobStub(Scrape):
     def __init__(self, driver: Optional[webdriver.Chrome] = None, teardown: bool = False):
         super().__init__(driver=driver, teardown=teardown)
@@ -70,7 +89,10 @@ class ScrapeJobStub(Scrape):
 
     def get_external_job_ids(self, url: str) -> List[int]:
         self.open(url)
+        return self._read_job_ids()
+
 
+    def _read_job_ids(self) -> List[int]:
         self.wait.until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.list-jobs li[id^='job-item-']"))
         )
@@ -112,7 +134,19 @@ class ScrapeJobStub(Scrape):
             return 1
 
 
-    def iter_job_ids(self, url: str) -> Iterator[int]:
+    def iter_job_ids(self,
+                    url: str,
+                    drivers: Optional[Sequence[webdriver.Chrome]] = None,
+                    filter_unseen: Optional[Callable[[List[int]], List[int]]] = None,
+                    stop_after_known_pages: int = settings.crawl_stop_after_known_pages) -> Iterator[int]:
+        if filter_unseen is not None:
+            yield from self._iter_job_ids_incremental(url, filter_unseen, stop_after_known_pages)
+            return
+
+        if drivers:
+            yield from self._iter_job_ids_parallel(url, drivers)
+            return
+
         total_pages = self.get_total_pages(url)
 
         for page in range(1, total_pages + 1):
@@ -121,16 +155,99 @@ class ScrapeJobStub(Scrape):
             yield from external_job_ids
 
 
+    def _iter_job_ids_incremental(self,
+                                  url: str,
+                                  filter_unseen: Callable[[List[int]], List[int]],
+                                  stop_after_known_pages: int) -> Iterator[int]:
+        total_pages = self.get_total_pages(url)
+
+        known_pages = 0
+        for page in range(1, total_pages + 1):
+            if page == 1:
+                # page 1 is already loaded by get_total_pages, read it from the current DOM
+                external_job_ids = self._read_job_ids()
+            else:
+                external_job_ids = self.get_external_job_ids(f"{url}?page={page}")
+            if not external_job_ids:
+                continue
+
+            unseen_job_ids = filter_unseen(external_job_ids)
+            yield from unseen_job_ids
+
+            if unseen_job_ids:
+                known_pages = 0
+                continue
+
+            known_pages += 1
+            if known_pages >= stop_after_known_pages:
+                self.logger.info(
+                    f"[Early Stop] {known_pages} consecutive known pages, stopped at page {page} of {total_pages}."
+                )
+                return
+
+
+    def _iter_job_ids_parallel(self, url: str, drivers: Sequence[webdriver.Chrome]) -> Iterator[int]:
+        total_pages = self.get_total_pages(url)
+
+        # page 1 is already loaded by get_total_pages, read it from the current DOM
+        yield from self._read_job_ids()
+        if total_pages < 2:
+            return
+
+        idle_scrapers = Queue()
+        idle_scrapers.put(self)
+        for driver in drivers:
+            idle_scrapers.put(ScrapeJobStub(driver=driver))
+
+        def fetch_page(page: int) -> List[int]:
+            scraper = idle_scrapers.get()
+            try:
+                return scraper.get_external_job_ids(f"{url}?page={page}")
+            except TimeoutException:
+                self.logger.warning(f"[Timeout] Skipping dashboard page {page}.")
+                return []
+            finally:
+                idle_scrapers.put(scraper)
+
+        executor = ThreadPoolExecutor(max_workers=idle_scrapers.qsize())
+        try:
+            futures = [executor.submit(fetch_page, page) for page in range(2, total_pages + 1)]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
 class ScrapeJobDetails(Scrape):
-    def __init__(self, driver: Optional[webdriver.Chrome] = None, teardown: bool = False):
-        super().__init__(driver=driver, teardown=teardown)
+    def __init__(self,
+                driver: Optional[webdriver.Chrome] = None,
+                teardown: bool = False,
+                parse_backend: ParseBackend = settings.scrape_parse_backend,
+                archive: Optional[PageArchiveDAO] = None):
+        super().__init__(driver=driver, teardown=teardown, parse_backend=parse_backend, archive=archive)
 
 
     def scrape_job_details(self, external_id: int) -> Dict[str, Any]:
         link = f"{settings.djinni_base_url}/jobs/{external_id}"
+        archived = self.get_archived_page(external_id)
+        if archived is not None:
+            return parse_job_details(archived, external_id, link)
+
         self.open(link)
+        job_data = self._extract_job_details(external_id, link)
+        if "error" not in job_data:
+            self.archive_page(external_id)
+        return job_data
+
 
+    def _extract_job_details(self, external_id: int, link: str) -> Dict[str, Any]:
         try:
+            if self.parse_backend == ParseBackend.HTML:
+                self.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-post__description"))
+                )
+                return parse_job_details(self.driver.page_source, external_id, link)
+
             title = self.wait.until(
                 EC.visibility_of_element_located(
                     (By.CSS_SELECTOR, "h1.d-flex.align-items-center.flex-wrap > span")
@@ -165,206 +282,233 @@ class ScrapeJobDetails(Scrape):
             }
 
 
-class ScrapeFormField(Scrape):
-    def __init__(self, driver: Optional[webdriver.Chrome] = None, teardown: bool = False):
-        super().__init__(driver=driver, teardown=teardown)
-
-
-    def _parse_text_fields(self, form: WebElement) -> List[Dict[str, Any]]:
-        text_fields = []
-        try:
-            for ta in form.find_elements(By.TAG_NAME, "textarea"):
-                label_text = None 
-                ta_id = ta.get_attribute("id")
-
-                if ta_id:
-                    try:
-                        ta_label = form.find_element(By.CSS_SELECTOR, f"label[for='{ta_id}']")
-                        if ta_label:
-                            raw = ta_label.get_attribute("innerText")
-                            label_text = raw.strip() if raw else None
-                    except NoSuchElementException:
-                        pass 
-
-                text_fields.append ({
-                    "external_field_id": ta_id,
-                    "question": label_text,
-                    "answer_type": FormFieldType.TEXT,
-                    "answer_options": None,
-                })
-        
-            return text_fields
-
-        except NoSuchElementException:
-            return []
-
-
-    def _parse_radio_fields(self, form: WebElement) -> List[Dict[str, Any]]:
-        try:
-            radio_fields = []
-
-            labels = form.find_elements(By.CSS_SELECTOR, 'label.form-label')
-            for label in labels:
-                container = label.find_element(By.XPATH, './..')
-                radios = container.find_elements(By.CSS_SELECTOR, 'input[type="radio"]')
-
-                radio_buttons = []
-                for r in radios:
-                    r_id = r.get_attribute("id")
-                    r_value = r.get_attribute("value")
-
-                    if r_id:
-                        r_label_text = None
-                        try:
-                            r_label = container.find_element(By.CSS_SELECTOR, f"label[for='{r_id}']")
-                            if r_label:
-                                raw = r_label.get_attribute("innerText")
-                                r_label_text = raw.strip() if raw else None
+# serializes every leaf question block of #apply_form in a single chromedriver round trip
+FORM_SNAPSHOT_SCRIPT = """
+const form = arguments[0];
+const textOf = (el) => {
+    if (!el) return null;
+    const text = (el.innerText || "").trim();
+    return text || null;
+};
+const labelFor = (root, id) => id ? root.querySelector(`label[for="${CSS.escape(id)}"]`) : null;
+
+return Array.from(form.querySelectorAll("div[class*='mb-']"))
+    .filter((block) => !block.querySelector("div[class*='mb-']"))
+    .map((block) => ({
+        textareas: Array.from(block.querySelectorAll("textarea")).map((ta) => ({
+            id: ta.getAttribute("id"),
+            label: textOf(labelFor(block, ta.getAttribute("id"))),
+        })),
+        has_radio: block.querySelector("input[type='radio']") !== null,
+        radio_groups: Array.from(block.querySelectorAll("label.form-label")).map((label) => {
+            const container = label.parentElement;
+            return {
+                id: label.getAttribute("for"),
+                question: (label.innerText || "").trim(),
+                options: Array.from(container.querySelectorAll("input[type='radio']"))
+                    .filter((radio) => radio.getAttribute("id"))
+                    .map((radio) => ({
+                        text: textOf(labelFor(container, radio.getAttribute("id"))),
+                        value: radio.getAttribute("value"),
+                    })),
+            };
+        }),
+        numbers: Array.from(block.querySelectorAll("input[type='number']")).map((input) => ({
+            id: input.getAttribute("id"),
+            label: textOf(labelFor(block, input.getAttribute("id"))),
+        })),
+    }));
+"""
 
-                            radio_buttons.append({"text": r_label_text, "value": r_value})
-                        
-                        except NoSuchElementException:
-                            radio_buttons.append({"text": None, "value": r_value})
 
-                question = label.get_attribute("innerText").strip()
-                external_field_id = label.get_attribute("for")
+class ScrapeFormField(Scrape):
+    def __init__(self,
+                driver: Optional[webdriver.Chrome] = None,
+                teardown: bool = False,
+                parse_backend: ParseBackend = settings.scrape_parse_backend,
+                archive: Optional[PageArchiveDAO] = None):
+        super().__init__(driver=driver, teardown=teardown, parse_backend=parse_backend, archive=archive)
 
-                if radio_buttons:
-                    radio_fields.append({
-                        "external_field_id": external_field_id,
-                        "question": question,
-                        "answer_type": FormFieldType.RADIO,
-                        "answer_options": radio_buttons
-                    })
 
-            return radio_fields
+    def scrape_job_form_field(self, external_id: int) -> List[Dict[str, Any]]:
+        link = f"{settings.djinni_base_url}/jobs/{external_id}"
+        archived = self.get_archived_page(external_id)
+        if archived is not None:
+            return parse_job_form_fields(archived, external_id, link)
 
-        except NoSuchElementException:
-            return []
+        self.open(link)
+        field_data = self._extract_job_form_fields(external_id, link)
+        if not (field_data and "error" in field_data[0]):
+            self.archive_page(external_id)
+        return field_data
 
 
-    def _parse_numeric_fields(self, form: WebElement) -> List[Dict[str, Any]]:
+    def _extract_job_form_fields(self, external_id: int, link: str) -> List[Dict[str, Any]]:
         try:
-            numeric_fields = []
-            
-            number_inputs = form.find_elements(By.CSS_SELECTOR, 'input[type="number"]')
+            form = self.wait.until(EC.presence_of_element_located((By.ID, "apply_form")))
+            if self.parse_backend == ParseBackend.HTML:
+                return parse_job_form_fields(self.driver.page_source, external_id, link)
 
-            for number_input in number_inputs:
-                external_field_id = number_input.get_attribute("id")
-                label_text = None
+            blocks = self.driver.execute_script(FORM_SNAPSHOT_SCRIPT, form)
+            return parse_form_snapshot(blocks or [])
 
-                if external_field_id:
-                    try:
-                        label = form.find_element(By.CSS_SELECTOR, f"label[for='{external_field_id}']")
-                        label_text = label.get_attribute("innerText").strip()
-                    except NoSuchElementException:
-                        pass
+        except TimeoutException:
+            return [{
+                "external_id": external_id,
+                "link": link,
+                "error": ScrapeError.TIMEOUT,
+            }]
 
-                    numeric_fields.append({
-                        "external_field_id": external_field_id,
-                        "question": label_text, 
-                        "answer_type": FormFieldType.NUMBER,
-                        "answer_options": None,
-                    })
 
-            return numeric_fields
+class ScrapeJobPage(ScrapeJobDetails, ScrapeFormField):
+    def __init__(self,
+                driver: Optional[webdriver.Chrome] = None,
+                teardown: bool = False,
+                parse_backend: ParseBackend = settings.scrape_parse_backend,
+                archive: Optional[PageArchiveDAO] = None):
+        super().__init__(driver=driver, teardown=teardown, parse_backend=parse_backend, archive=archive)
+
 
-        except NoSuchElementException:
-            return []
+    def scrape_job_page(self, external_id: int) -> Dict[str, Any]:
+        link = f"{settings.djinni_base_url}/jobs/{external_id}"
+        archived = self.get_archived_page(external_id)
+        if archived is not None:
+            return {
+                "details": parse_job_details(archived, external_id, link),
+                "form_fields": parse_job_form_fields(archived, external_id, link),
+            }
 
+        self.open(link)
 
-    def _parse_question_block(self, block: WebElement) -> List[Dict[str, Any]]:
-        try:
-            block.find_element(By.TAG_NAME, "textarea")
-            return self._parse_text_fields(block)
-        except NoSuchElementException:
-            pass 
-        try:
-            block.find_element(By.CSS_SELECTOR, 'input[type="radio"]')
-            return self._parse_radio_fields(block)
-        except NoSuchElementException:
-            pass
-        try:
-            block.find_element(By.CSS_SELECTOR, 'input[type="number"]')
-            return self._parse_numeric_fields(block)
-        except NoSuchElementException:
-            pass
-        return []
+        details = self._extract_job_details(external_id, link)
+        if "error" in details:
+            return {"details": details, "form_fields": []}
+
+        field_data = self._extract_job_form_fields(external_id, link)
+        if not (field_data and "error" in field_data[0]):
+            self.archive_page(external_id)
+
+        return {
+            "details": details,
+            "form_fields": field_data,
+        }
+
+
+def save_crawled_stubs(dao: JobDAO, external_ids: Iterable[int], chunk_size: int = 500) -> List[JobResponse]:
+    # the crawl is consumed here rather than inside the DAO, so a driver error is not logged as a
+    # database error and the chunks saved before it are still reported to the caller
+    results, chunk = [], []
+    try:
+        for external_id in external_ids:
+            chunk.append(JobStubCreate(external_id=external_id))
+            if len(chunk) >= chunk_size:
+                results.extend(dao.save_job_stubs_bulk(chunk, chunk_size=chunk_size))
+                chunk = []
+    except WebDriverException as e:
+        logger.error(
+            f"[CrawlInterrupted] {type(e).__name__}: {e}; keeping the {len(results) + len(chunk)} job ids found so far."
+        )
+    if chunk:
+        results.extend(dao.save_job_stubs_bulk(chunk, chunk_size=chunk_size))
+    return results
+
+
+def process_job_page(dao: JobDAO, bot: ScrapeJobPage, external_id: int) -> JobStatus:
+    # returns the stage the job was moved to, so the caller knows which queue picks it up next
+    page_data = bot.scrape_job_page(external_id)
+    job_data = page_data["details"]
+    field_data = page_data["form_fields"]
+
+    if "error" in job_data:
+        bot.logger.warning(f"Skipping job {external_id} due to scrape error: {job_data['error']}")
+        dao.update_job_status(
+            external_id=external_id,
+            new_status=JobStatus.SCRAPING_DETAILS_FAILED
+        )
+        return JobStatus.SCRAPING_DETAILS_FAILED
+    if field_data and "error" in field_data[0]:
+        bot.logger.warning(f"Saving only details of job {external_id} due to scrape error: {field_data[0]['error']}")
+        dao.save_job_details(JobDetailsCreate(**job_data))
+        return JobStatus.SCRAPED_DETAILS
+
+    dao.save_job_page(
+        job_details=JobDetailsCreate(**job_data),
+        fields_data=[JobFormFieldCreate(**f) for f in field_data]
+    )
+    return JobStatus.FORM_FIELDS_SCRAPED
+
+
+def process_job_details(dao: JobDAO, bot: ScrapeJobDetails, external_id: int) -> None:
+    job_data = bot.scrape_job_details(external_id)
+    if "error" not in job_data:
+        dao.save_job_details(JobDetailsCreate(**job_data))
+    else:
+        bot.logger.warning(f"Skipping job {external_id} due to scrape error: {job_data['error']}")
+        dao.update_job_status(
+            external_id=external_id,
+            new_status=JobStatus.SCRAPING_DETAILS_FAILED
+        )
 
 
-    def scrape_job_form_field(self, external_id: int) -> List[Dict[str, Any]]:
-        link = f"{settings.djinni_base_url}/jobs/{external_id}"
-        self.open(link)
-        
-        scraped_fields = []
-        try:
-            form = self.wait.until(EC.presence_of_element_located((By.ID, "apply_form")))
-            
-            question_blocks = form.find_elements(By.XPATH, ".//div[contains(@class, 'mb-')][not(.//div[contains(@class, 'mb-')])]")
+def process_job_form_fields(dao: JobDAO, bot: ScrapeFormField, external_id: int) -> None:
+    field_data = bot.scrape_job_form_field(external_id)
+    has_error = field_data and "error" in field_data[0]
+    if not has_error:
+        fields_pydantic = [JobFormFieldCreate(**f) for f in field_data]
+        dao.save_job_form_fields(external_id=external_id, fields_data=fields_pydantic)
+    else:
+        bot.logger.warning(f"Skipping job {external_id} due to scrape error: {field_data[0]['error']}")
+        dao.update_job_status(
+            external_id=external_id,
+            new_status=JobStatus.SCRAPING_FORM_FIELDS_FAILED
+        )
 
-            for block in question_blocks:
-                field_data = self._parse_question_block(block)
-                if field_data:
-                    scraped_fields.extend(field_data)
 
-            return scraped_fields
+def process_jobs_form_fields(dao: JobDAO, bot: ScrapeFormField, external_ids: List[int]) -> None:
+    fields_by_external_id = {}
+    for external_id in external_ids:
+        field_data = bot.scrape_job_form_field(external_id)
+        if field_data and "error" in field_data[0]:
+            bot.logger.warning(f"Skipping job {external_id} due to scrape error: {field_data[0]['error']}")
+            dao.update_job_status(
+                external_id=external_id,
+                new_status=JobStatus.SCRAPING_FORM_FIELDS_FAILED
+            )
+            continue
+        fields_by_external_id[external_id] = [JobFormFieldCreate(**f) for f in field_data]
 
-        except TimeoutException:
-            return [{
-                "external_id": external_id,
-                "link": link,
-                "error": ScrapeError.TIMEOUT,
-            }]
+    # every scraped job is written in one transaction; jobs whose fields did not change keep their answers
+    if fields_by_external_id:
+        dao.save_job_form_fields_bulk(fields_by_external_id)
 
 
 if __name__ == "__main__":
     logger = setup_logger(__name__)
     dao = JobDAO(session=SessionLocal)
-
-    with ScrapeJobStub() as scrape_job_stub_bot:
-        # save id of all jobs in dashboard
-        for external_id in scrape_job_stub_bot.iter_job_ids(f"{settings.djinni_base_url}/my/dashboard/"):
-            print(external_id)
-            dao.save_job_stub(JobStubCreate(external_id=external_id))
-
-    # with ScrapeJobDetails() as scrape_job_details_bot:
-    #     # scrape job details
-    #     job_info = dao.claim_job_for_processing(
-    #         current_status=JobStatus.SAVED_ID,
-    #         new_status=JobStatus.SCRAPING_DETAILS
-    #     )
-    #     if job_info.status == APIStatus.CLAIMED:
-    #         external_id = job_info.external_id
-    #         job_data = scrape_job_details_bot.scrape_job_details(external_id)
-    #         if "error" not in job_data:
-    #             dao.save_job_details(JobDetailsCreate(**job_data))
-    #         else:
-    #             logger.warning(f"Skipping job {external_id} due to scrape error: {job_data['error']}")
-    #             dao.update_job_status(
-    #                 external_id=external_id,
-    #                 new_status=JobStatus.SCRAPING_DETAILS_FAILED
-    #             )
-    #     elif job_info.status == APIStatus.NOT_FOUND:
-    #         logger.info("No jobs details left to scrape.")
-
-    # with ScrapeFormField() as scrape_form_field_bot:
-    #     # scrape job form field
-    #     job_info = dao.claim_job_for_processing(
-    #         current_status=JobStatus.SCRAPED_DETAILS,
-    #         new_status=JobStatus.SCRAPING_FORM_FIELDS
-    #     )
-    #     if job_info.status == APIStatus.CLAIMED:
-    #         external_id = job_info.external_id
-    #         field_data = scrape_form_field_bot.scrape_job_form_field(external_id)
-    #         has_error = field_data and "error" in field_data[0]
-    #         if not has_error:
-    #             fields_pydantic = [JobFormFieldCreate(**f) for f in field_data]
-    #             dao.save_job_form_fields(external_id=external_id, fields_data=fields_pydantic)
-    #         else:
-    #             logger.warning(f"Skipping job {external_id} due to scrape error: {field_data[0]['error']}")
-    #             dao.update_job_status(
-    #                 external_id=external_id,
-    #                 new_status=JobStatus.SCRAPING_FORM_FIELDS_FAILED
-    #             )
-    #     elif job_info.status == APIStatus.NOT_FOUND:
-    #         logger.info("No jobs left to scrape for form fields.")
+    archive = PageArchiveDAO(session=SessionLocal)
+    seen_jobs = SeenJobCache()
+    seen_jobs.ensure_warm(dao)
+
+    with DriverPool() as pool:
+        with pool.lease() as driver, pool.lease_many(pool.size - 1) as crawl_drivers:
+            with ScrapeJobStub(driver=driver) as scrape_job_stub_bot:
+                # save id of all jobs in dashboard, skipping the ones redis has already seen
+                results = save_crawled_stubs(dao, seen_jobs.iter_unseen(
+                    scrape_job_stub_bot.iter_job_ids(
+                        f"{settings.djinni_base_url}/my/dashboard/",
+                        drivers=crawl_drivers,
+                    )
+                ))
+                seen_jobs.mark_seen(result.external_id for result in results)
+
+        with pool.lease() as driver, ScrapeJobPage(driver=driver, archive=archive) as scrape_job_page_bot:
+            # scrape job details and form fields from a single page visit
+            claims = dao.claim_jobs_for_processing(
+                current_status=JobStatus.SAVED_ID,
+                new_status=JobStatus.SCRAPING_DETAILS
+            )
+            if not claims:
+                logger.info("No job pages left to scrape.")
+
+            for job_info in claims:
+                process_job_page(dao, scrape_job_page_bot, job_info.external_id)
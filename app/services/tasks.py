@@ -0,0 +1,210 @@
+# app/services/tasks.py
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.core.celery_app import celery
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, reset_engine_pool
+from app.core.decorators import DAOError
+from app.core.enums import APIStatus, JobStatus
+from app.core.logger import setup_logger
+from app.repositories.job_dao import JobDAO
+from app.repositories.page_archive_dao import PageArchiveDAO
+from app.repositories.seen_job_cache import SeenJobCache
+from app.services.analyze import (
+    AnalysisEngine, AsyncGenAIClient, CachedCVProvider, PromptFactory, process_jobs_form_answers
+)
+from app.services.driver_pool import DriverPool
+from app.services.llm_cache import build_response_cache
+from app.services.answer_index import AnswerIndex
+from app.services.relevance import prefilter_jobs
+from app.services.scrape import (
+    ScrapeJobStub, ScrapeJobDetails, ScrapeFormField, ScrapeJobPage,
+    process_job_page, process_job_details, process_jobs_form_fields, save_crawled_stubs
+)
+
+
+logger = setup_logger(__name__)
+dao = JobDAO(session=SessionLocal)
+archive = PageArchiveDAO(session=SessionLocal)
+seen_jobs = SeenJobCache()
+cv_provider = CachedCVProvider()
+
+# per worker process, created on first use so the parent never launches chrome before forking
+_driver_pool: Optional[DriverPool] = None
+_analysis_engine: Optional[AnalysisEngine] = None
+
+
+def get_driver_pool() -> DriverPool:
+    global _driver_pool
+    if _driver_pool is None:
+        _driver_pool = DriverPool()
+    return _driver_pool
+
+
+def get_analysis_engine() -> AnalysisEngine:
+    global _analysis_engine
+    if _analysis_engine is None:
+        _analysis_engine = AnalysisEngine(
+            PromptFactory(),
+            AsyncGenAIClient(cache=build_response_cache()),
+            answer_index=AnswerIndex.from_dao(dao),
+        )
+    return _analysis_engine
+
+
+@worker_process_init.connect
+def init_db_pool(**kwargs):
+    reset_engine_pool()
+
+
+@worker_process_shutdown.connect
+def close_driver_pool(**kwargs):
+    global _driver_pool
+    if _driver_pool is not None:
+        _driver_pool.close()
+        _driver_pool = None
+
+
+@worker_process_shutdown.connect
+def close_db_pool(**kwargs):
+    engine.dispose()
+
+
+# collection DAO methods raise DAOError on database failures, the task is retried rather than reporting nothing to do
+DB_RETRY = dict(autoretry_for=(DAOError,), retry_backoff=True, max_retries=settings.task_db_max_retries)
+
+
+def _claim(current_status: JobStatus, new_status: JobStatus, limit: int) -> list:
+    return dao.claim_jobs_for_processing(current_status=current_status, new_status=new_status, limit=limit)
+
+
+def _prefilter() -> None:
+    if settings.relevance_min_score > 0:
+        rejected = prefilter_jobs(dao, cv_provider.get_cv_text(settings.cv_path))
+        if rejected:
+            logger.info(f"[Prefiltered] {rejected} low-relevance jobs rejected before analysis.")
+
+
+@celery.task(**DB_RETRY)
+def discover_job_stubs(url: Optional[str] = None, full_crawl: bool = False) -> int:
+    url = url or f"{settings.djinni_base_url}/my/dashboard/"
+    pool = get_driver_pool()
+    seen_jobs.ensure_warm(dao)
+
+    if full_crawl:
+        with pool.lease() as driver, pool.lease_many(pool.size - 1) as crawl_drivers:
+            with ScrapeJobStub(driver=driver) as scrape_job_stub_bot:
+                results = save_crawled_stubs(dao, seen_jobs.iter_unseen(
+                    scrape_job_stub_bot.iter_job_ids(url, drivers=crawl_drivers)
+                ))
+    else:
+        # new listings show up first, so stop once the dashboard only shows known jobs
+        with pool.lease() as driver, ScrapeJobStub(driver=driver) as scrape_job_stub_bot:
+            results = save_crawled_stubs(dao, scrape_job_stub_bot.iter_job_ids(
+                url, filter_unseen=lambda external_ids: seen_jobs.filter_unseen(external_ids, dao=dao)
+            ))
+
+    seen_jobs.mark_seen(result.external_id for result in results)
+
+    created = sum(1 for result in results if result.status == APIStatus.JOB_STUB_CREATED)
+    if created:
+        scrape_job_pages.delay()
+    return created
+
+
+@celery.task(**DB_RETRY)
+def scrape_job_pages(limit: Optional[int] = None) -> int:
+    limit = limit or settings.task_batch_size
+    claims = _claim(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS, limit)
+    if not claims:
+        logger.info("No job pages left to scrape.")
+        return 0
+
+    with get_driver_pool().lease() as driver, ScrapeJobPage(driver=driver, archive=archive) as scrape_job_page_bot:
+        statuses = {process_job_page(dao, scrape_job_page_bot, job_info.external_id) for job_info in claims}
+
+    # keep draining while full batches come back, and hand the scraped jobs to the next queues;
+    # jobs whose form could not be read retry it through the form field stage
+    if len(claims) == limit:
+        scrape_job_pages.delay(limit)
+    if JobStatus.SCRAPED_DETAILS in statuses:
+        scrape_job_form_fields.delay()
+    if JobStatus.FORM_FIELDS_SCRAPED in statuses:
+        analyze_job_form_fields.delay()
+    return len(claims)
+
+
+@celery.task(**DB_RETRY)
+def scrape_job_details(limit: Optional[int] = None) -> int:
+    limit = limit or settings.task_batch_size
+    claims = _claim(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS, limit)
+    if not claims:
+        logger.info("No jobs details left to scrape.")
+        return 0
+
+    with get_driver_pool().lease() as driver, ScrapeJobDetails(driver=driver, archive=archive) as scrape_job_details_bot:
+        for job_info in claims:
+            process_job_details(dao, scrape_job_details_bot, job_info.external_id)
+
+    if len(claims) == limit:
+        scrape_job_details.delay(limit)
+    scrape_job_form_fields.delay()
+    return len(claims)
+
+
+@celery.task(**DB_RETRY)
+def scrape_job_form_fields(limit: Optional[int] = None) -> int:
+    limit = limit or settings.task_batch_size
+    _prefilter()
+    claims = _claim(JobStatus.SCRAPED_DETAILS, JobStatus.SCRAPING_FORM_FIELDS, limit)
+    if not claims:
+        logger.info("No jobs left to scrape for form fields.")
+        return 0
+
+    with get_driver_pool().lease() as driver, ScrapeFormField(driver=driver, archive=archive) as scrape_form_field_bot:
+        process_jobs_form_fields(dao, scrape_form_field_bot, [job_info.external_id for job_info in claims])
+
+    if len(claims) == limit:
+        scrape_job_form_fields.delay(limit)
+    analyze_job_form_fields.delay()
+    return len(claims)
+
+
+@celery.task(**DB_RETRY)
+def analyze_job_form_fields(limit: Optional[int] = None) -> int:
+    limit = limit or settings.task_batch_size
+    _prefilter()
+    claims = _claim(JobStatus.FORM_FIELDS_SCRAPED, JobStatus.ANALYZING_FORM_FIELDS, limit)
+    if not claims:
+        logger.info("No jobs left to analyze.")
+        return 0
+
+    engine = get_analysis_engine()
+    # the cached document carries its token count, so budgeting never re-measures the CV
+    cv = cv_provider.get_document(settings.cv_path)
+    process_jobs_form_answers(dao, engine, cv.text, claims, cv_tokens=cv.token_count)
+
+    if len(claims) == limit:
+        analyze_job_form_fields.delay(limit)
+    return len(claims)
+
+
+@celery.task(**DB_RETRY)
+def release_stale_claims() -> int:
+    # jobs left in an in-progress status by a crashed worker go back to the status they were claimed from
+    stages = (
+        (JobStatus.SCRAPING_DETAILS, JobStatus.SAVED_ID, scrape_job_pages),
+        (JobStatus.SCRAPING_FORM_FIELDS, JobStatus.SCRAPED_DETAILS, scrape_job_form_fields),
+        (JobStatus.ANALYZING_FORM_FIELDS, JobStatus.FORM_FIELDS_SCRAPED, analyze_job_form_fields),
+    )
+    claimed_before = datetime.now(timezone.utc) - timedelta(minutes=settings.claim_timeout_minutes)
+
+    total = 0
+    for claimed_status, previous_status, stage in stages:
+        released = dao.release_stale_claims(claimed_status, previous_status, claimed_before=claimed_before)
+        if released:
+            stage.delay()
+            total += len(released)
+    return total
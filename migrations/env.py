@@ -0,0 +1,60 @@
+# migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models import job, page  # noqa: F401 - registers tables on Base.metadata
+
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    # app loggers created before the migration run must keep working
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def _configure(connection=None, url=None) -> None:
+    context.configure(
+        connection=connection,
+        url=url,
+        target_metadata=target_metadata,
+        compare_type=True,
+        # autocommit_block (CREATE INDEX CONCURRENTLY) then only ends the transaction of its own revision
+        transaction_per_migration=True,
+        # sqlite can only alter tables by copying them
+        render_as_batch=(connection.dialect.name if connection is not None else url.split(":", 1)[0]) == "sqlite",
+        literal_binds=connection is None,
+    )
+
+
+def run_migrations_offline() -> None:
+    _configure(url=config.get_main_option("sqlalchemy.url") or settings.database_url)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # callers such as init_db and the tests may hand over an open connection
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_engine(config.get_main_option("sqlalchemy.url") or settings.database_url, poolclass=NullPool)
+    with engine.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
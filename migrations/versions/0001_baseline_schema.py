@@ -0,0 +1,70 @@
+"""baseline schema
+
+The schema the original create_all based init_db produced.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 03:27:36.883708
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_stubs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.Enum('djinni', 'linked_in', name='jobsource', native_enum=False), nullable=True),
+    sa.Column('external_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('saved_id', 'saving_id_failed', 'scraping_details', 'details_scraped', 'scraping_details_failed', 'scraping_form_fields', 'form_fields_scraped', 'scraping_form_fields_failed', 'analyzing_details', 'analyzed_details', 'analyzing_details_failed', 'analyzing_form_fields', 'analyzed_form_fields', 'analyzing_form_fields_failed', 'answering_form_fields', 'answered_form_fields', 'answering_form_fields_failed', 'applying', 'applied', 'apply_failed', 'job_expired', 'rejected', 'needs_manual_review', name='jobstatus', native_enum=False), nullable=True),
+    sa.Column('found_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source', 'external_id', name='uq_job_source_external')
+    )
+    op.create_index(op.f('ix_job_stubs_external_id'), 'job_stubs', ['external_id'], unique=False)
+    op.create_index(op.f('ix_job_stubs_id'), 'job_stubs', ['id'], unique=False)
+
+    op.create_table('job_details',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('company', sa.String(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('link', sa.String(), nullable=True),
+    sa.Column('scraped_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['id'], ['job_stubs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('link')
+    )
+    op.create_table('job_form_field',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('external_field_id', sa.String(), nullable=False),
+    sa.Column('question', sa.String(), nullable=False),
+    sa.Column('answer_type', sa.Enum('skill_input', 'text', 'radio', 'number', name='formfieldtype', native_enum=False), nullable=True),
+    sa.Column('answer_options', sa.JSON(), nullable=True),
+    sa.Column('answer', sa.Text(), nullable=True),
+    sa.Column('scraped_at', sa.DateTime(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['job_stubs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_form_field_id'), 'job_form_field', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_form_field_id'), table_name='job_form_field')
+
+    op.drop_table('job_form_field')
+    op.drop_table('job_details')
+    op.drop_index(op.f('ix_job_stubs_id'), table_name='job_stubs')
+    op.drop_index(op.f('ix_job_stubs_external_id'), table_name='job_stubs')
+
+    op.drop_table('job_stubs')
@@ -0,0 +1,46 @@
+"""page archive tables
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 14:02:11.408512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('page_blobs',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('encoding', sa.String(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
+    op.create_table('page_fetches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.Enum('djinni', 'linked_in', name='jobsource', native_enum=False), nullable=True),
+    sa.Column('external_id', sa.Integer(), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['content_hash'], ['page_blobs.content_hash'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_page_fetches_id'), 'page_fetches', ['id'], unique=False)
+    op.create_index('ix_page_fetches_lookup', 'page_fetches', ['source', 'external_id', 'fetched_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_page_fetches_lookup', table_name='page_fetches')
+    op.drop_index(op.f('ix_page_fetches_id'), table_name='page_fetches')
+    op.drop_table('page_fetches')
+    op.drop_table('page_blobs')
@@ -0,0 +1,26 @@
+"""job details relevance score
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 14:05:37.190284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_details', sa.Column('relevance_score', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_details') as batch_op:
+        batch_op.drop_column('relevance_score')
@@ -0,0 +1,28 @@
+"""job stubs status found_at index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 03:27:50.558063
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.migration_ops import create_index_concurrently, drop_index_concurrently
+
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # claims filter job_stubs by status and take the oldest found_at first; built without blocking them
+    create_index_concurrently('ix_job_stubs_status_found_at', 'job_stubs', ['status', 'found_at'], unique=False)
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_job_stubs_status_found_at', 'job_stubs')
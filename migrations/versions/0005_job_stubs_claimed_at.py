@@ -0,0 +1,26 @@
+"""job stubs claimed at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 15:11:48.302957
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_stubs', sa.Column('claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_stubs') as batch_op:
+        batch_op.drop_column('claimed_at')
@@ -0,0 +1,26 @@
+"""job form field answer source
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 16:24:05.671390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_form_field', sa.Column('answer_source', sa.Enum('model', 'index', name='answersource', native_enum=False), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_form_field') as batch_op:
+        batch_op.drop_column('answer_source')
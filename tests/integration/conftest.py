@@ -4,6 +4,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.database import Base
 from app.repositories.job_dao import JobDAO
+from app.repositories.page_archive_dao import PageArchiveDAO
 
 
 @pytest.fixture(scope="session")
@@ -23,16 +24,23 @@ def db_session(engine):
     connection = engine.connect()
     transaction = connection.begin()
 
-    SessionLocal = sessionmaker(bind=connection)
+    SessionLocal = sessionmaker(bind=connection, expire_on_commit=False)
     session = SessionLocal()
 
     yield session
 
     session.close()
-    transaction.rollback()
+    # a rolled back unit of work already ended the outer transaction
+    if transaction.is_active:
+        transaction.rollback()
     connection.close()
 
 
 @pytest.fixture
 def job_dao(db_session):
     return JobDAO(session=lambda: db_session)
+
+
+@pytest.fixture
+def page_archive_dao(db_session):
+    return PageArchiveDAO(session=lambda: db_session)
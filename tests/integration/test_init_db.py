@@ -0,0 +1,112 @@
+# tests/integration/test_init_db.py
+import sqlalchemy as sa
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database import Base
+from app.core.types import StringEnum
+from app.core.enums import JobStatus, JobSource, FormFieldType
+from app.scripts.init_db import detect_schema_revision, init_db
+
+
+def _head_revision(url: str) -> str:
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+
+
+def _original_metadata() -> sa.MetaData:
+    # the tables the first create_all based init_db created, before any of the later model changes
+    metadata = sa.MetaData()
+    sa.Table(
+        "job_stubs", metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("source", StringEnum(JobSource, nullable=False)),
+        sa.Column("external_id", sa.Integer, nullable=False, index=True),
+        sa.Column("status", StringEnum(JobStatus, nullable=False)),
+        sa.Column("found_at", sa.DateTime, nullable=False),
+        sa.UniqueConstraint("source", "external_id", name="uq_job_source_external"),
+    )
+    sa.Table(
+        "job_details", metadata,
+        sa.Column("id", sa.Integer, sa.ForeignKey("job_stubs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("title", sa.String),
+        sa.Column("company", sa.String),
+        sa.Column("description", sa.Text),
+        sa.Column("link", sa.String, unique=True),
+        sa.Column("scraped_at", sa.DateTime, nullable=True),
+    )
+    sa.Table(
+        "job_form_field", metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("job_id", sa.Integer, sa.ForeignKey("job_stubs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("external_field_id", sa.String, nullable=False),
+        sa.Column("question", sa.String, nullable=False),
+        sa.Column("answer_type", StringEnum(FormFieldType, nullable=False)),
+        sa.Column("answer_options", sa.JSON, nullable=True),
+        sa.Column("answer", sa.Text, nullable=True),
+        sa.Column("scraped_at", sa.DateTime, nullable=True),
+        sa.Column("sent_at", sa.DateTime, nullable=True),
+    )
+    return metadata
+
+
+def _create_original_schema(url: str) -> None:
+    legacy = create_engine(url)
+    _original_metadata().create_all(bind=legacy)
+    with legacy.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO job_stubs (id, source, external_id, status, found_at) "
+            "VALUES (1, 'djinni', 100, 'details_scraped', '2026-01-01 00:00:00')"
+        ))
+        connection.execute(text("INSERT INTO job_details (id, title) VALUES (1, 'Python Developer')"))
+
+
+def test_init_db_creates_schema(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite3'}"
+
+    init_db(url)
+
+    assert _head_revision(url) == "0006"
+    assert {"job_stubs", "job_details", "job_form_field", "page_blobs", "page_fetches"} <= set(
+        inspect(create_engine(url)).get_table_names()
+    )
+
+
+def test_init_db_adopts_original_schema(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite3'}"
+    _create_original_schema(url)
+
+    init_db(url)
+    init_db(url)
+
+    assert _head_revision(url) == "0006"
+    schema = inspect(create_engine(url))
+    assert {"page_blobs", "page_fetches"} <= set(schema.get_table_names())
+    assert "relevance_score" in {column["name"] for column in schema.get_columns("job_details")}
+    assert "ix_job_stubs_status_found_at" in {index["name"] for index in schema.get_indexes("job_stubs")}
+    with create_engine(url).connect() as connection:
+        assert connection.execute(text("SELECT title FROM job_details")).scalar_one() == "Python Developer"
+
+
+def test_init_db_adopts_schema_with_page_archive(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite3'}"
+    _create_original_schema(url)
+    # a database created by create_all once the page archive existed, but before relevance scores
+    Base.metadata.create_all(bind=create_engine(url), tables=[
+        Base.metadata.tables["page_blobs"], Base.metadata.tables["page_fetches"]
+    ])
+    assert detect_schema_revision(inspect(create_engine(url))) == "0002"
+
+    init_db(url)
+
+    assert _head_revision(url) == "0006"
+    assert "relevance_score" in {column["name"] for column in inspect(create_engine(url)).get_columns("job_details")}
+
+
+def test_detect_schema_revision_of_current_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.sqlite3'}")
+    assert detect_schema_revision(inspect(engine)) is None
+
+    Base.metadata.create_all(bind=engine)
+
+    assert detect_schema_revision(inspect(engine)) == "0006"
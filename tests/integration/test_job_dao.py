@@ -2,9 +2,11 @@
 import pytest
 from datetime import datetime, timezone
 from typing import List
+from sqlalchemy.exc import OperationalError
 
 from app.models.job import JobStub, JobDetails, JobFormField
-from app.core.enums import JobStatus, APIStatus, FormFieldType
+from app.core.decorators import DAOError
+from app.core.enums import JobStatus, APIStatus, APIError, FormFieldType, JobSource, AnswerSource
 from app.schemas.job import JobStubCreate, JobDetailsCreate, JobFormFieldCreate, AnswerOption
 
 
@@ -32,6 +34,32 @@ def test_duplicate_job_stub(job_dao, db_session):
     assert db_session.query(JobStub).count() == 1
 
 
+def test_save_job_stubs_bulk(job_dao, db_session):
+    existing = job_dao.save_job_stub(job_data=JobStubCreate(external_id=2))
+
+    jobs_data = [JobStubCreate(external_id=external_id) for external_id in (1, 2, 3, 3)]
+    result = job_dao.save_job_stubs_bulk(jobs_data, chunk_size=2)
+
+    statuses = {item.external_id: item.status for item in result}
+    assert statuses == {
+        1: APIStatus.JOB_STUB_CREATED,
+        2: APIStatus.DUPLICATE,
+        3: APIStatus.JOB_STUB_CREATED,
+    }
+    duplicate = next(item for item in result if item.status == APIStatus.DUPLICATE)
+    assert duplicate.id == existing.id
+    assert all(item.id is not None for item in result)
+
+    assert db_session.query(JobStub).count() == 3
+    assert db_session.query(JobStub).filter_by(status=JobStatus.SAVED_ID).count() == 3
+
+
+def test_save_job_stubs_bulk_empty(job_dao, db_session):
+    result = job_dao.save_job_stubs_bulk([])
+    assert result == []
+    assert db_session.query(JobStub).count() == 0
+
+
 def test_save_job_details(job_dao, db_session):
     job_data = JobStubCreate(external_id=1)
     job_details = JobDetailsCreate(
@@ -128,6 +156,32 @@ def test_claim_job_skips_wrong_status(job_dao, db_session):
     assert job.status == JobStatus.SCRAPED_DETAILS
 
 
+def test_claim_jobs_for_processing_batch(job_dao, db_session):
+    for external_id in (1, 2, 3):
+        job_dao.save_job_stub(job_data=JobStubCreate(external_id=external_id))
+
+    result = job_dao.claim_jobs_for_processing(
+        current_status=JobStatus.SAVED_ID,
+        new_status=JobStatus.SCRAPING_DETAILS,
+        limit=2
+    )
+    assert len(result) == 2
+    assert all(claim.status == APIStatus.CLAIMED for claim in result)
+
+    claimed_ids = {claim.external_id for claim in result}
+    claimed = db_session.query(JobStub).filter_by(status=JobStatus.SCRAPING_DETAILS).all()
+    assert {job.external_id for job in claimed} == claimed_ids
+    assert db_session.query(JobStub).filter_by(status=JobStatus.SAVED_ID).count() == 1
+
+
+def test_claim_jobs_for_processing_none_available(job_dao, db_session):
+    result = job_dao.claim_jobs_for_processing(
+        current_status=JobStatus.SAVED_ID,
+        new_status=JobStatus.SCRAPING_DETAILS
+    )
+    assert result == []
+
+
 @pytest.fixture
 def saved_job_stub(job_dao, db_session) -> JobStub:
     external_id = 999
@@ -236,3 +290,281 @@ def test_save_job_form_fields_empty_list(job_dao, db_session, saved_job_stub: Jo
 
     final_job_state = db_session.query(JobStub).filter_by(id=job_id).one()
     assert final_job_state.status == JobStatus.FORM_FIELDS_SCRAPED
+
+
+def test_save_job_form_fields_bulk(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=external_id) for external_id in (1, 2)])
+
+    results = job_dao.save_job_form_fields_bulk({1: MOCK_FIELDS_DATA, 2: MOCK_FIELDS_DATA[:1], 404: MOCK_FIELDS_DATA})
+
+    assert [(result.external_id, result.status) for result in results] == [
+        (1, APIStatus.JOB_FORM_FIELDS_CREATED),
+        (2, APIStatus.JOB_FORM_FIELDS_CREATED),
+        (404, APIStatus.NOT_FOUND),
+    ]
+    fields_by_job = {
+        job.external_id: sorted(field.external_field_id for field in job.fields)
+        for job in db_session.query(JobStub).all()
+    }
+    assert fields_by_job == {1: ["answer_boolean_3", "answer_text_1"], 2: ["answer_text_1"]}
+    assert {job.status for job in db_session.query(JobStub).all()} == {JobStatus.FORM_FIELDS_SCRAPED}
+
+
+def test_save_job_form_fields_bulk_skips_unchanged(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=external_id) for external_id in (1, 2)])
+    job_dao.save_job_form_fields_bulk({1: MOCK_FIELDS_DATA, 2: MOCK_FIELDS_DATA})
+    job_ids = {job.external_id: job.id for job in db_session.query(JobStub).all()}
+    for job_id in job_ids.values():
+        job_dao.save_form_answers(job_id=job_id, answers_by_field_id={"answer_text_1": "B2"})
+
+    changed_fields = [MOCK_FIELDS_DATA[0].model_copy(update={"question": "What is your German level?"})]
+    results = job_dao.save_job_form_fields_bulk({1: list(reversed(MOCK_FIELDS_DATA)), 2: changed_fields})
+
+    assert [result.status for result in results] == [
+        APIStatus.JOB_FORM_FIELDS_UNCHANGED,
+        APIStatus.JOB_FORM_FIELDS_CREATED,
+    ]
+    db_session.expire_all()
+    unchanged = db_session.query(JobFormField).filter_by(job_id=job_ids[1], external_field_id="answer_text_1").one()
+    assert unchanged.answer == "B2"
+    replaced = db_session.query(JobFormField).filter_by(job_id=job_ids[2]).all()
+    assert [(field.question, field.answer) for field in replaced] == [("What is your German level?", None)]
+
+
+def test_save_job_form_fields_bulk_empty(job_dao, db_session):
+    assert job_dao.save_job_form_fields_bulk({}) == []
+
+
+def test_save_job_page(job_dao, db_session, saved_job_stub: JobStub):
+    job_details = JobDetailsCreate(
+        external_id=saved_job_stub.external_id,
+        title="test_title",
+        company="test_company",
+        description="test_description",
+        link="test_link"
+    )
+
+    result = job_dao.save_job_page(job_details=job_details, fields_data=MOCK_FIELDS_DATA)
+
+    assert result.status == APIStatus.JOB_PAGE_SAVED
+    assert result.external_id == saved_job_stub.external_id
+    assert result.id == saved_job_stub.id
+
+    job = db_session.query(JobStub).filter_by(id=saved_job_stub.id).one()
+    assert job.details.title == "test_title"
+    assert job.details.scraped_at is not None
+    assert len(job.fields) == 2
+    assert job.status == JobStatus.FORM_FIELDS_SCRAPED
+
+
+def test_save_job_page_not_found(job_dao, db_session):
+    job_details = JobDetailsCreate(
+        external_id=1,
+        title="test_title",
+        company="test_company",
+        description="test_description",
+        link="test_link"
+    )
+
+    result = job_dao.save_job_page(job_details=job_details, fields_data=MOCK_FIELDS_DATA)
+
+    assert result.status == APIStatus.NOT_FOUND
+    assert db_session.query(JobDetails).count() == 0
+    assert db_session.query(JobFormField).count() == 0
+
+
+def test_save_form_answers(job_dao, db_session, saved_job_stub: JobStub):
+    job_dao.save_job_form_fields(saved_job_stub.external_id, MOCK_FIELDS_DATA)
+
+    result = job_dao.save_form_answers(
+        job_id=saved_job_stub.id,
+        answers_by_field_id={"answer_text_1": "B2", "unknown_field": "ignored"}
+    )
+
+    assert result.status == APIStatus.JOB_FORM_ANSWERS_SAVED
+    assert result.id == saved_job_stub.id
+
+    answers = {
+        field.external_field_id: field.answer
+        for field in db_session.query(JobFormField).filter_by(job_id=saved_job_stub.id)
+    }
+    assert answers == {"answer_text_1": "B2", "answer_boolean_3": None}
+
+    job = db_session.query(JobStub).filter_by(id=saved_job_stub.id).one()
+    assert job.status == JobStatus.ANALYZED_FORM_FIELDS
+
+
+def test_save_form_answers_not_found(job_dao, db_session):
+    result = job_dao.save_form_answers(job_id=12345, answers_by_field_id={})
+
+    assert result.status == APIStatus.NOT_FOUND
+    assert result.id == 12345
+
+
+def test_get_external_ids(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([
+        JobStubCreate(external_id=1),
+        JobStubCreate(external_id=2),
+        JobStubCreate(external_id=3, source=JobSource.LINKED_IN),
+    ])
+
+    assert sorted(job_dao.get_external_ids()) == [1, 2]
+    assert job_dao.get_external_ids(source=JobSource.LINKED_IN) == [3]
+
+
+
+def test_filter_unseen_external_ids(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=1), JobStubCreate(external_id=3)])
+
+    assert job_dao.filter_unseen_external_ids([1, 2, 3, 4]) == [2, 4]
+    assert job_dao.filter_unseen_external_ids([1], source=JobSource.LINKED_IN) == [1]
+    assert job_dao.filter_unseen_external_ids([]) == []
+
+
+def test_get_answered_form_fields(job_dao, db_session, saved_job_stub: JobStub):
+    job_dao.save_job_form_fields(saved_job_stub.external_id, MOCK_FIELDS_DATA)
+    job_dao.save_form_answers(job_id=saved_job_stub.id, answers_by_field_id={"answer_boolean_3": "1"})
+
+    answered = job_dao.get_answered_form_fields()
+
+    assert [(field.external_field_id, field.answer) for field in answered] == [("answer_boolean_3", "1")]
+
+
+def test_get_answered_form_fields_skips_index_answers(job_dao, db_session, saved_job_stub: JobStub):
+    job_dao.save_job_form_fields(saved_job_stub.external_id, MOCK_FIELDS_DATA)
+    job_dao.save_form_answers(
+        job_id=saved_job_stub.id,
+        answers_by_field_id={"answer_text_1": "B2", "answer_boolean_3": "1"},
+        reused_field_ids={"answer_text_1"},
+    )
+
+    answered = job_dao.get_answered_form_fields()
+
+    assert [(field.external_field_id, field.answer_source) for field in answered] == [
+        ("answer_boolean_3", AnswerSource.MODEL)
+    ]
+
+
+def test_save_relevance_scores_rejects_low_scorers(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=1), JobStubCreate(external_id=2)])
+    for external_id in (1, 2):
+        job_dao.save_job_details(JobDetailsCreate(
+            external_id=external_id,
+            title=f"title_{external_id}",
+            company="test_company",
+            description="test_description",
+            link=f"test_link_{external_id}"
+        ))
+    ids_by_external_id = {job.external_id: job.id for job in db_session.query(JobStub)}
+    assert len(job_dao.get_unscored_job_details([JobStatus.SCRAPED_DETAILS])) == 2
+
+    rejected = job_dao.save_relevance_scores(
+        {ids_by_external_id[1]: 0.5, ids_by_external_id[2]: 0.01},
+        reject_below=0.05,
+        statuses=[JobStatus.SCRAPED_DETAILS],
+    )
+
+    assert [job.external_id for job in rejected] == [2]
+    statuses = {job.external_id: job.status for job in db_session.query(JobStub)}
+    assert statuses == {1: JobStatus.SCRAPED_DETAILS, 2: JobStatus.REJECTED}
+    assert job_dao.get_unscored_job_details([JobStatus.SCRAPED_DETAILS]) == []
+    # scored jobs stay in the idf corpus
+    assert sorted(job_dao.get_job_texts()) == [("title_1", "test_description"), ("title_2", "test_description")]
+
+
+def test_unit_of_work_commits_once(job_dao, db_session, mocker):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=1), JobStubCreate(external_id=2)])
+    commit = mocker.spy(db_session, "commit")
+
+    with job_dao.unit_of_work() as uow:
+        first = uow.update_job_status(external_id=1, new_status=JobStatus.REJECTED)
+        second = uow.save_job_stub(job_data=JobStubCreate(external_id=3))
+
+    assert commit.call_count == 1
+    assert first.status == APIStatus.JOB_STATUS_UPDATED
+    assert second.status == APIStatus.JOB_STUB_CREATED
+    assert second.id is not None
+    assert db_session.query(JobStub).filter_by(external_id=1).one().status == JobStatus.REJECTED
+    assert db_session.query(JobStub).count() == 3
+
+
+def test_unit_of_work_rolls_back_on_error(job_dao, db_session):
+    with pytest.raises(RuntimeError):
+        with job_dao.unit_of_work() as uow:
+            uow.save_job_stub(job_data=JobStubCreate(external_id=1))
+            raise RuntimeError("boom")
+
+    assert db_session.query(JobStub).count() == 0
+    assert job_dao.active_session is None
+
+
+def test_claim_jobs_for_processing_is_fifo(job_dao, db_session):
+    for external_id, day in ((1, 3), (2, 1), (3, 2)):
+        db_session.add(JobStub(
+            external_id=external_id,
+            status=JobStatus.SAVED_ID,
+            found_at=datetime(2026, 1, day, tzinfo=timezone.utc)
+        ))
+    db_session.commit()
+
+    claimed = job_dao.claim_jobs_for_processing(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS, limit=2)
+    single = job_dao.claim_job_for_processing(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS)
+
+    assert sorted(job.external_id for job in claimed) == [2, 3]
+    assert single.external_id == 1
+
+
+@pytest.mark.parametrize("call", [
+    lambda dao: dao.claim_jobs_for_processing(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS),
+    lambda dao: dao.save_job_stubs_bulk([JobStubCreate(external_id=1)]),
+    lambda dao: dao.save_job_form_fields_bulk({1: MOCK_FIELDS_DATA}),
+    lambda dao: dao.get_unscored_job_details([JobStatus.SCRAPED_DETAILS]),
+    lambda dao: dao.get_answered_form_fields(),
+    lambda dao: dao.get_external_ids(),
+    lambda dao: dao.filter_unseen_external_ids([1, 2]),
+])
+def test_collection_methods_raise_on_db_error(job_dao, db_session, mocker, call):
+    for method in ("execute", "scalars", "query"):
+        mocker.patch.object(db_session, method, side_effect=OperationalError("stmt", {}, Exception("db down")))
+
+    with pytest.raises(DAOError) as exc_info:
+        call(job_dao)
+    assert exc_info.value.error == APIError.DB
+
+
+def test_single_row_methods_return_error_response_on_db_error(job_dao, db_session, mocker):
+    mocker.patch.object(db_session, "execute", side_effect=OperationalError("stmt", {}, Exception("db down")))
+
+    result = job_dao.update_job_status(1, JobStatus.REJECTED)
+    assert result.status == APIStatus.ERROR
+
+
+def test_release_stale_claims(job_dao, db_session):
+    now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    db_session.add_all([
+        JobStub(external_id=1, status=JobStatus.SCRAPING_DETAILS, found_at=now, claimed_at=datetime(2026, 1, 1, 10)),
+        JobStub(external_id=2, status=JobStatus.SCRAPING_DETAILS, found_at=now, claimed_at=datetime(2026, 1, 1, 12)),
+        JobStub(external_id=3, status=JobStatus.SCRAPING_DETAILS, found_at=now, claimed_at=None),
+        JobStub(external_id=4, status=JobStatus.ANALYZING_FORM_FIELDS, found_at=now, claimed_at=datetime(2026, 1, 1, 10)),
+    ])
+    db_session.commit()
+
+    released = job_dao.release_stale_claims(
+        JobStatus.SCRAPING_DETAILS, JobStatus.SAVED_ID, claimed_before=datetime(2026, 1, 1, 11)
+    )
+
+    assert sorted(result.external_id for result in released) == [1, 3]
+    statuses = {job.external_id: (job.status, job.claimed_at) for job in db_session.query(JobStub).all()}
+    assert statuses[1] == (JobStatus.SAVED_ID, None)
+    assert statuses[2] == (JobStatus.SCRAPING_DETAILS, datetime(2026, 1, 1, 12))
+    assert statuses[4][0] == JobStatus.ANALYZING_FORM_FIELDS
+
+
+def test_claim_records_claimed_at(job_dao, db_session):
+    job_dao.save_job_stubs_bulk([JobStubCreate(external_id=1), JobStubCreate(external_id=2)])
+
+    job_dao.claim_jobs_for_processing(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS, limit=1)
+    job_dao.claim_job_for_processing(JobStatus.SAVED_ID, JobStatus.SCRAPING_DETAILS)
+
+    db_session.expire_all()
+    assert all(job.claimed_at is not None for job in db_session.query(JobStub).all())
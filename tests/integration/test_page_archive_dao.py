@@ -0,0 +1,54 @@
+# tests/integration/test_page_archive_dao.py
+from datetime import timedelta
+
+from app.models.page import PageBlob, PageFetch
+from app.core.enums import APIStatus, JobSource
+
+
+PAGE_V1 = "<html><body><h1>Senior Python Developer</h1></body></html>"
+PAGE_V2 = "<html><body><h1>Lead Python Developer</h1></body></html>"
+
+
+def test_save_page_deduplicates_content(page_archive_dao, db_session):
+    first = page_archive_dao.save_page(external_id=1, page_source=PAGE_V1)
+    second = page_archive_dao.save_page(external_id=1, page_source=PAGE_V1)
+
+    assert first.status == APIStatus.PAGE_ARCHIVED
+    assert second.status == APIStatus.PAGE_ARCHIVED
+    assert first.id != second.id
+
+    assert db_session.query(PageFetch).count() == 2
+    assert db_session.query(PageBlob).count() == 1
+
+    blob = db_session.query(PageBlob).one()
+    assert blob.size == len(PAGE_V1.encode("utf-8"))
+    assert len(blob.data) > 0
+
+
+def test_get_latest_page(page_archive_dao, db_session):
+    page_archive_dao.save_page(external_id=1, page_source=PAGE_V1)
+    page_archive_dao.save_page(external_id=1, page_source=PAGE_V2)
+
+    assert page_archive_dao.get_latest_page(external_id=1) == PAGE_V2
+    assert page_archive_dao.get_latest_page(external_id=2) is None
+    assert page_archive_dao.get_latest_page(external_id=1, source=JobSource.LINKED_IN) is None
+
+
+def test_get_latest_page_respects_max_age(page_archive_dao, db_session):
+    page_archive_dao.save_page(external_id=1, page_source=PAGE_V1)
+
+    fetch = db_session.query(PageFetch).one()
+    fetch.fetched_at = fetch.fetched_at - timedelta(days=2)
+    db_session.commit()
+
+    assert page_archive_dao.get_latest_page(external_id=1, max_age=timedelta(days=1)) is None
+    assert page_archive_dao.get_latest_page(external_id=1) == PAGE_V1
+
+
+def test_get_latest_pages(page_archive_dao, db_session):
+    page_archive_dao.save_page(external_id=1, page_source=PAGE_V1)
+    page_archive_dao.save_page(external_id=1, page_source=PAGE_V2)
+    page_archive_dao.save_page(external_id=2, page_source=PAGE_V1)
+
+    assert page_archive_dao.get_latest_pages() == {1: PAGE_V2, 2: PAGE_V1}
+    assert page_archive_dao.get_latest_pages(external_ids=[2]) == {2: PAGE_V1}
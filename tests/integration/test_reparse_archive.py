@@ -0,0 +1,52 @@
+# tests/integration/test_reparse_archive.py
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.core.enums import JobStatus
+from app.models.job import JobFormField, JobStub
+from app.schemas.job import JobDetailsCreate, JobFormFieldCreate, JobStubCreate
+from app.scripts.reparse_archive import reparse_archive
+from app.services.parse import parse_job_details, parse_job_form_fields
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+EXTERNAL_ID = 4242
+
+
+@pytest.fixture
+def analyzed_job(job_dao, page_archive_dao, db_session) -> JobStub:
+    page_source = (FIXTURES_DIR / "djinni_job_page.html").read_text()
+    link = f"{settings.djinni_base_url}/jobs/{EXTERNAL_ID}"
+    job_dao.save_job_stub(JobStubCreate(external_id=EXTERNAL_ID))
+    fields_data = [JobFormFieldCreate(**f) for f in parse_job_form_fields(page_source, EXTERNAL_ID, link)]
+    job_dao.save_job_page(
+        job_details=JobDetailsCreate(**parse_job_details(page_source, EXTERNAL_ID, link)),
+        fields_data=fields_data,
+    )
+    job = db_session.query(JobStub).filter_by(external_id=EXTERNAL_ID).one()
+    job_dao.save_form_answers(
+        job_id=job.id,
+        answers_by_field_id={field.external_field_id: "answer" for field in fields_data},
+    )
+    page_archive_dao.save_page(external_id=EXTERNAL_ID, page_source=page_source)
+    return job
+
+
+def test_reparse_keeps_answers_and_status_of_analyzed_job(job_dao, page_archive_dao, db_session, analyzed_job):
+    assert reparse_archive(job_dao, page_archive_dao) == 1
+
+    job = db_session.query(JobStub).filter_by(external_id=EXTERNAL_ID).one()
+    assert job.status == JobStatus.ANALYZED_FORM_FIELDS
+    fields = db_session.query(JobFormField).filter_by(job_id=job.id).all()
+    assert fields and all(field.answer == "answer" for field in fields)
+
+
+def test_reparse_with_reset_rebuilds_form_fields(job_dao, page_archive_dao, db_session, analyzed_job):
+    assert reparse_archive(job_dao, page_archive_dao, reset=True) == 1
+
+    job = db_session.query(JobStub).filter_by(external_id=EXTERNAL_ID).one()
+    assert job.status == JobStatus.FORM_FIELDS_SCRAPED
+    fields = db_session.query(JobFormField).filter_by(job_id=job.id).all()
+    assert fields and all(field.answer is None for field in fields)
@@ -0,0 +1,615 @@
+import asyncio
+import httpx
+import json
+import pytest
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
+from google.genai import errors, types
+from sqlalchemy.exc import OperationalError
+
+from app.services.analyze import (
+    AnalysisEngine, AsyncGenAIClient, CachedCVProvider, FormAnswers, IncompleteOutputError, PromptFactory,
+    normalize_cv_text, process_jobs_form_answers
+)
+from app.services.answer_index import AnswerIndex
+from app.core.enums import APIStatus, FormFieldType, JobStatus
+
+
+@pytest.fixture
+def job_details():
+    return SimpleNamespace(title="Python Developer", company="Acme Corp", description="Build APIs with FastAPI.")
+
+
+@pytest.fixture
+def form_fields():
+    return [
+        SimpleNamespace(
+            external_field_id="answer_text_1",
+            question="What is your English level?",
+            answer_type=FormFieldType.TEXT,
+            answer_options=None,
+        ),
+        SimpleNamespace(
+            external_field_id="answer_boolean_3",
+            question="Do you have FastAPI experience?",
+            answer_type=FormFieldType.RADIO,
+            answer_options=[{"text": "Yes", "value": "1"}, {"text": "No", "value": "0"}],
+        ),
+    ]
+
+
+@pytest.fixture
+def engine():
+    """AnalysisEngine with a mocked model client."""
+    return AnalysisEngine(PromptFactory(), MagicMock())
+
+
+def test_build_form_answer_prompt(job_details, form_fields):
+    prompt = PromptFactory().build_form_answer_prompt("My CV", job_details, form_fields)
+
+    assert prompt.startswith(PromptFactory.FORM_ANSWER_INSTRUCTIONS)
+    assert "CV:\nMy CV" in prompt
+    assert "Title: Python Developer" in prompt
+
+    serialized_fields = json.loads(prompt.split("Form fields:\n", 1)[1])
+    assert [field["id"] for field in serialized_fields] == ["answer_text_1", "answer_boolean_3"]
+    assert serialized_fields[1]["type"] == "radio"
+    assert serialized_fields[1]["options"][0]["value"] == "1"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (
+            {"answers": {"answer_text_1": "B2", "answer_boolean_3": 1}},
+            {"answer_text_1": "B2", "answer_boolean_3": "1"},
+        ),
+        ({"answer_text_1": "B2", "answer_boolean_3": "0"}, {"answer_text_1": "B2", "answer_boolean_3": "0"}),
+    ]
+)
+def test_parse_form_output(engine, form_fields, raw, expected):
+    result = engine._parse_form_output(raw, form_fields)
+
+    assert result.answers_by_field_id == expected
+    assert result.raw == raw
+
+
+@pytest.mark.parametrize("raw", [
+    {"answers": {"answer_text_1": "B2", "answer_boolean_3": None}},
+    {"answers": {"answer_text_1": "B2"}},
+    {"raw_text": "not json"},
+    {"answers": ["B2"]},
+    ["B2"],
+])
+def test_parse_form_output_rejects_unusable_output(engine, form_fields, raw):
+    with pytest.raises(IncompleteOutputError):
+        engine._parse_form_output(raw, form_fields)
+
+
+def test_answer_form_fields(engine, job_details, form_fields):
+    engine.model_client.generate_json.return_value = {"answers": {"answer_text_1": "B2", "answer_boolean_3": "1"}}
+
+    result = engine.answer_form_fields(job_details, form_fields, "My CV")
+
+    engine.model_client.generate_json.assert_called_once()
+    assert result.answers_by_field_id == {"answer_text_1": "B2", "answer_boolean_3": "1"}
+
+
+@pytest.fixture
+def async_client(mocker):
+    """AsyncGenAIClient with the SDK client and rate limiter mocked out."""
+    mocker.patch('app.services.analyze.genai.Client')
+    mocker.patch('app.services.analyze.asyncio.sleep', new=mocker.AsyncMock())
+    client = AsyncGenAIClient(max_concurrency=2, max_retries=2, rate_limiter=MagicMock(acquire=AsyncMock()))
+    client.logger = MagicMock()
+    return client
+
+
+def test_generate_json_async_retries_retryable_errors(async_client):
+    generate = AsyncMock(side_effect=[
+        errors.APIError(429, {"error": {"message": "quota"}}),
+        MagicMock(text='{"answers": {"a": "1"}}'),
+    ])
+    async_client.client.aio.models.generate_content = generate
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"answers": {"a": "1"}}
+    assert generate.await_count == 2
+    assert async_client.rate_limiter.acquire.await_count == 2
+
+
+def test_generate_json_async_retries_resource_exhausted_after_retry_delay(async_client, mocker):
+    sleep = mocker.patch('app.services.analyze.asyncio.sleep', new=AsyncMock())
+    generate = AsyncMock(side_effect=[
+        errors.ClientError(429, {"error": {
+            "message": "quota",
+            "status": "RESOURCE_EXHAUSTED",
+            "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "27s"}],
+        }}),
+        httpx.ReadTimeout("timed out"),
+        MagicMock(text='{"answers": {"a": "1"}}'),
+    ])
+    async_client.client.aio.models.generate_content = generate
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"answers": {"a": "1"}}
+    assert generate.await_count == 3
+    assert sleep.await_args_list[0].args[0] >= 27
+
+
+def test_generate_json_async_gives_up_after_max_retries(async_client):
+    generate = AsyncMock(side_effect=errors.APIError(503, {"error": {"message": "unavailable"}}))
+    async_client.client.aio.models.generate_content = generate
+
+    with pytest.raises(errors.APIError):
+        asyncio.run(async_client.generate_json_async("prompt"))
+    assert generate.await_count == 3
+
+
+def test_generate_json_async_does_not_retry_client_errors(async_client):
+    generate = AsyncMock(side_effect=errors.APIError(400, {"error": {"message": "bad request"}}))
+    async_client.client.aio.models.generate_content = generate
+
+    with pytest.raises(errors.APIError):
+        asyncio.run(async_client.generate_json_async("prompt"))
+    assert generate.await_count == 1
+
+
+def test_generate_json_async_registers_prefix_once(async_client, mocker):
+    mocker.patch('app.services.analyze.settings.gemini_context_cache_min_tokens', 1)
+    create = AsyncMock(return_value=SimpleNamespace(name="cachedContents/cv"))
+    generate = AsyncMock(return_value=MagicMock(text='{"answers": {}}'))
+    async_client.client.aio.caches.create = create
+    async_client.client.aio.models.generate_content = generate
+
+    async def run():
+        await asyncio.gather(*(async_client.generate_json_async(f"job {i}", prefix="CV prefix") for i in range(3)))
+
+    asyncio.run(run())
+
+    assert create.await_count == 1
+    for call in generate.await_args_list:
+        assert call.kwargs["config"].cached_content == "cachedContents/cv"
+        assert "CV prefix" not in call.kwargs["contents"]
+
+
+def test_generate_json_async_sends_prefix_inline_when_caching_fails(async_client, mocker):
+    mocker.patch('app.services.analyze.settings.gemini_context_cache_min_tokens', 1)
+    create = AsyncMock(side_effect=errors.APIError(400, {"error": {"message": "too small"}}))
+    generate = AsyncMock(return_value=MagicMock(text='{"answers": {}}'))
+    async_client.client.aio.caches.create = create
+    async_client.client.aio.models.generate_content = generate
+
+    asyncio.run(async_client.generate_json_async("job", prefix="CV prefix"))
+    asyncio.run(async_client.generate_json_async("job", prefix="CV prefix"))
+
+    assert create.await_count == 1
+    assert generate.await_args.kwargs["contents"] == "CV prefix\n\njob"
+    assert generate.await_args.kwargs["config"].cached_content is None
+
+
+def test_generate_json_async_streams_answers(async_client):
+    async def stream():
+        for chunk in ['```json\n{"answers": {"a": "B2",', ' "b": "1",}}', '\n```']:
+            yield MagicMock(text=chunk)
+
+    async_client.stream = True
+    async_client.client.aio.models.generate_content_stream = AsyncMock(return_value=stream())
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"answers": {"a": "B2", "b": "1"}}
+
+
+def test_generate_json_async_keeps_answers_of_truncated_stream(async_client):
+    async def stream():
+        for chunk in ['{"answers": {"a": "B2", ', '"b": "A cover letter that got cu']:
+            yield MagicMock(text=chunk)
+
+    async_client.stream = True
+    async_client.client.aio.models.generate_content_stream = AsyncMock(return_value=stream())
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"answers": {"a": "B2"}, "partial": True}
+
+
+def test_generate_json_async_marks_output_cut_by_token_cap(async_client):
+    response = MagicMock(text='{"answers": {"a": "B2"}}')
+    response.candidates = [SimpleNamespace(finish_reason=types.FinishReason.MAX_TOKENS)]
+    async_client.client.aio.models.generate_content = AsyncMock(return_value=response)
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"answers": {"a": "B2"}, "partial": True}
+
+
+def test_answer_batch_async_answers_incomplete_section_again(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(side_effect=[
+        {"jobs": {
+            "job_1": {"answers": {"answer_text_1": "B2", "answer_boolean_3": "1"}},
+            "job_2": {"answers": {"answer_text_1": "C1"}},
+        }},
+        {"answers": {"answer_text_1": "C1", "answer_boolean_3": "0"}},
+    ])
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields), (job_details, form_fields)], "My CV", max_batch_jobs=2, max_batch_tokens=100_000
+    ))
+
+    assert [result.answers_by_field_id for result in results] == [
+        {"answer_text_1": "B2", "answer_boolean_3": "1"},
+        {"answer_text_1": "C1", "answer_boolean_3": "0"},
+    ]
+    assert model_client.generate_json_async.await_count == 2
+
+
+def test_truncated_single_job_output_fails_the_job(engine, job_details, form_fields):
+    engine.model_client.generate_json.return_value = {"answers": {"answer_text_1": "B2"}, "partial": True}
+
+    with pytest.raises(IncompleteOutputError):
+        engine.answer_form_fields(job_details, form_fields, "My CV")
+
+
+def test_answer_batch_async_keeps_completed_jobs_of_truncated_stream(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(side_effect=[
+        {"jobs": {"job_1": {"answers": {"answer_text_1": "B2"}}}, "partial": True},
+        {"answers": {"answer_text_1": "C1"}},
+    ])
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV", max_batch_jobs=2, max_batch_tokens=100_000
+    ))
+
+    assert [result.answers_by_field_id for result in results] == [{"answer_text_1": "B2"}, {"answer_text_1": "C1"}]
+    assert model_client.generate_json_async.await_count == 2
+
+
+def test_answer_many_async_collects_failures(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(side_effect=[
+        {"answers": {"answer_text_1": "B2"}},
+        RuntimeError("boom"),
+    ])
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_many_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV"
+    ))
+
+    assert results[0].answers_by_field_id == {"answer_text_1": "B2"}
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_answer_form_fields_reuses_indexed_answers(job_details, form_fields):
+    index = AnswerIndex(min_support=1, min_confidence=1.0)
+    index.add(form_fields[0], "B2")
+    model_client = MagicMock()
+    model_client.generate_json.return_value = {"answers": {"answer_boolean_3": "1"}}
+    engine = AnalysisEngine(PromptFactory(), model_client, answer_index=index)
+
+    result = engine.answer_form_fields(job_details, form_fields, "My CV")
+
+    assert result.answers_by_field_id == {"answer_text_1": "B2", "answer_boolean_3": "1"}
+    prompt = model_client.generate_json.call_args.args[0]
+    assert "answer_boolean_3" in prompt
+    assert "answer_text_1" not in prompt
+
+
+def test_learn_answers_skips_reused_answers(job_details, form_fields):
+    index = AnswerIndex(min_support=1, min_confidence=1.0)
+    index.add(form_fields[0], "B2")
+    model_client = MagicMock()
+    model_client.generate_json.return_value = {"answers": {"answer_boolean_3": "1"}}
+    engine = AnalysisEngine(PromptFactory(), model_client, answer_index=index)
+
+    result = engine.answer_form_fields(job_details, form_fields, "My CV")
+    engine.learn_answers(form_fields, result)
+
+    assert result.reused_field_ids == {"answer_text_1"}
+    assert result.model_answers == {"answer_boolean_3": "1"}
+    assert index.lookup(form_fields[0]) == "B2"
+    assert len(index) == 2
+
+
+def test_answer_form_fields_skips_model_when_all_reused(job_details, form_fields):
+    index = AnswerIndex(min_support=1, min_confidence=1.0)
+    index.add_many(form_fields, {"answer_text_1": "B2", "answer_boolean_3": "1"})
+    model_client = MagicMock()
+    engine = AnalysisEngine(PromptFactory(), model_client, answer_index=index)
+
+    result = engine.answer_form_fields(job_details, form_fields, "My CV")
+
+    assert result.answers_by_field_id == {"answer_text_1": "B2", "answer_boolean_3": "1"}
+    model_client.generate_json.assert_not_called()
+
+
+def test_build_batch_form_answer_prompt_sends_cv_once(job_details, form_fields):
+    prompt = PromptFactory().build_batch_form_answer_prompt(
+        "My CV", [(job_details, form_fields), (job_details, form_fields)]
+    )
+
+    assert prompt.count("My CV") == 1
+    assert "Job key: job_1" in prompt
+    assert "Job key: job_2" in prompt
+
+
+def test_answer_batch_async_splits_output_per_job(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(return_value={"jobs": {
+        "job_1": {"answers": {"answer_text_1": "B2"}},
+        "job_2": {"answers": {"answer_text_1": "C1"}},
+    }})
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV", max_batch_jobs=5
+    ))
+
+    assert [result.answers_by_field_id for result in results] == [{"answer_text_1": "B2"}, {"answer_text_1": "C1"}]
+    assert model_client.generate_json_async.await_count == 1
+
+
+def test_answer_batch_async_falls_back_for_missing_jobs(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(side_effect=[
+        {"jobs": {"job_1": {"answers": {"answer_text_1": "B2"}}, "job_2": "garbled"}},
+        {"answers": {"answer_text_1": "C1"}},
+    ])
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV", max_batch_jobs=5
+    ))
+
+    assert [result.answers_by_field_id for result in results] == [{"answer_text_1": "B2"}, {"answer_text_1": "C1"}]
+    fallback_prefix = model_client.generate_json_async.await_args_list[1].kwargs["prefix"]
+    assert fallback_prefix.startswith(PromptFactory.FORM_ANSWER_INSTRUCTIONS)
+
+
+def test_answer_batch_async_respects_token_cap(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(return_value={"answers": {"answer_text_1": "B2"}})
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV", max_batch_jobs=5, max_batch_tokens=1
+    ))
+
+    assert all(result.answers_by_field_id == {"answer_text_1": "B2"} for result in results)
+    assert model_client.generate_json_async.await_count == 2
+
+
+def test_answer_batch_async_scales_output_cap_with_batch_size(job_details, form_fields, mocker):
+    mocker.patch('app.services.analyze.settings.gemini_max_tokens', 1000)
+    mocker.patch('app.services.analyze.settings.analysis_batch_max_output_tokens', 2500)
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(return_value={"jobs": {
+        f"job_{position}": {"answers": {"answer_text_1": "B2"}} for position in (1, 2, 3)
+    }})
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    asyncio.run(engine.answer_batch_async([(job_details, form_fields[:1])] * 2, "My CV", max_batch_jobs=2))
+    asyncio.run(engine.answer_batch_async([(job_details, form_fields[:1])] * 3, "My CV", max_batch_jobs=3))
+
+    caps = [call.kwargs["max_output_tokens"] for call in model_client.generate_json_async.await_args_list]
+    assert caps == [2000, 2500]
+
+
+def test_answer_batch_async_retries_jobs_of_failed_batch_one_by_one(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(side_effect=[
+        errors.APIError(500, {"error": {"message": "internal"}}),
+        {"answers": {"answer_text_1": "B2"}},
+        RuntimeError("boom"),
+    ])
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    results = asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields[:1]), (job_details, form_fields[:1])], "My CV", max_batch_jobs=2, max_batch_tokens=100_000
+    ))
+
+    assert results[0].answers_by_field_id == {"answer_text_1": "B2"}
+    assert isinstance(results[1], RuntimeError)
+    assert model_client.generate_json_async.await_count == 3
+
+
+def test_async_client_rebuilds_sdk_client_per_event_loop(mocker):
+    client_class = mocker.patch('app.services.analyze.genai.Client')
+    client_class.return_value.aio.models.generate_content = AsyncMock(
+        return_value=MagicMock(text='{"answers": {}}')
+    )
+    async_client = AsyncGenAIClient(rate_limiter=MagicMock(acquire=AsyncMock()))
+
+    asyncio.run(async_client.generate_json_async("first"))
+    asyncio.run(async_client.generate_json_async("second"))
+
+    assert client_class.call_count == 2
+
+
+def test_async_client_keeps_injected_client_across_event_loops():
+    backend = MagicMock()
+    backend.aio.models.generate_content = AsyncMock(return_value=MagicMock(text='{"answers": {}}'))
+    async_client = AsyncGenAIClient(rate_limiter=MagicMock(acquire=AsyncMock()), client=backend)
+
+    asyncio.run(async_client.generate_json_async("first"))
+    asyncio.run(async_client.generate_json_async("second"))
+
+    assert async_client.client is backend
+
+
+@pytest.mark.parametrize("text", ["[1, 2]", '"x"', "123"])
+def test_non_object_json_is_returned_as_raw_text_and_not_cached(async_client, text):
+    async_client.cache = MagicMock()
+    async_client.cache.get.return_value = None
+    async_client.client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text=text))
+
+    result = asyncio.run(async_client.generate_json_async("prompt"))
+
+    assert result == {"raw_text": text}
+    async_client.cache.set.assert_not_called()
+
+
+def test_generate_json_async_applies_output_cap(async_client):
+    generate = AsyncMock(return_value=MagicMock(text='{"answers": {}}'))
+    async_client.client.aio.models.generate_content = generate
+
+    asyncio.run(async_client.generate_json_async("prompt", max_output_tokens=1234))
+
+    assert generate.await_args.kwargs["config"].max_output_tokens == 1234
+    assert async_client.rate_limiter.acquire.await_args.args[0] >= 1234
+
+
+def test_generate_json_async_budgets_with_given_prefix_tokens(async_client):
+    async_client.client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text='{"answers": {}}'))
+
+    asyncio.run(async_client.generate_json_async("job", prefix="CV prefix", max_output_tokens=100, prefix_tokens=5000))
+
+    assert async_client.rate_limiter.acquire.await_args.args[0] == 5000 + 1 + 100
+
+
+def test_answer_batch_async_packs_with_given_cv_tokens(job_details, form_fields):
+    model_client = MagicMock()
+    model_client.generate_json_async = AsyncMock(return_value={"answers": {"answer_text_1": "B2"}})
+    engine = AnalysisEngine(PromptFactory(), model_client)
+
+    asyncio.run(engine.answer_batch_async(
+        [(job_details, form_fields), (job_details, form_fields)], "My CV",
+        max_batch_jobs=5, max_batch_tokens=10_000, cv_tokens=9_990,
+    ))
+
+    assert model_client.generate_json_async.await_count == 2
+    prefix_tokens = model_client.generate_json_async.await_args.kwargs["prefix_tokens"]
+    assert prefix_tokens == PromptFactory().form_answer_prefix_tokens(9_990)
+
+
+def test_normalize_cv_text():
+    assert normalize_cv_text("  Jane   Doe \n\n\n\nPython\tdeveloper  \n") == "Jane Doe\n\nPython developer"
+
+
+def test_cached_cv_provider_parses_once(tmp_path, mocker):
+    cv_file = tmp_path / "cv.txt"
+    cv_file.write_text("Jane Doe\nPython developer", encoding="utf-8")
+    provider = CachedCVProvider()
+    counter = mocker.spy(provider, "token_counter")
+
+    assert provider.get_cv_text(str(cv_file)) == "Jane Doe\nPython developer"
+    assert provider.get_cv_text(str(cv_file)) == "Jane Doe\nPython developer"
+    assert provider.get_document(str(cv_file)).token_count > 0
+    assert counter.call_count == 1
+
+
+def test_cached_cv_provider_reads_docx(tmp_path):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_paragraph("Jane   Doe")
+    document.add_paragraph("Python developer")
+    cv_file = tmp_path / "cv.docx"
+    document.save(str(cv_file))
+
+    assert CachedCVProvider().get_cv_text(str(cv_file)) == "Jane Doe\nPython developer"
+
+
+def test_cached_cv_provider_reads_pdf(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    writer = pypdf.PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    cv_file = tmp_path / "cv.pdf"
+    with open(cv_file, "wb") as f:
+        writer.write(f)
+
+    assert CachedCVProvider().get_cv_text(str(cv_file)) == ""
+
+
+def test_cached_cv_provider_reloads_changed_file(tmp_path):
+    cv_file = tmp_path / "cv.txt"
+    cv_file.write_text("Old CV", encoding="utf-8")
+    provider = CachedCVProvider()
+    provider.get_cv_text(str(cv_file))
+
+    cv_file.write_text("New, longer CV", encoding="utf-8")
+
+    assert provider.get_cv_text(str(cv_file)) == "New, longer CV"
+
+
+def test_cached_cv_provider_dispatches_on_extension(tmp_path, mocker):
+    cv_file = tmp_path / "cv.pdf"
+    cv_file.write_bytes(b"%PDF")
+    mocker.patch.dict("app.services.analyze.CV_READERS", {".pdf": lambda path: "Parsed  PDF"})
+
+    assert CachedCVProvider().get_cv_text(str(cv_file)) == "Parsed PDF"
+
+
+def test_process_jobs_form_answers_writes_batch_in_one_unit_of_work(job_details, form_fields, mocker):
+    mocker.patch('app.services.analyze.settings.analysis_batch_size', 1)
+    dao = MagicMock()
+    uow = dao.unit_of_work.return_value.__enter__.return_value
+    uow.get_job_details.return_value = job_details
+    uow.get_job_form_fields.return_value = form_fields
+    uow.save_form_answers.return_value = SimpleNamespace(status=APIStatus.JOB_FORM_ANSWERS_SAVED)
+    engine = MagicMock()
+    engine.answer_many_async = AsyncMock(return_value=[
+        FormAnswers(answers_by_field_id={"answer_text_1": "B2"}, raw={}),
+        RuntimeError("boom"),
+    ])
+    claims = [SimpleNamespace(id=1, external_id=10), SimpleNamespace(id=2, external_id=20)]
+
+    process_jobs_form_answers(dao, engine, "My CV", claims)
+
+    assert dao.unit_of_work.call_count == 2
+    uow.save_form_answers.assert_called_once_with(
+        job_id=1, answers_by_field_id={"answer_text_1": "B2"}, reused_field_ids=set()
+    )
+    uow.update_job_status.assert_called_once_with(
+        external_id=20, new_status=JobStatus.ANALYZING_FORM_FIELDS_FAILED
+    )
+    engine.learn_answers.assert_called_once()
+
+
+def test_process_jobs_form_answers_falls_back_to_per_job_writes(job_details, form_fields, mocker):
+    mocker.patch('app.services.analyze.settings.analysis_batch_size', 1)
+    dao = MagicMock()
+    uow = MagicMock()
+    uow.get_job_details.return_value = job_details
+    uow.get_job_form_fields.return_value = form_fields
+    uow.save_form_answers.side_effect = OperationalError("stmt", {}, Exception("bad row"))
+    dao.unit_of_work.side_effect = [nullcontext(uow), nullcontext(uow)]
+    dao.save_form_answers.side_effect = [
+        SimpleNamespace(status=APIStatus.JOB_FORM_ANSWERS_SAVED),
+        SimpleNamespace(status=APIStatus.ERROR),
+    ]
+    engine = MagicMock()
+    engine.answer_many_async = AsyncMock(return_value=[
+        FormAnswers(answers_by_field_id={"answer_text_1": "B2"}, raw={}),
+        FormAnswers(answers_by_field_id={"answer_text_1": "C1"}, raw={}),
+    ])
+    claims = [SimpleNamespace(id=1, external_id=10), SimpleNamespace(id=2, external_id=20)]
+
+    process_jobs_form_answers(dao, engine, "My CV", claims)
+
+    assert dao.save_form_answers.call_count == 2
+    dao.update_job_status.assert_called_once_with(external_id=20, new_status=JobStatus.ANALYZING_FORM_FIELDS_FAILED)
+    engine.learn_answers.assert_called_once_with(form_fields, engine.answer_many_async.return_value[0])
+
+
+def test_process_jobs_form_answers_marks_claims_failed_when_load_fails(mocker):
+    dao = MagicMock()
+    dao.unit_of_work.return_value.__enter__.side_effect = OperationalError("stmt", {}, Exception("db down"))
+    engine = MagicMock()
+    claims = [SimpleNamespace(id=1, external_id=10), SimpleNamespace(id=2, external_id=20)]
+
+    process_jobs_form_answers(dao, engine, "My CV", claims)
+
+    assert [call.kwargs for call in dao.update_job_status.call_args_list] == [
+        {"external_id": 10, "new_status": JobStatus.ANALYZING_FORM_FIELDS_FAILED},
+        {"external_id": 20, "new_status": JobStatus.ANALYZING_FORM_FIELDS_FAILED},
+    ]
+    engine.answer_many_async.assert_not_called()
+    engine.answer_batch_async.assert_not_called()
@@ -0,0 +1,75 @@
+import pytest
+from types import SimpleNamespace
+
+from app.services.answer_index import AnswerIndex, normalize_question, field_signature
+from app.core.enums import FormFieldType
+
+
+def make_field(question, answer_type=FormFieldType.TEXT, answer_options=None, external_field_id="field"):
+    return SimpleNamespace(
+        external_field_id=external_field_id,
+        question=question,
+        answer_type=answer_type,
+        answer_options=answer_options,
+    )
+
+
+YES_NO = [{"text": "Yes", "value": "1"}, {"text": "No", "value": "0"}]
+
+
+@pytest.fixture
+def index():
+    return AnswerIndex(min_support=2, min_confidence=0.75, max_answer_length=20)
+
+
+def test_normalize_question():
+    assert normalize_question("  What is your English LEVEL?? ") == "what is your english level"
+    assert normalize_question(None) == ""
+
+
+def test_field_signature_depends_on_type_and_options():
+    radio = make_field("FastAPI experience?", FormFieldType.RADIO, YES_NO)
+    reordered = make_field("fastapi experience", FormFieldType.RADIO, list(reversed(YES_NO)))
+    other_values = make_field("FastAPI experience?", FormFieldType.RADIO, [{"text": "Yes", "value": "y"}])
+    text = make_field("FastAPI experience?")
+
+    assert field_signature(radio) == field_signature(reordered)
+    assert field_signature(radio) != field_signature(other_values)
+    assert field_signature(radio) != field_signature(text)
+
+
+def test_lookup_requires_support_and_confidence(index):
+    field = make_field("English level?")
+
+    index.add(field, "B2")
+    assert index.lookup(field) is None
+
+    index.add(make_field("english level"), "B2")
+    assert index.lookup(field) == "B2"
+
+    index.add(field, "C1")
+    assert index.lookup(field) is None
+
+    index.add(field, "B2")
+    assert index.lookup(field) == "B2"
+
+
+def test_long_answers_not_indexed(index):
+    field = make_field("Cover letter")
+
+    index.add(field, "Dear hiring manager, I am writing to apply")
+    index.add(field, "Dear hiring manager, I am writing to apply")
+
+    assert index.lookup(field) is None
+    assert len(index) == 0
+
+
+def test_split(index):
+    known = make_field("English level?", external_field_id="answer_text_1")
+    unknown = make_field("Expected salary?", external_field_id="answer_number_2")
+    index.add_many([known, known], {"answer_text_1": "B2"})
+
+    reused, unmatched = index.split([known, unknown])
+
+    assert reused == {"answer_text_1": "B2"}
+    assert unmatched == [unknown]
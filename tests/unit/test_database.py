@@ -0,0 +1,31 @@
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core import database
+from app.core.database import create_db_engine
+
+
+def test_create_db_engine_bounds_pool(tmp_path, mocker):
+    mocker.patch.object(database.settings, "db_pool_size", 3)
+    mocker.patch.object(database.settings, "db_max_overflow", 2)
+    mocker.patch.object(database.settings, "db_pool_recycle_seconds", 600)
+
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'db.sqlite3'}", pgbouncer=False)
+
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._recycle == 600
+
+
+def test_create_db_engine_pgbouncer_mode_does_not_pool(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'db.sqlite3'}", pgbouncer=True)
+
+    assert isinstance(engine.pool, NullPool)
+
+
+def test_reset_engine_pool_replaces_inherited_pool(mocker):
+    engine = mocker.patch.object(database, "engine")
+
+    database.reset_engine_pool()
+
+    engine.dispose.assert_called_once_with(close=False)
@@ -0,0 +1,108 @@
+import pytest
+from unittest.mock import MagicMock
+from selenium.common.exceptions import WebDriverException
+
+from app.services.driver_pool import DriverPool
+
+
+@pytest.fixture
+def pool(mocker):
+    """Fixture for DriverPool whose drivers are mocks instead of real Chrome sessions."""
+    def launch():
+        driver = MagicMock()
+        driver.page_loads = 0
+        return driver
+
+    mocker.patch.object(DriverPool, '_launch', side_effect=launch)
+    mocker.patch.object(DriverPool, '_discard')
+    return DriverPool(size=2, max_page_loads=3)
+
+
+def test_lease_returns_driver_to_pool(pool):
+    with pool.lease() as driver:
+        assert pool._idle.qsize() == 1
+
+    assert pool._idle.qsize() == 2
+    pool._discard.assert_not_called()
+
+
+def test_driver_recycled_after_max_page_loads(pool):
+    with pool.lease() as driver:
+        driver.page_loads = 3
+
+    pool._discard.assert_called_once_with(driver)
+    assert pool._launch.call_count == 3
+    assert pool._idle.qsize() == 2
+
+
+def test_unhealthy_driver_replaced_on_acquire(pool):
+    unhealthy = pool._idle.queue[0]
+    unhealthy.execute_script.side_effect = WebDriverException("dead")
+
+    with pool.lease() as driver:
+        assert driver is not unhealthy
+
+    pool._discard.assert_called_once_with(unhealthy)
+
+
+def test_failed_relaunch_on_recycle_keeps_slot(pool):
+    launch = pool._launch.side_effect
+    pool._launch.side_effect = WebDriverException("no chrome")
+
+    with pool.lease() as driver:
+        driver.page_loads = 3
+
+    pool._discard.assert_called_once_with(driver)
+    assert pool._idle.qsize() == 2
+
+    # the empty slot is launched again on its next acquire
+    pool._launch.side_effect = launch
+    with pool.lease_many(2) as drivers:
+        assert None not in drivers
+    assert pool._launch.call_count == 4
+
+
+def test_failed_relaunch_on_acquire_keeps_slot(pool):
+    pool._idle.queue[0].execute_script.side_effect = WebDriverException("dead")
+    pool._launch.side_effect = WebDriverException("no chrome")
+
+    with pytest.raises(WebDriverException):
+        pool.acquire(timeout=0)
+    assert pool._idle.qsize() == 2
+
+    with pool.lease() as healthy:
+        with pytest.raises(WebDriverException):
+            pool.acquire(timeout=0)
+        assert pool._idle.qsize() == 1
+    assert pool._idle.qsize() == 2
+
+
+def test_lease_many(pool):
+    with pool.lease_many(2) as drivers:
+        assert len(drivers) == 2
+        assert pool._idle.qsize() == 0
+
+    assert pool._idle.qsize() == 2
+
+
+def test_failed_warmup_quits_started_drivers(mocker):
+    started = MagicMock()
+    mocker.patch.object(DriverPool, '_launch', side_effect=[started, WebDriverException("no chrome")])
+    discard = mocker.patch.object(DriverPool, '_discard')
+
+    with pytest.raises(WebDriverException):
+        DriverPool(size=3)
+
+    discard.assert_called_once_with(started)
+
+
+def test_failed_launch_removes_profile_copy(mocker, tmp_path):
+    profile_copy = tmp_path / "profile-copy"
+    profile_copy.mkdir()
+    mocker.patch.object(DriverPool, '_copy_profile', return_value=str(profile_copy))
+    mocker.patch('app.services.driver_pool.PooledChrome', side_effect=WebDriverException("no chrome"))
+
+    with pytest.raises(WebDriverException):
+        DriverPool(size=1)
+
+    assert not profile_copy.exists()
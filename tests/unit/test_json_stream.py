@@ -0,0 +1,46 @@
+import pytest
+
+from app.services.json_stream import StreamingAnswerParser, repair_json
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('```json\n{"answers": {"a": "1"}}\n```', {"answers": {"a": "1"}}),
+    ('{"answers": {"a": "1", "b": "x, y",},}', {"answers": {"a": "1", "b": "x, y"}}),
+    ('Sure! Here you go: {"answers": {"a": "1"}} Good luck.', {"answers": {"a": "1"}}),
+    ('{"answers": {"a": ', None),
+])
+def test_repair_json(text, expected):
+    assert repair_json(text) == expected
+
+
+def test_streaming_parser_collects_answers_as_they_complete():
+    parser = StreamingAnswerParser()
+
+    parser.feed('{"answers": {"answer_text_1": "I have five ye')
+    assert parser.answers == {}
+    parser.feed('ars of Python", "answer_number_2": 1')
+    assert parser.answers == {"answer_text_1": "I have five years of Python"}
+    parser.feed('2}}')
+    assert parser.salvage() == {
+        "answers": {"answer_text_1": "I have five years of Python", "answer_number_2": "12"}, "partial": True
+    }
+
+
+def test_streaming_parser_collects_completed_batch_jobs():
+    parser = StreamingAnswerParser()
+
+    parser.feed('{"jobs": {"job_1": {"answers": {"a": "B2"}}, ')
+    parser.feed('"job_2": {"answers": {"a": "C1", "b": "A cover letter that got cu')
+
+    assert parser.jobs == {"job_1": {"answers": {"a": "B2"}}}
+    assert parser.answers == {}
+    assert parser.salvage() == {"jobs": {"job_1": {"answers": {"a": "B2"}}}, "partial": True}
+
+
+def test_streaming_parser_ignores_text_before_answers():
+    parser = StreamingAnswerParser()
+
+    parser.feed('```json\n{"answers"')
+    parser.feed(': {"a": "B2", "b": null, "c": "1"')
+
+    assert parser.answers == {"a": "B2"}
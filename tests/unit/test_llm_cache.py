@@ -0,0 +1,103 @@
+import pytest
+import sqlite3
+from unittest.mock import MagicMock
+
+from app.services import llm_cache
+from app.services.llm_cache import ResponseCache, SQLiteCacheBackend
+from app.services.analyze import GenAIClient
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controllable wall clock for cache expiry and LRU ordering."""
+    now = {"value": 1000.0}
+    mocker.patch.object(llm_cache.time, 'time', side_effect=lambda: now["value"])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(SQLiteCacheBackend(path=str(tmp_path / "llm_cache.sqlite3"), max_entries=2), ttl_seconds=60)
+
+
+def test_make_key_normalizes_whitespace(cache):
+    assert cache.make_key("m", "a  prompt\n\nwith   spaces ") == cache.make_key("m", "a prompt with spaces")
+    assert cache.make_key("m", "prompt") != cache.make_key("other-model", "prompt")
+
+
+def test_get_and_set(cache, clock):
+    assert cache.get("m", "prompt") is None
+
+    cache.set("m", "prompt", {"answers": {"a": "1"}})
+
+    assert cache.get("m", "prompt") == {"answers": {"a": "1"}}
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set("m", "prompt", {"answers": {}})
+
+    clock["value"] += 61
+
+    assert cache.get("m", "prompt") is None
+
+
+def test_least_recently_used_entries_evicted(cache, clock):
+    cache.set("m", "first", {"n": 1})
+    clock["value"] += 1
+    cache.set("m", "second", {"n": 2})
+    clock["value"] += 1
+    cache.get("m", "first")
+    clock["value"] += 1
+    cache.set("m", "third", {"n": 3})
+
+    assert cache.get("m", "first") == {"n": 1}
+    assert cache.get("m", "second") is None
+    assert cache.get("m", "third") == {"n": 3}
+
+
+def test_generate_json_uses_cache(cache, mocker):
+    mocker.patch('app.services.analyze.genai.Client')
+    client = GenAIClient(cache=cache)
+    client.client.models.generate_content.return_value = MagicMock(text='{"answers": {"a": "1"}}')
+
+    first = client.generate_json("prompt", model="m")
+    second = client.generate_json("prompt", model="m")
+
+    assert first == second == {"answers": {"a": "1"}}
+    client.client.models.generate_content.assert_called_once()
+
+
+def test_generate_json_does_not_cache_invalid_json(cache, mocker):
+    mocker.patch('app.services.analyze.genai.Client')
+    client = GenAIClient(cache=cache)
+    client.logger = MagicMock()
+    client.client.models.generate_content.return_value = MagicMock(text="not json")
+
+    client.generate_json("prompt", model="m")
+    client.generate_json("prompt", model="m")
+
+    assert client.client.models.generate_content.call_count == 2
+
+
+def test_sqlite_cache_uses_wal(tmp_path):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "llm_cache.sqlite3"))
+
+    assert backend._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_locked_sqlite_cache_degrades_to_miss(tmp_path, clock):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    cache = ResponseCache(SQLiteCacheBackend(path=path, busy_timeout_seconds=0), ttl_seconds=60)
+    cache.set("m", "prompt", {"answers": {}})
+    # another worker process holding the write lock
+    other = sqlite3.connect(path)
+    other.execute("BEGIN EXCLUSIVE")
+
+    try:
+        cache.set("m", "other prompt", {"answers": {}})
+        assert cache.get("m", "prompt") == {"answers": {}}
+    finally:
+        other.rollback()
+        other.close()
+
+    assert cache.get("m", "other prompt") is None
@@ -0,0 +1,77 @@
+import asyncio
+import json
+import pytest
+from google.genai import errors
+
+from app.core.rate_limit import RateLimiter
+from app.scripts.benchmark_analysis import build_synthetic_jobs, percentile, run_benchmark
+from app.services.analyze import AsyncGenAIClient, PromptFactory
+from app.services.mock_llm import MockGenAIBackend
+
+
+@pytest.fixture
+def jobs():
+    return build_synthetic_jobs(2, fields_per_job=2)
+
+
+def test_mock_backend_answers_every_field(jobs):
+    backend = MockGenAIBackend(latency_seconds=0, latency_jitter_seconds=0)
+    job_details, form_fields = jobs[0]
+    prompt = PromptFactory().build_form_answer_prompt("My CV", job_details, form_fields)
+
+    response = backend.models.generate_content(model="m", contents=prompt)
+
+    assert json.loads(response.text) == {"answers": {
+        "answer_text_0_0": "mock answer answer_text_0_0",
+        "answer_text_0_1": "mock answer answer_text_0_1",
+    }}
+    assert backend.calls[0].jobs == 1
+    assert backend.calls[0].input_tokens > 0
+
+
+def test_mock_backend_answers_batches_per_job_key(jobs):
+    backend = MockGenAIBackend(latency_seconds=0, latency_jitter_seconds=0)
+    prompt = PromptFactory().build_batch_form_answer_prompt("My CV", jobs)
+
+    response = json.loads(backend.models.generate_content(model="m", contents=prompt).text)
+
+    assert sorted(response["jobs"]) == ["job_1", "job_2"]
+    assert list(response["jobs"]["job_2"]["answers"]) == ["answer_text_1_0", "answer_text_1_1"]
+    assert backend.calls[0].jobs == 2
+
+
+def test_mock_backend_injects_errors():
+    client = AsyncGenAIClient(
+        max_retries=0,
+        rate_limiter=RateLimiter(100_000, 100_000_000),
+        client=MockGenAIBackend(latency_seconds=0, latency_jitter_seconds=0, error_rate=1.0),
+    )
+
+    with pytest.raises(errors.APIError):
+        asyncio.run(client.generate_json_async("prompt"))
+
+
+def test_percentile():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 0.5) == 2.0
+    assert percentile(list(range(1, 101)), 0.99) == 99
+
+
+def test_run_benchmark_reports_throughput():
+    single = run_benchmark(job_count=6, latency_seconds=0, latency_jitter_seconds=0)
+    batched = run_benchmark(job_count=6, batch_size=3, latency_seconds=0, latency_jitter_seconds=0)
+
+    assert single["jobs"] == batched["jobs"] == 6
+    assert single["failed_jobs"] == batched["failed_jobs"] == 0
+    assert single["requests"] == 6
+    assert batched["requests"] == 2
+    assert batched["input_tokens_per_job"] < single["input_tokens_per_job"]
+    assert single["jobs_per_second"] > 0
+
+
+def test_run_benchmark_latency_excludes_queueing():
+    report = run_benchmark(job_count=4, max_concurrency=1, latency_seconds=0.05, latency_jitter_seconds=0)
+
+    # four sequential calls take 0.2s in total, each of them only 0.05s
+    assert report["elapsed_seconds"] >= 0.2
+    assert report["p99_latency_seconds"] < 0.1
@@ -0,0 +1,86 @@
+import pytest
+from pathlib import Path
+
+from app.services.parse import parse_job_details, parse_job_form_fields, inner_text
+from app.core.enums import ScrapeError, FormFieldType
+from lxml import html as lxml_html
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+@pytest.fixture
+def job_page_source():
+    """Archived Djinni job page with details and an apply form."""
+    return (FIXTURES_DIR / "djinni_job_page.html").read_text()
+
+
+def test_parse_job_details(job_page_source):
+    result = parse_job_details(job_page_source, 999, "http://link")
+
+    assert result == {
+        "external_id": 999,
+        "title": "Senior Python Developer",
+        "company": "Acme Corp",
+        "description": "We are looking for a Python engineer.\nFastAPI\nPostgreSQL",
+        "link": "http://link",
+    }
+
+
+def test_parse_job_details_missing_elements():
+    result = parse_job_details("<html><body><h1>Nothing here</h1></body></html>", 999, "http://link")
+
+    assert result == {
+        "external_id": 999,
+        "link": "http://link",
+        "error": ScrapeError.MISSING_ELEMENT,
+    }
+
+
+def test_parse_job_form_fields(job_page_source):
+    result = parse_job_form_fields(job_page_source, 999, "http://link")
+
+    assert result == [
+        {
+            "external_field_id": "answer_text_1",
+            "question": "Cover letter",
+            "answer_type": FormFieldType.TEXT,
+            "answer_options": None,
+        },
+        {
+            "external_field_id": "answer_boolean_3",
+            "question": "Do you have FastAPI experience?",
+            "answer_type": FormFieldType.RADIO,
+            "answer_options": [{"text": "Yes", "value": "1"}, {"text": "No", "value": "0"}],
+        },
+        {
+            "external_field_id": "answer_number_2",
+            "question": "Years of experience",
+            "answer_type": FormFieldType.NUMBER,
+            "answer_options": None,
+        },
+    ]
+
+
+def test_parse_job_form_fields_missing_form():
+    result = parse_job_form_fields("<html><body></body></html>", 999, "http://link")
+
+    assert result == [{
+        "external_id": 999,
+        "link": "http://link",
+        "error": ScrapeError.MISSING_ELEMENT,
+    }]
+
+
+@pytest.mark.parametrize(
+    "markup, expected",
+    [
+        ("<div>  a \n  b </div>", "a b"),
+        ("<div><p>first</p><p>second</p></div>", "first\nsecond"),
+        ("<div>line<br>break</div>", "line\nbreak"),
+        ("<div><style>.x {}</style>text</div>", "text"),
+        ("<div>   </div>", None),
+    ]
+)
+def test_inner_text(markup, expected):
+    assert inner_text(lxml_html.fragment_fromstring(markup)) == expected
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import rate_limit
+from app.core.rate_limit import TokenBucket, RateLimiter
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controllable monotonic clock for the token buckets."""
+    now = {"value": 1000.0}
+    mocker.patch.object(rate_limit.time, 'monotonic', side_effect=lambda: now["value"])
+    return now
+
+
+def test_token_bucket_reserve_and_refill(clock):
+    bucket = TokenBucket(capacity=10, refill_per_second=1)
+
+    assert bucket.reserve(10) == 0.0
+    assert bucket.reserve(2) == pytest.approx(2.0)
+
+    clock["value"] += 4
+    assert bucket.reserve(1) == 0.0
+    assert bucket.tokens == pytest.approx(1.0)
+
+
+def test_token_bucket_caps_oversized_requests(clock):
+    bucket = TokenBucket(capacity=5, refill_per_second=1)
+
+    assert bucket.reserve(50) == 0.0
+    assert bucket.tokens == 0
+
+
+def test_rate_limiter_waits_for_slowest_bucket(clock, mocker):
+    sleep = mocker.patch.object(rate_limit.asyncio, 'sleep', new=mocker.AsyncMock())
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+
+    asyncio.run(limiter.acquire(600))
+    sleep.assert_not_called()
+
+    asyncio.run(limiter.acquire(100))
+    sleep.assert_awaited_once()
+    assert sleep.await_args.args[0] == pytest.approx(10.0)
+
+
+def test_rate_limiter_splits_quota_without_shared_bucket(clock):
+    limiter = RateLimiter(requests_per_minute=80, tokens_per_minute=8000, local_share=8)
+
+    assert limiter.requests.capacity == 10
+    assert limiter.tokens.refill_per_second == pytest.approx(1000 / 60)
+
+
+def test_redis_bucket_uses_shared_script(clock):
+    client = MagicMock()
+    script = client.register_script.return_value
+    script.return_value = b"2.5"
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, client=client, local_share=4)
+
+    assert limiter.tokens.reserve(100) == 2.5
+    assert script.call_args.kwargs == {"keys": ["jobai:ratelimit:tokens"], "args": [600, 10.0, 100]}
+
+
+def test_shared_rate_limiter_reserves_off_the_event_loop(clock, mocker):
+    sleep = mocker.patch.object(rate_limit.asyncio, 'sleep', new=mocker.AsyncMock())
+    client = MagicMock()
+    script_threads = []
+    client.register_script.return_value.side_effect = lambda keys, args: script_threads.append(
+        threading.get_ident()
+    ) or b"1.5"
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, client=client)
+
+    asyncio.run(limiter.acquire(100))
+
+    assert len(script_threads) == 2
+    assert threading.get_ident() not in script_threads
+    sleep.assert_awaited_once_with(1.5)
+
+
+def test_redis_bucket_falls_back_to_local_share(clock):
+    client = MagicMock()
+    client.register_script.return_value.side_effect = RedisConnectionError("down")
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, client=client, local_share=4)
+
+    assert limiter.tokens.reserve(150) == 0.0
+    assert limiter.tokens.reserve(60) == pytest.approx(24.0)
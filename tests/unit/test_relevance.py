@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.core.decorators import DAOError
+from app.core.enums import APIError
+from app.services.relevance import PREFILTER_STATUSES, CorpusStatsCache, RelevanceScorer, prefilter_jobs, tokenize
+
+
+CV_TEXT = "Python developer with five years of Django, FastAPI, PostgreSQL and Celery experience."
+
+
+def test_tokenize_keeps_tech_terms():
+    assert tokenize("The C# and C++ developer, with Node.js") == ["c#", "c++", "developer", "node", "js"]
+
+
+def test_score_many_ranks_matching_jobs_higher():
+    scores = RelevanceScorer(CV_TEXT).score_many([
+        ("Senior Python Developer", "Build FastAPI services backed by PostgreSQL and Celery."),
+        ("Sales Manager", "Grow the client base and negotiate contracts."),
+        ("", ""),
+    ])
+
+    assert scores[0] > 0.2
+    assert scores[1] == 0.0
+    assert scores[2] == 0.0
+
+
+def test_fitted_score_does_not_depend_on_batch():
+    corpus = [
+        ("Senior Python Developer", "Build FastAPI services backed by PostgreSQL and Celery."),
+        ("Python Developer", "Django and Celery."),
+        ("Sales Manager", "Grow the client base and negotiate contracts."),
+    ]
+    scorer = RelevanceScorer(CV_TEXT).fit(corpus)
+
+    alone = scorer.score_many(corpus[:1])
+    together = scorer.score_many(corpus)
+
+    assert alone[0] == together[0]
+
+
+def test_prefilter_jobs_rejects_below_threshold():
+    dao = MagicMock()
+    dao.get_unscored_job_details.return_value = [
+        SimpleNamespace(id=1, title="Python Developer", description="Django and Celery."),
+        SimpleNamespace(id=2, title="Sales Manager", description="Negotiate contracts."),
+    ]
+    dao.get_job_texts.return_value = [
+        ("Python Developer", "Django and Celery."),
+        ("Sales Manager", "Negotiate contracts."),
+        ("Java Developer", "Spring and Kafka."),
+    ]
+    dao.save_relevance_scores.return_value = [SimpleNamespace(id=2, external_id=20)]
+
+    assert prefilter_jobs(dao, CV_TEXT, min_score=0.05, stats_cache=CorpusStatsCache()) == 1
+
+    scores = dao.save_relevance_scores.call_args.args[0]
+    assert scores[1] > 0.05 > scores[2]
+    assert dao.save_relevance_scores.call_args.kwargs == {"reject_below": 0.05, "statuses": PREFILTER_STATUSES}
+
+
+def test_prefilter_jobs_skips_when_nothing_to_score():
+    dao = MagicMock()
+    dao.get_unscored_job_details.return_value = []
+
+    assert prefilter_jobs(dao, CV_TEXT) == 0
+    dao.save_relevance_scores.assert_not_called()
+
+
+def test_prefilter_jobs_skips_when_corpus_fails_to_load():
+    dao = MagicMock()
+    dao.get_unscored_job_details.return_value = [SimpleNamespace(id=1, title="Python Developer", description="")]
+    dao.get_job_texts.side_effect = DAOError(APIError.DB, "get_job_texts: db down")
+
+    assert prefilter_jobs(dao, CV_TEXT, stats_cache=CorpusStatsCache()) == 0
+    dao.save_relevance_scores.assert_not_called()
+
+
+def test_prefilter_jobs_skips_when_unscored_jobs_fail_to_load():
+    dao = MagicMock()
+    dao.get_unscored_job_details.side_effect = DAOError(APIError.DB, "get_unscored_job_details: db down")
+
+    assert prefilter_jobs(dao, CV_TEXT, stats_cache=CorpusStatsCache()) == 0
+    dao.get_job_texts.assert_not_called()
+
+
+def test_corpus_stats_cache_reloads_after_refresh_interval():
+    now = [0.0]
+    cache = CorpusStatsCache(refresh_seconds=60, clock=lambda: now[0])
+    dao = MagicMock()
+    dao.get_job_texts.return_value = [("Python Developer", "Django and Celery."), ("Sales Manager", "")]
+
+    document_frequency, documents = cache.get(dao)
+    now[0] = 30.0
+    cache.get(dao)
+
+    assert documents == 2
+    assert document_frequency["python"] == 1
+    assert dao.get_job_texts.call_count == 1
+
+    now[0] = 61.0
+    dao.get_job_texts.return_value = []
+    assert cache.get(dao) == (document_frequency, 2)
+    assert dao.get_job_texts.call_count == 2
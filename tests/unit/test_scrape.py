@@ -2,8 +2,11 @@ import pytest
 from unittest.mock import MagicMock
 from selenium.common.exceptions import TimeoutException
 
-from app.services.scrape import ScrapeJobStub, ScrapeJobDetails
-from app.core.enums import ScrapeError
+from app.services.scrape import (
+    ScrapeJobStub, ScrapeJobDetails, ScrapeFormField, ScrapeJobPage, FORM_SNAPSHOT_SCRIPT, process_job_page,
+    save_crawled_stubs
+)
+from app.core.enums import ScrapeError, FormFieldType, JobStatus, ParseBackend
 from app.core.config import settings
 
 
@@ -59,6 +62,21 @@ def details_scraper(mocker, mock_driver):
     return scraper
 
 
+@pytest.fixture
+def form_scraper(mocker, mock_driver):
+    """Fixture for ScrapeFormField with mocked driver and methods."""
+    mock_wait_cls = mocker.patch('app.services.scrape.WebDriverWait')
+    mock_wait_instance = MagicMock()
+    mock_wait_cls.return_value = mock_wait_instance
+
+    scraper = ScrapeFormField(driver=mock_driver)
+    scraper.logger = MagicMock()
+
+    mocker.patch.object(scraper, 'open')
+
+    return scraper
+
+
 @pytest.mark.parametrize(
     "job_items, expected, log_count",
     [
@@ -124,6 +142,59 @@ def test_iter_job_ids(stub_scraper, mocker, total_pages, job_ids_from_page, expe
 
 
 
+@pytest.mark.parametrize(
+    "total_pages, expected",
+    [
+        (1, [101, 202]),
+        (3, [101, 202, 303, 404, 505]),
+    ]
+)
+def test_iter_job_ids_parallel(stub_scraper, mocker, total_pages, expected):
+    pages = {
+        "http://url?page=2": [303, 404],
+        "http://url?page=3": [505],
+    }
+    mocker.patch.object(stub_scraper, 'get_total_pages', return_value=total_pages)
+    mocker.patch.object(stub_scraper, '_read_job_ids', return_value=[101, 202])
+    mock_get_ids = mocker.patch.object(ScrapeJobStub, 'get_external_job_ids', side_effect=lambda url: pages[url])
+
+    result = list(stub_scraper.iter_job_ids("http://url", drivers=[MagicMock(), MagicMock()]))
+
+    assert result[:2] == [101, 202]
+    assert sorted(result) == expected
+    stub_scraper.get_total_pages.assert_called_once_with("http://url")
+    assert mock_get_ids.call_count == total_pages - 1
+
+
+@pytest.mark.parametrize(
+    "pages, stop_after, expected, pages_loaded",
+    [
+        # stops after two consecutive pages of known ids
+        ([[1, 2], [3, 4], [5], [6], [7]], 2, [1, 2], 3),
+        # a page with a new id resets the counter
+        ([[1], [3], [4, 10], [5], [6], [7]], 2, [1, 10], 5),
+        # empty pages neither count as known nor reset
+        ([[3], [], [4], [5]], 2, [], 3),
+        ([[1], [2]], 5, [1, 2], 2),
+    ]
+)
+def test_iter_job_ids_incremental(stub_scraper, mocker, pages, stop_after, expected, pages_loaded):
+    unseen = {1, 2, 10}
+    mocker.patch.object(stub_scraper, 'get_total_pages', return_value=len(pages))
+    mocker.patch.object(stub_scraper, '_read_job_ids', return_value=pages[0])
+    mocker.patch.object(stub_scraper, 'get_external_job_ids', side_effect=pages[1:])
+
+    result = list(stub_scraper.iter_job_ids(
+        "http://url",
+        filter_unseen=lambda ids: [i for i in ids if i in unseen],
+        stop_after_known_pages=stop_after,
+    ))
+
+    assert result == expected
+    stub_scraper._read_job_ids.assert_called_once()
+    assert stub_scraper.get_external_job_ids.call_count == pages_loaded - 1
+
+
 def test_scrape_job_details_success(details_scraper):
     external_id = 999
     link = f"{settings.djinni_base_url}/jobs/{external_id}"
@@ -171,3 +242,212 @@ def test_scrape_job_details_failure_timeout(details_scraper):
     }
     assert result == expected_result
     details_scraper.wait.until.assert_called_once()
+
+
+def test_scrape_job_details_html_backend(details_scraper):
+    external_id = 999
+    link = f"{settings.djinni_base_url}/jobs/{external_id}"
+
+    details_scraper.parse_backend = ParseBackend.HTML
+    details_scraper.driver.page_source = (
+        '<h1 class="d-flex align-items-center flex-wrap"><span>Senior Python Developer</span></h1>'
+        '<a class="text-reset" href="/jobs/company-acme/">Acme Corp</a>'
+        '<div class="job-post__description">This is a detailed job description.</div>'
+    )
+
+    result = details_scraper.scrape_job_details(external_id)
+
+    details_scraper.open.assert_called_once_with(link)
+    details_scraper.wait.until.assert_called_once()
+    assert result == {
+        "external_id": external_id,
+        "title": "Senior Python Developer",
+        "company": "Acme Corp",
+        "description": "This is a detailed job description.",
+        "link": link,
+    }
+
+FORM_SNAPSHOT = [
+    {
+        "textareas": [{"id": "answer_text_1", "label": "Cover letter"}],
+        "has_radio": False,
+        "radio_groups": [],
+        "numbers": [],
+    },
+    {
+        "textareas": [],
+        "has_radio": True,
+        "radio_groups": [
+            {
+                "id": "answer_boolean_3",
+                "question": "Do you have FastAPI experience?",
+                "options": [{"text": "Yes", "value": "1"}, {"text": "No", "value": "0"}],
+            },
+            {"id": "orphan_label", "question": "No radios here", "options": []},
+        ],
+        "numbers": [],
+    },
+    {
+        "textareas": [],
+        "has_radio": False,
+        "radio_groups": [],
+        "numbers": [{"id": "answer_number_2", "label": "Years of experience"}, {"id": None, "label": None}],
+    },
+    {"textareas": [], "has_radio": False, "radio_groups": [], "numbers": []},
+]
+
+
+def test_scrape_job_form_field_success(form_scraper):
+    external_id = 777
+    link = f"{settings.djinni_base_url}/jobs/{external_id}"
+    mock_form = MagicMock()
+
+    form_scraper.wait.until.return_value = mock_form
+    form_scraper.driver.execute_script.return_value = FORM_SNAPSHOT
+
+    result = form_scraper.scrape_job_form_field(external_id)
+
+    form_scraper.open.assert_called_once_with(link)
+    form_scraper.driver.execute_script.assert_called_once_with(FORM_SNAPSHOT_SCRIPT, mock_form)
+    assert result == [
+        {
+            "external_field_id": "answer_text_1",
+            "question": "Cover letter",
+            "answer_type": FormFieldType.TEXT,
+            "answer_options": None,
+        },
+        {
+            "external_field_id": "answer_boolean_3",
+            "question": "Do you have FastAPI experience?",
+            "answer_type": FormFieldType.RADIO,
+            "answer_options": [{"text": "Yes", "value": "1"}, {"text": "No", "value": "0"}],
+        },
+        {
+            "external_field_id": "answer_number_2",
+            "question": "Years of experience",
+            "answer_type": FormFieldType.NUMBER,
+            "answer_options": None,
+        },
+    ]
+
+
+def test_scrape_job_form_field_failure_timeout(form_scraper):
+    external_id = 666
+    link = f"{settings.djinni_base_url}/jobs/{external_id}"
+
+    form_scraper.wait.until.side_effect = TimeoutException("Mock timeout")
+
+    result = form_scraper.scrape_job_form_field(external_id)
+
+    assert result == [{
+        "external_id": external_id,
+        "link": link,
+        "error": ScrapeError.TIMEOUT,
+    }]
+    form_scraper.driver.execute_script.assert_not_called()
+
+
+@pytest.fixture
+def page_scraper(mocker, mock_driver):
+    """Fixture for ScrapeJobPage with mocked driver and methods."""
+    mock_wait_cls = mocker.patch('app.services.scrape.WebDriverWait')
+    mock_wait_instance = MagicMock()
+    mock_wait_cls.return_value = mock_wait_instance
+
+    scraper = ScrapeJobPage(driver=mock_driver)
+    scraper.logger = MagicMock()
+
+    mocker.patch.object(scraper, 'open')
+
+    return scraper
+
+
+def test_scrape_job_page_single_visit(page_scraper, mocker):
+    external_id = 555
+    link = f"{settings.djinni_base_url}/jobs/{external_id}"
+    details = {"external_id": external_id, "title": "t", "company": "c", "description": "d", "link": link}
+    fields = [{"external_field_id": "answer_text_1", "question": "q", "answer_type": FormFieldType.TEXT, "answer_options": None}]
+
+    mocker.patch.object(page_scraper, '_extract_job_details', return_value=details)
+    mocker.patch.object(page_scraper, '_extract_job_form_fields', return_value=fields)
+
+    result = page_scraper.scrape_job_page(external_id)
+
+    page_scraper.open.assert_called_once_with(link)
+    assert result == {"details": details, "form_fields": fields}
+
+
+def test_scrape_job_page_skips_form_on_details_error(page_scraper, mocker):
+    external_id = 555
+    link = f"{settings.djinni_base_url}/jobs/{external_id}"
+    details = {"external_id": external_id, "link": link, "error": ScrapeError.TIMEOUT}
+
+    mocker.patch.object(page_scraper, '_extract_job_details', return_value=details)
+    mocker.patch.object(page_scraper, '_extract_job_form_fields')
+
+    result = page_scraper.scrape_job_page(external_id)
+
+    assert result == {"details": details, "form_fields": []}
+    page_scraper._extract_job_form_fields.assert_not_called()
+
+
+def test_scrape_job_page_reads_through_archive(page_scraper, mocker):
+    external_id = 555
+    page_scraper.archive = MagicMock()
+    page_scraper.archive.get_latest_page.return_value = (
+        '<h1 class="d-flex align-items-center flex-wrap"><span>Senior Python Developer</span></h1>'
+        '<a class="text-reset" href="/jobs/company-acme/">Acme Corp</a>'
+        '<div class="job-post__description">Description</div>'
+        '<form id="apply_form"></form>'
+    )
+
+    result = page_scraper.scrape_job_page(external_id)
+
+    page_scraper.open.assert_not_called()
+    page_scraper.archive.save_page.assert_not_called()
+    assert result["details"]["title"] == "Senior Python Developer"
+    assert result["form_fields"] == []
+
+
+def test_scrape_job_page_archives_fetched_page(page_scraper, mocker):
+    external_id = 555
+    page_scraper.archive = MagicMock()
+    page_scraper.archive.get_latest_page.return_value = None
+    page_scraper.driver.page_source = "<html></html>"
+
+    mocker.patch.object(page_scraper, '_extract_job_details', return_value={"external_id": external_id})
+    mocker.patch.object(page_scraper, '_extract_job_form_fields', return_value=[])
+
+    page_scraper.scrape_job_page(external_id)
+
+    page_scraper.open.assert_called_once()
+    page_scraper.archive.save_page.assert_called_once_with(external_id=external_id, page_source="<html></html>")
+
+
+def test_save_crawled_stubs_keeps_chunks_saved_before_crawl_error():
+    def crawl():
+        yield from (1, 2, 3)
+        raise TimeoutException("dashboard page timed out")
+
+    dao = MagicMock()
+    dao.save_job_stubs_bulk.side_effect = lambda chunk, chunk_size: [
+        MagicMock(external_id=stub.external_id) for stub in chunk
+    ]
+
+    results = save_crawled_stubs(dao, crawl(), chunk_size=2)
+
+    assert [result.external_id for result in results] == [1, 2, 3]
+    assert [len(call.args[0]) for call in dao.save_job_stubs_bulk.call_args_list] == [2, 1]
+
+
+@pytest.mark.parametrize("page_data, expected", [
+    ({"details": {"error": ScrapeError.TIMEOUT}, "form_fields": []}, JobStatus.SCRAPING_DETAILS_FAILED),
+    ({"details": {}, "form_fields": [{"error": ScrapeError.TIMEOUT}]}, JobStatus.SCRAPED_DETAILS),
+    ({"details": {}, "form_fields": []}, JobStatus.FORM_FIELDS_SCRAPED),
+])
+def test_process_job_page_reports_next_stage(mocker, page_data, expected):
+    mocker.patch('app.services.scrape.JobDetailsCreate')
+    bot = MagicMock()
+    bot.scrape_job_page.return_value = page_data
+
+    assert process_job_page(MagicMock(), bot, 1) == expected
@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.decorators import DAOError
+from app.repositories.seen_job_cache import SeenJobCache
+from app.core.enums import APIError, JobSource
+
+
+class FakeRedis:
+    def __init__(self):
+        self.sets = {}
+        self.values = {}
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(str(m) for m in members)
+
+    def smismember(self, key, members):
+        stored = self.sets.get(key, set())
+        return [int(str(m) in stored) for m in members]
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def exists(self, key):
+        return int(key in self.values or key in self.sets)
+
+
+@pytest.fixture
+def cache():
+    """SeenJobCache backed by an in-memory fake redis client."""
+    seen_cache = SeenJobCache(client=FakeRedis())
+    seen_cache.logger = MagicMock()
+    return seen_cache
+
+
+def test_warm_loads_ids_from_dao(cache):
+    dao = MagicMock()
+    dao.get_external_ids.return_value = [1, 2, 3]
+
+    assert not cache.is_warm()
+    assert cache.warm(dao) == 3
+    assert cache.is_warm()
+    assert not cache.is_warm(JobSource.LINKED_IN)
+
+    dao.get_external_ids.assert_called_once_with(source=JobSource.DJINNI)
+    assert cache.filter_unseen([1, 4, 3, 5]) == [4, 5]
+
+
+def test_ensure_warm_only_warms_once(cache):
+    dao = MagicMock()
+    dao.get_external_ids.return_value = [1]
+
+    cache.ensure_warm(dao)
+    cache.ensure_warm(dao)
+
+    dao.get_external_ids.assert_called_once()
+
+
+def test_iter_unseen_and_mark_seen(cache):
+    cache.mark_seen([2, 3])
+
+    assert list(cache.iter_unseen(iter([1, 2, 3, 4, 5]), chunk_size=2)) == [1, 4, 5]
+    assert cache.filter_unseen([2], source=JobSource.LINKED_IN) == [2]
+
+
+def test_filter_unseen_falls_back_on_redis_error(cache):
+    cache.client = MagicMock()
+    cache.client.smismember.side_effect = RedisConnectionError("down")
+
+    assert cache.filter_unseen([1, 2]) == [1, 2]
+    cache.logger.warning.assert_called_once()
+
+
+def test_filter_unseen_asks_database_when_cache_is_cold(cache):
+    dao = MagicMock()
+    dao.filter_unseen_external_ids.return_value = [2]
+
+    assert cache.filter_unseen([1, 2], dao=dao) == [2]
+    dao.filter_unseen_external_ids.assert_called_once_with([1, 2], source=JobSource.DJINNI)
+
+
+def test_filter_unseen_asks_database_on_redis_error(cache):
+    cache.client = MagicMock()
+    cache.client.exists.side_effect = RedisConnectionError("down")
+    dao = MagicMock()
+    dao.filter_unseen_external_ids.return_value = [1]
+
+    assert cache.filter_unseen([1, 2], dao=dao) == [1]
+
+
+def test_database_errors_leave_the_cache_cold(cache):
+    dao = MagicMock()
+    dao.get_external_ids.side_effect = DAOError(APIError.DB, "get_external_ids: db down")
+    dao.filter_unseen_external_ids.side_effect = DAOError(APIError.DB, "filter_unseen_external_ids: db down")
+
+    assert cache.warm(dao) == 0
+    assert cache.filter_unseen([1, 2], dao=dao) == [1, 2]
+    assert cache.logger.error.call_count == 2
+
+
+def test_filter_unseen_uses_warm_cache_over_database(cache):
+    warm_dao = MagicMock()
+    warm_dao.get_external_ids.return_value = [1]
+    cache.warm(warm_dao)
+    dao = MagicMock()
+
+    assert cache.filter_unseen([1, 2], dao=dao) == [2]
+    dao.filter_unseen_external_ids.assert_not_called()